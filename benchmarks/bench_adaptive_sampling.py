@@ -0,0 +1,81 @@
+""" Benchmark of the interpolated lines of a plot with evenly spaced samples and with adaptive samples: vertices, visual accuracy, file size and render time """
+import argparse
+import io
+import time
+from typing import Callable, List, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from scipy.interpolate import BSpline, make_interp_spline  # noqa: E402
+
+from pyfrag_plotter.interpolate import adaptive_samples  # noqa: E402
+
+X_MIN, X_MAX = 1.5, 3.5
+
+
+def synthetic_splines(n_systems: int, n_points: int) -> List[BSpline]:
+    """Splines of smooth energy profiles with a sharp feature (such as Pauli or OI close to the transition state) at a random position."""
+    rng = np.random.default_rng(42)
+    x = np.linspace(X_MIN, X_MAX, n_points)
+    splines = []
+    for _ in range(n_systems):
+        center, width, depth = rng.uniform(2.0, 3.0), rng.uniform(0.04, 0.1), rng.uniform(5.0, 20.0)
+        y = 10.0 * (x - X_MIN) ** 2 - depth / (1.0 + ((x - center) / width) ** 2)
+        splines.append(make_interp_spline(x, y, k=3))
+    return splines
+
+
+def max_deviation(spline: BSpline, x: np.ndarray, y: np.ndarray, n_check: int = 100_000) -> float:
+    """The largest deviation of the drawn line (straight segments between the samples) from the spline."""
+    dense_x = np.linspace(X_MIN, X_MAX, n_check)
+    return float(np.abs(np.interp(dense_x, x, y) - spline(dense_x)).max())
+
+
+def render(lines: List[Tuple[np.ndarray, np.ndarray]], file_format: str) -> Tuple[int, float]:
+    """Returns the file size (bytes) and the time (s) of saving a figure with the lines."""
+    fig, ax = plt.subplots()
+    for x, y in lines:
+        ax.plot(x, y)
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    fig.savefig(buffer, format=file_format, dpi=150)
+    elapsed = time.perf_counter() - start
+    plt.close(fig)
+    return buffer.getbuffer().nbytes, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-systems", type=int, default=50)
+    parser.add_argument("--n-points", type=int, default=60, help="Number of points along the IRC of each system")
+    parser.add_argument("--n-interpolation-points", type=int, default=400, help="Number of evenly spaced samples (and maximum number of adaptive samples)")
+    parser.add_argument("--tolerance", type=float, default=0.02, help="Tolerance of the adaptive samples (in the units of the data)")
+    args = parser.parse_args()
+
+    splines = synthetic_splines(args.n_systems, args.n_points)
+    samplers: List[Tuple[str, Callable[[BSpline], Tuple[np.ndarray, np.ndarray]]]] = [
+        (f"even ({args.n_interpolation_points})", lambda spline: (lambda x: (x, spline(x)))(np.linspace(X_MIN, X_MAX, args.n_interpolation_points))),
+        (f"adaptive ({args.tolerance})", lambda spline: adaptive_samples(spline, X_MIN, X_MAX, args.tolerance, args.n_interpolation_points)),
+    ]
+
+    print(f"{args.n_systems} lines, {args.n_points} points along the IRC")
+    for name, sampler in samplers:
+        start = time.perf_counter()
+        lines = [sampler(spline) for spline in splines]
+        sampling_time = time.perf_counter() - start
+
+        n_vertices = sum(len(x) for x, _ in lines)
+        deviation = max(max_deviation(spline, x, y) for spline, (x, y) in zip(splines, lines))
+        pdf_size, pdf_time = render(lines, "pdf")
+        png_size, png_time = render(lines, "png")
+        print(
+            f"{name:>16}: {n_vertices:7d} vertices, max deviation {deviation:.4f}, sampling {sampling_time * 1e3:6.1f} ms, "
+            f"pdf {pdf_size / 1024:6.1f} KiB ({pdf_time * 1e3:5.1f} ms), png {png_size / 1024:6.1f} KiB ({png_time * 1e3:5.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
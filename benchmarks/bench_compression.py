@@ -0,0 +1,56 @@
+""" Benchmark comparing the read throughput of plain and compressed (streamed) results files in files per second """
+import argparse
+import bz2
+import gzip
+import lzma
+import pathlib as pl
+import tempfile
+from typing import Callable, Dict, List
+
+from bench_read_resultsfile import files_per_second, write_synthetic_results_files
+
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+
+
+def _compressors() -> Dict[str, Callable[[bytes], bytes]]:
+    compressors: Dict[str, Callable[[bytes], bytes]] = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+    try:
+        import zstandard
+
+        compressors[".zst"] = zstandard.ZstdCompressor().compress
+    except ImportError:
+        print("zstandard is not installed, skipping .zst")
+    return compressors
+
+
+def compress_files(paths: List[str], extension: str, compress: Callable[[bytes], bytes]) -> List[str]:
+    compressed_paths = []
+    for path in paths:
+        compressed_path = pl.Path(path + extension)
+        compressed_path.write_bytes(compress(pl.Path(path).read_bytes()))
+        compressed_paths.append(str(compressed_path))
+    return compressed_paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-files", type=int, default=200)
+    parser.add_argument("--n-rows", type=int, default=200)
+    parser.add_argument("--n-extra-columns", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = write_synthetic_results_files(pl.Path(temp_dir), args.n_files, args.n_rows, args.n_extra_columns)
+        plain_size = sum(pl.Path(path).stat().st_size for path in paths)
+
+        print(f"{args.n_files} files, {args.n_rows} rows, {plain_size / 1024**2:.1f} MB")
+        print(f"{'plain':>8}: {files_per_second(read_results_file, paths, args.repeats):10.1f} files/s")
+        for extension, compress in _compressors().items():
+            compressed_paths = compress_files(paths, extension, compress)
+            ratio = plain_size / sum(pl.Path(path).stat().st_size for path in compressed_paths)
+            print(f"{extension:>8}: {files_per_second(read_results_file, compressed_paths, args.repeats):10.1f} files/s (compression ratio {ratio:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+""" Micro-benchmark of the config access overhead in a batch of plots, comparing parsing the raw config strings on every access with the compiled config snapshot """
+import argparse
+import pathlib as pl
+import time
+from typing import Any, Callable, List, Tuple
+
+from pyfrag_plotter import config, initialize_pyfrag_plotter
+
+EXAMPLE_CONFIG = pl.Path(__file__).resolve().parent.parent / "example" / "example_config.ini"
+
+# Config lookups of the plotter for one plot: the plot info, the plotted keys, the interpolation of every line and the axes details
+PLOT_INFO_LOOKUPS = [("SHARED", "colours"), ("SHARED", "line_styles"), ("SHARED", "stat_point_type"), ("SHARED", "stat_point_type"), ("ASM", "asm_keys")]
+LINE_LOOKUPS = [("SHARED", "n_interpolation_points"), ("SHARED", "reverse_x_axis")]
+AXES_LOOKUPS = [("SHARED", "y_lim"), ("SHARED", "x_lim"), ("SHARED", "reverse_x_axis"), ("SHARED", "vline")]
+
+
+def plot_batch_lookups(n_plots: int, n_lines: int) -> List[Tuple[str, str]]:
+    return (PLOT_INFO_LOOKUPS + LINE_LOOKUPS * n_lines + AXES_LOOKUPS) * n_plots
+
+
+def best_time(func: Callable[[], Any], repeats: int) -> float:
+    times: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-plots", type=int, default=1000)
+    parser.add_argument("--n-lines", type=int, default=5, help="Number of lines (systems times terms) per plot")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    initialize_pyfrag_plotter(str(EXAMPLE_CONFIG))
+    lookups = plot_batch_lookups(args.n_plots, args.n_lines)
+
+    parsed = best_time(lambda: [config.parse(section, option) for section, option in lookups], args.repeats)
+    snapshot = best_time(lambda: [config.get(section, option) for section, option in lookups], args.repeats)
+    print(f"{args.n_plots} plots ({len(lookups)} lookups): parsing {parsed * 1e3:8.2f} ms, snapshot {snapshot * 1e3:8.2f} ms, speedup {parsed / snapshot:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
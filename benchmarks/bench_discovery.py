@@ -0,0 +1,42 @@
+""" Benchmark of the campaign discovery: a cold walk versus an incremental walk with a directory index """
+import argparse
+import os
+import pathlib as pl
+import tempfile
+import time
+
+from pyfrag_plotter.input.discovery import discover_pyfrag_jobs
+
+
+def write_synthetic_campaign(root: pl.Path, n_jobs: int, jobs_per_group: int) -> None:
+    """Writes a campaign with job directories that each contain an input file, a results file and an AMS scratch directory."""
+    for i in range(n_jobs):
+        job_dir = root / f"group_{i // jobs_per_group}" / f"job_{i}"
+        (job_dir / "plams_workdir" / "ams").mkdir(parents=True)
+        (job_dir / f"job_{i}.in").write_text("PyFrag\nPyFrag END\n")
+        (job_dir / f"pyfrag_job_{i}.txt").write_text("#IRC bondlength EnergyTotal\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-jobs", type=int, default=5000)
+    parser.add_argument("--jobs-per-group", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = pl.Path(temp_dir) / "campaign"
+        write_synthetic_campaign(root, args.n_jobs, args.jobs_per_group)
+        index_file = os.path.join(temp_dir, "index.json")
+
+        start = time.perf_counter()
+        n_walked = sum(1 for _ in os.walk(root))
+        print(f"{'os.walk (no pruning)':>28}: {time.perf_counter() - start:8.3f} s ({n_walked} directories)")
+
+        for name in ["discovery (cold, no index)", "discovery (building index)", "discovery (warm index)"]:
+            start = time.perf_counter()
+            result = discover_pyfrag_jobs(str(root), index_file=None if "no index" in name else index_file)
+            print(f"{name:>28}: {time.perf_counter() - start:8.3f} s ({len(result.jobs)} jobs, {result.n_scanned} directories listed)")
+
+
+if __name__ == "__main__":
+    main()
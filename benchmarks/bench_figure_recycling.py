@@ -0,0 +1,76 @@
+""" Memory benchmark of a large batch of plots: the peak RSS while making the plots on recycled figures (`Plotter(..., recycle_figures=True)`)
+compared with a new figure per plot. Each mode runs in a separate process, since the peak RSS of a process never decreases. """
+import argparse
+import io
+import pathlib as pl
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+EXAMPLE_DIR = pl.Path(__file__).resolve().parent.parent / "example"
+EXAMPLE_RESULTS_DIRS = [EXAMPLE_DIR / name for name in ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi", "ureas_di_O_Cs_sigma"]]
+REPORT = [["EnergyTotal", "Int", "StrainTotal"], ["Int", "Pauli", "Elstat", "OI"], ["Int"], ["Elstat", "OI"], ["OI"]]
+
+
+def peak_rss() -> float:
+    """The peak resident set size (MiB) of the process (ru_maxrss is in KiB on Linux and in bytes on macOS)."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1024**2 if sys.platform == "darwin" else max_rss / 1024
+
+
+def run_plots(n_plots: int, recycle_figures: bool, dpi: int) -> None:
+    """Makes the plots (as the plot methods of the Plotter do, but saving to memory) and prints the peak RSS at ten checkpoints."""
+    import logging
+    import warnings
+
+    from pyfrag_plotter import initialize_pyfrag_plotter
+    from pyfrag_plotter.plot.plot_details import set_axes_details, set_figure_details
+    from pyfrag_plotter.plot.plotter import Plotter
+    from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir
+
+    initialize_pyfrag_plotter(str(EXAMPLE_DIR / "example_config.ini"), headless=True)
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")  # pyplot warns about the many open figures
+
+    objs = [create_pyfrag_object_from_dir(str(results_dir)) for results_dir in EXAMPLE_RESULTS_DIRS]
+    checkpoints = {max(1, n_plots * i // 10) for i in range(1, 11)}
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory() as plot_dir, Plotter(
+        name="bench", plot_dir=plot_dir, pyfrag_objects=objs, irc_coord=("bondlength_1", "r"), recycle_figures=recycle_figures
+    ) as plotter:
+        for i in range(1, n_plots + 1):
+            keys = REPORT[i % len(REPORT)]
+            fig, ax = plotter.new_figure()
+            plotter.standard_plot_routine(keys, ax)
+            set_axes_details(ax=ax, x_label="r", line_style_labels=objs[0].get_plot_labels(keys), interpolate=False, style=not recycle_figures)
+            set_figure_details(fig=fig, title="_".join(keys))
+            fig.savefig(io.BytesIO(), format="png", dpi=dpi)
+
+            if i in checkpoints:
+                print(f"{i:8d} plots: peak RSS {peak_rss():8.1f} MiB ({time.perf_counter() - start:7.1f} s)", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-plots", type=int, default=5000)
+    parser.add_argument("--n-plots-new", type=int, default=500, help="Number of plots with a new figure per plot, of which the memory grows with every plot")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--run", choices=["recycled", "new"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        run_plots(args.n_plots, args.run == "recycled", args.dpi)
+        return
+
+    for mode, n_plots in [("recycled", args.n_plots), ("new", args.n_plots_new)]:
+        print(f"{mode} figures:", flush=True)
+        command: List[str] = [sys.executable, __file__, "--run", mode, "--n-plots", str(n_plots), "--dpi", str(args.dpi)]
+        subprocess.run(command, check=True)
+
+
+if __name__ == "__main__":
+    main()
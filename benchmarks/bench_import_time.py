@@ -0,0 +1,62 @@
+""" Startup benchmark (python -X importtime) of the headless mode, which defers importing matplotlib and scipy, compared with the eager startup """
+import argparse
+import pathlib as pl
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+EXAMPLE_DIR = pl.Path(__file__).resolve().parent.parent / "example"
+
+# Loading the results of a directory, as a script that only processes data does
+HEADLESS_SCRIPT = f"""
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.interpolate import interpolate_plot
+from pyfrag_plotter.plot.plotter import Plotter
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir
+
+initialize_pyfrag_plotter({str(EXAMPLE_DIR / "example_config.ini")!r}, headless=True)
+create_pyfrag_object_from_dir({str(EXAMPLE_DIR / "ureas_di_O_Cs_all")!r})
+"""
+
+EAGER_SCRIPT = f"""
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.plot.plotter import Plotter
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir
+
+initialize_pyfrag_plotter({str(EXAMPLE_DIR / "example_config.ini")!r}, headless=False)
+create_pyfrag_object_from_dir({str(EXAMPLE_DIR / "ureas_di_O_Cs_all")!r})
+import scipy.interpolate
+"""
+
+
+def startup_times(script: str) -> Tuple[float, float]:
+    """Returns the wall time (s) of running the script in a new process and the cumulative import time (s) of its top-level imports."""
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", script], capture_output=True, text=True, check=True)
+    wall_time = time.perf_counter() - start
+
+    # The names of nested imports are indented, such that only the top-level imports are summed
+    import_time = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name[1:].startswith(" "):
+            import_time += int(cumulative)
+    return wall_time, import_time / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, script in [("headless", HEADLESS_SCRIPT), ("eager", EAGER_SCRIPT)]:
+        times: List[Tuple[float, float]] = [startup_times(script) for _ in range(args.repeats)]
+        wall_time, import_time = min(times)
+        print(f"{label:>8}: {wall_time * 1e3:7.0f} ms wall time, {import_time * 1e3:7.0f} ms importing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+""" Benchmarks of the interpolation of many systems:
+
+- evaluating the terms at common IRC coordinates, comparing `interpolate_data` per system and per point with `interpolate_cube`
+- locating the transition states, comparing the maximum of densely resampled splines with `find_stationary_points`
+"""
+import argparse
+import pathlib as pl
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.interpolate import find_stationary_points, interpolate_cube, interpolate_data, spline_cache
+from pyfrag_plotter.pyfrag_object import PyFragResultsObject
+
+EXAMPLE_CONFIG = pl.Path(__file__).resolve().parent.parent / "example" / "example_config.ini"
+TERMS = ["EnergyTotal", "Int", "Elstat", "Pauli", "OI", "Disp", "StrainTotal", "frag1Strain", "frag2Strain"]
+
+
+def synthetic_objects(n_systems: int, n_points: int) -> List[PyFragResultsObject]:
+    rng = np.random.default_rng(42)
+    objects = []
+    for i in range(n_systems):
+        bondlength = np.sort(rng.uniform(1.5, 3.5, n_points))[::-1]
+        data = {"bondlength_1": bondlength}
+        data.update({term: np.cumsum(rng.normal(size=n_points)) for term in TERMS})
+        objects.append(PyFragResultsObject(name=f"system_{i}", dataframe=pd.DataFrame(data)))
+    return objects
+
+
+def dense_resampling_peaks(objects: List[PyFragResultsObject], n_samples: int) -> np.ndarray:
+    """Locates the maximum of the total energy by evaluating the spline of every system on a dense grid."""
+    from scipy.interpolate import make_interp_spline
+
+    peaks = np.empty(len(objects))
+    for i, obj in enumerate(objects):
+        x = obj.get_x_axis("bondlength_1")[::-1]
+        spline = make_interp_spline(x, obj.get_data_of_key("EnergyTotal")[::-1], k=3)
+        grid = np.linspace(x[0], x[-1], n_samples)
+        peaks[i] = grid[np.argmax(spline(grid))]
+    return peaks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-systems", type=int, default=200)
+    parser.add_argument("--n-points", type=int, default=60, help="Number of points along the IRC of each system")
+    parser.add_argument("--n-grid", type=int, default=50, help="Number of common coordinates")
+    parser.add_argument("--n-samples", type=int, default=10000, help="Number of samples of the dense resampling")
+    args = parser.parse_args()
+
+    initialize_pyfrag_plotter(str(EXAMPLE_CONFIG), headless=True)
+    objects = synthetic_objects(args.n_systems, args.n_points)
+    grid = np.linspace(2.0, 3.0, args.n_grid)
+    print(f"{args.n_systems} systems, {args.n_points} points, {args.n_grid} common coordinates, {len(TERMS)} terms")
+
+    start = time.perf_counter()
+    for obj in objects:
+        for point in grid:
+            interpolate_data(obj, "bondlength_1", point)
+    print(f"{'interpolate_data per point':>30}: {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    for obj in objects:
+        interpolate_data(obj, "bondlength_1", grid)
+    print(f"{'interpolate_data per system':>30}: {time.perf_counter() - start:8.3f} s")
+
+    for label in ["interpolate_cube (cold)", "interpolate_cube (cached)"]:
+        start = time.perf_counter()
+        interpolate_cube(objects, "bondlength_1", grid, TERMS)
+        print(f"{label:>30}: {time.perf_counter() - start:8.3f} s")
+
+    spline_cache.clear()
+    start = time.perf_counter()
+    dense_resampling_peaks(objects, args.n_samples)
+    print(f"{f'dense resampling ({args.n_samples})':>30}: {time.perf_counter() - start:8.3f} s")
+
+    spline_cache.clear()
+    start = time.perf_counter()
+    find_stationary_points(objects, "bondlength_1")
+    print(f"{'find_stationary_points':>30}: {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+""" Benchmark of the interpolation methods: throughput (fitting and evaluating all terms of a system at once) and accuracy
+
+- the example ureas datasets: the error at the computed points that are left out of the fit (every other point)
+- large synthetic IRCs: the error with respect to the analytic energy profiles, which have a sharp feature (such as Pauli or OI close to the transition state)
+"""
+import argparse
+import pathlib as pl
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.interpolate import INTERPOLATION_METHODS, make_interpolator
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir
+
+EXAMPLE_DIR = pl.Path(__file__).resolve().parent.parent / "example"
+EXAMPLE_RESULTS_DIRS = [EXAMPLE_DIR / name for name in ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi", "ureas_di_O_Cs_sigma"]]
+TERMS = ["EnergyTotal", "Int", "Elstat", "Pauli", "OI", "Disp", "StrainTotal", "frag1Strain", "frag2Strain"]
+X_MIN, X_MAX = 1.5, 3.5
+
+# A system is the (increasing) IRC coordinate, the terms (one column per term), the points at which the error is measured and the reference values at these points
+System = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def example_systems() -> List[System]:
+    """The example ureas datasets, fitted through the even points and evaluated at the odd points."""
+    systems = []
+    for results_dir in EXAMPLE_RESULTS_DIRS:
+        obj = create_pyfrag_object_from_dir(str(results_dir))
+        x = obj.get_x_axis("bondlength_1").astype(np.float64)
+        order = np.argsort(x)
+        y = obj.dataframe[[term for term in TERMS if term in obj.dataframe.columns]].to_numpy(dtype=np.float64)[order]
+        x = x[order]
+        systems.append((x[::2], y[::2], x[1:-1:2], y[1:-1:2]))
+    return systems
+
+
+def synthetic_systems(n_systems: int, n_points: int, n_terms: int, n_check: int) -> List[System]:
+    """Smooth energy profiles with a sharp feature at a random position, with a little noise on the computed points."""
+    rng = np.random.default_rng(42)
+    x = np.linspace(X_MIN, X_MAX, n_points)
+    dense_x = np.linspace(X_MIN, X_MAX, n_check)
+
+    def profiles(x_values: np.ndarray, centers: np.ndarray, widths: np.ndarray, depths: np.ndarray) -> np.ndarray:
+        return 10.0 * (x_values[:, None] - X_MIN) ** 2 - depths / (1.0 + ((x_values[:, None] - centers) / widths) ** 2)
+
+    systems = []
+    for _ in range(n_systems):
+        centers, widths, depths = rng.uniform(2.0, 3.0, n_terms), rng.uniform(0.04, 0.1, n_terms), rng.uniform(5.0, 20.0, n_terms)
+        y = profiles(x, centers, widths, depths) + rng.normal(scale=0.01, size=(n_points, n_terms))
+        systems.append((x, y, dense_x, profiles(dense_x, centers, widths, depths)))
+    return systems
+
+
+def benchmark(systems: List[System], method: str) -> Tuple[float, float, float]:
+    """Returns the time (s) of fitting and evaluating all systems, and the mean and maximum absolute error."""
+    start = time.perf_counter()
+    predictions = [make_interpolator(x, y, method)(points) for x, y, points, _ in systems]
+    elapsed = time.perf_counter() - start
+
+    errors = np.concatenate([np.abs(prediction - reference).ravel() for prediction, (_, _, _, reference) in zip(predictions, systems)])
+    return elapsed, float(errors.mean()), float(errors.max())
+
+
+def report(label: str, systems: List[System], n_repeats: int) -> None:
+    n_values = sum(points.size * y.shape[1] for _, y, points, _ in systems)
+    print(f"{label}: {len(systems)} systems, {n_values} interpolated values")
+    for method in INTERPOLATION_METHODS:
+        elapsed = min(benchmark(systems, method)[0] for _ in range(n_repeats))
+        _, mean_error, max_error = benchmark(systems, method)
+        print(f"{method:>10}: {elapsed * 1e3:8.1f} ms ({n_values / elapsed / 1e6:6.2f} M values/s), mean error {mean_error:.2e}, max error {max_error:.2e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n-systems", type=int, default=20)
+    parser.add_argument("--n-points", type=int, default=200, help="Number of points along the synthetic IRCs")
+    parser.add_argument("--n-terms", type=int, default=len(TERMS), help="Number of terms per synthetic system")
+    parser.add_argument("--n-check", type=int, default=2000, help="Number of points at which the synthetic IRCs are evaluated")
+    parser.add_argument("--n-repeats", type=int, default=2)
+    args = parser.parse_args()
+
+    initialize_pyfrag_plotter(str(EXAMPLE_DIR / "example_config.ini"), headless=True)
+    report("example ureas (leave-out error)", example_systems(), args.n_repeats)
+    report("synthetic IRCs", synthetic_systems(args.n_systems, args.n_points, args.n_terms, args.n_check), args.n_repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+""" Benchmark comparing the robust (Hampel) outlier detection of all energy terms with the neighbour-difference outlier removal of EnergyTotal """
+import argparse
+import pathlib as pl
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.processing_funcs import hampel_outliers, remove_outliers
+
+EXAMPLE_CONFIG = pl.Path(__file__).resolve().parent.parent / "example" / "example_config.ini"
+
+ENERGY_KEYS = ["EnergyTotal", "Int", "Elstat", "Pauli", "OI", "Disp", "StrainTotal", "frag1Strain", "frag2Strain"]
+
+
+def synthetic_energies_df(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """Smooth energy terms with SCF convergence glitches in 0.1% of the rows of every term."""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0.0, 3.0, n_rows)
+    data = {}
+    for i, key in enumerate(ENERGY_KEYS):
+        values = 50.0 * np.sin(x + i) + rng.normal(scale=0.1, size=n_rows)
+        values[rng.random(n_rows) < 0.001] += 100.0
+        data[key] = values
+    return pd.DataFrame(data)
+
+
+def best_time(func: Callable[[], object], repeats: int) -> float:
+    times: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**4, 10**5, 10**6], help="Numbers of rows")
+    parser.add_argument("--window", type=int, default=7)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    initialize_pyfrag_plotter(str(EXAMPLE_CONFIG))
+    for n_rows in args.sizes:
+        df = synthetic_energies_df(n_rows)
+        difference = best_time(lambda: remove_outliers(df, 50.0), args.repeats)
+        hampel = best_time(lambda: hampel_outliers(df, window=args.window, threshold=3.0), args.repeats)
+        print(
+            f"{n_rows:>10} rows: neighbour difference (EnergyTotal) {difference * 1e3:9.2f} ms, "
+            f"Hampel ({len(ENERGY_KEYS)} terms) {hampel * 1e3:9.2f} ms ({n_rows * len(ENERGY_KEYS) / hampel / 1e6:5.1f}M values/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+""" Benchmark comparing the fused and batched processing engines with the chained processing functions (trim, duplicates, dispersion, outliers),
+and the binary search trimming on monotonic IRC coordinates with a scan of the column """
+import argparse
+import pathlib as pl
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.processing_funcs import (
+    process_results_file_fused,
+    process_results_files,
+    remove_dispersion_term,
+    remove_duplicate_x_values_dataframe,
+    remove_outliers,
+    trim_data,
+    trim_ranges,
+)
+
+EXAMPLE_CONFIG = pl.Path(__file__).resolve().parent.parent / "example" / "example_config.ini"
+
+
+def process_results_file_chained(df: pd.DataFrame, trim_option, trim_key, outlier_threshold) -> pd.DataFrame:
+    """The previous implementation of `process_results_file`, creating a new DataFrame in every step."""
+    df = trim_data(df, trim_option, trim_key)
+    df = remove_duplicate_x_values_dataframe(df)
+    df = remove_dispersion_term(df)
+    return remove_outliers(df, outlier_threshold)
+
+
+def synthetic_results_df(n_rows: int, n_columns: int = 10, seed: int = 42) -> pd.DataFrame:
+    """A results table with a (partly duplicated) IRC coordinate, outliers in EnergyTotal and a zero dispersion term."""
+    rng = np.random.default_rng(seed)
+    data = {
+        "bondlength_1": np.round(np.linspace(1.0, 3.0, n_rows), 6),
+        "EnergyTotal": np.cumsum(rng.normal(scale=1.0, size=n_rows)) + np.where(rng.random(n_rows) < 0.001, 500.0, 0.0),
+        "Disp": np.zeros(n_rows),
+    }
+    for i in range(n_columns - len(data)):
+        data[f"term_{i}"] = rng.normal(size=n_rows)
+    return pd.DataFrame(data, index=pd.Index(np.arange(1.0, n_rows + 1.0), name="#IRC"))
+
+
+def best_time(func: Callable[[], pd.DataFrame], repeats: int) -> float:
+    times: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6], help="Numbers of rows (e.g. 100000 1000000 10000000)")
+    parser.add_argument("--n-systems", type=int, default=10000, help="Number of short IRCs (50-200 rows) for the batched processing benchmark")
+    parser.add_argument("--trim-option", default="min")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    initialize_pyfrag_plotter(str(EXAMPLE_CONFIG))
+    for n_rows in args.sizes:
+        df = synthetic_results_df(n_rows)
+        chained = best_time(lambda: process_results_file_chained(df, args.trim_option, "EnergyTotal", 50.0), args.repeats)
+        fused = best_time(lambda: process_results_file_fused(df, args.trim_option, "EnergyTotal", 50.0), args.repeats)
+        print(f"{n_rows:>10} rows: chained {chained * 1e3:9.2f} ms, fused {fused * 1e3:9.2f} ms, speedup {chained / fused:5.1f}x")
+
+        # The trimming decision only (as ranges of rows), where the monotonicity of the IRC coordinate is either unknown (0, scan) or cached (1, binary search)
+        for trim_option in [(1.5, 2.5), 2.0]:
+            scan = best_time(lambda: trim_ranges(df, trim_option, "bondlength_1", monotonicity={"bondlength_1": 0}), args.repeats)
+            binary_search = best_time(lambda: trim_ranges(df, trim_option, "bondlength_1", monotonicity={"bondlength_1": 1}), args.repeats)
+            print(f"{'':>10}  trim {str(trim_option):>10}: scan {scan * 1e3:9.3f} ms, binary search {binary_search * 1e3:9.3f} ms")
+
+    rng = np.random.default_rng(0)
+    dfs = [synthetic_results_df(int(n_rows), seed=i) for i, n_rows in enumerate(rng.integers(50, 201, args.n_systems))]
+    chained = best_time(lambda: [process_results_file_chained(df, args.trim_option, "EnergyTotal", 50.0) for df in dfs], 1)
+    fused = best_time(lambda: [process_results_file_fused(df, args.trim_option, "EnergyTotal", 50.0) for df in dfs], 1)
+    batched = best_time(lambda: process_results_files(dfs, args.trim_option, "EnergyTotal", 50.0), args.repeats)
+    print(f"{args.n_systems} systems: chained {args.n_systems / chained:9.0f} systems/s, fused {args.n_systems / fused:9.0f} systems/s, batched {args.n_systems / batched:9.0f} systems/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+""" Benchmark of `read_inputfile` on a synthetic corpus of PyFrag input files (.in) """
+import argparse
+import os
+import pathlib as pl
+import re
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from pyfrag_plotter.input.read_inputfile import read_functions, read_inputfile
+
+PYFRAG_SECTION = """PyFrag
+
+restartjob system_{i}
+name system_{i}
+ircpath /scratch/campaign/trajectories/system_{i}.xyz
+fragment 1 2 3 4 5 6 7 8
+fragment 9 10 11 12 13 14 15 16
+strain   -1058.7
+strain   -1058.7
+bondlength 8 16 4.76
+angle 1 2 120.0
+overlap frag1 HOMO frag2 LUMO
+population frag2 HOMO-1
+orbitalenergy AA frag2 5
+vdd 1 2 3 4
+irrepOI AA
+
+PyFrag END
+"""
+
+
+def _read_inputfile_previous(inputfile: str) -> Dict[str, Any]:
+    """The previous implementation of `read_inputfile`: the whole file is read and every key is substring-tested on every line."""
+    with open(inputfile, "r") as f:
+        lines = f.readlines()
+
+    start_index, end_index = -1, -1
+    for i, line in enumerate(lines):
+        if re.match(r"^\s*PyFrag\s*$", line, re.IGNORECASE):
+            start_index = i + 1
+        if re.match(r"^\s*PyFrag END\s*$", line, re.IGNORECASE):
+            end_index = i - 1
+            break
+
+    input_keys: Dict[str, Any] = {}
+    counter = {key: 0 for key in read_functions}
+    for line in lines[start_index:end_index + 1]:
+        for key, func in read_functions.items():
+            if key.lower() in line.lower():
+                counter[key] += 1
+                input_keys[f"{key}_{counter[key]}"] = func(line)
+        if "name" in line.lower():
+            input_keys["name"] = line.split()[1]
+    return input_keys
+
+
+def write_synthetic_inputfiles(directory: pl.Path, n_files: int, n_ams_lines: int) -> List[str]:
+    """Writes input files with a PyFrag section followed by an AMS block with a (large) geometry."""
+    ams_block = "AMS\nSystem\n  Atoms\n" + "    C 0.000000 1.000000 2.000000\n" * n_ams_lines + "  End\nEnd\nAMS END\n"
+    paths = []
+    for i in range(n_files):
+        path = directory / f"system_{i}.in"
+        path.write_text(PYFRAG_SECTION.format(i=i) + "\n" + ams_block)
+        paths.append(str(path))
+    return paths
+
+
+def files_per_second(reader: Callable[[str], Dict[str, Any]], paths: List[str]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        reader(path)
+    return len(paths) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-files", type=int, default=100_000)
+    parser.add_argument("--n-ams-lines", type=int, default=200, help="Number of geometry lines in the AMS block after the PyFrag section")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = write_synthetic_inputfiles(pl.Path(temp_dir), args.n_files, args.n_ams_lines)
+        print(f"{args.n_files} input files, {os.path.getsize(paths[0]) / 1024:.1f} kB each")
+        for name, reader in {"previous": _read_inputfile_previous, "single-pass": read_inputfile}.items():
+            print(f"{name:>12}: {files_per_second(reader, paths):10.1f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+""" Benchmark comparing the native results file reader (with and without column projection) with the pandas (read_csv) reader in files per second """
+import argparse
+import pathlib as pl
+import tempfile
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+
+HEADERS = ["#IRC", "bondlength", "EnergyTotal", "Int", "Elstat", "Pauli", "OI", "Disp", "StrainTotal", "frag1Strain", "frag2Strain"]
+
+
+def _read_results_file_pandas(results_file: str) -> pd.DataFrame:
+    """The previous implementation of `read_results_file`, using the pandas csv reader."""
+    df = pd.read_csv(results_file, header=0, sep=r"\s+", dtype=float, index_col=0)
+    return df.rename(columns={"bondlength": "bondlength_1"})
+
+
+def write_synthetic_results_files(directory: pl.Path, n_files: int, n_rows: int, n_extra_columns: int) -> List[str]:
+    """Writes synthetic pyfrag_*.txt files with the same layout as the files written by PyFrag."""
+    rng = np.random.default_rng(42)
+    headers = HEADERS + [f"vdd_{i + 1}" for i in range(n_extra_columns)]
+    paths = []
+    for i in range(n_files):
+        data = rng.normal(scale=50.0, size=(n_rows, len(headers) - 1))
+        lines = ["\t\t".join(headers)]
+        lines += [f"{row + 1}\t\t" + "\t\t".join(f"{value:.5f}" for value in data[row]) for row in range(n_rows)]
+        path = directory / f"pyfrag_system_{i}.txt"
+        path.write_text("\n".join(lines) + "\n")
+        paths.append(str(path))
+    return paths
+
+
+def files_per_second(reader: Callable[[str], pd.DataFrame], paths: List[str], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for path in paths:
+            reader(path)
+        best = min(best, time.perf_counter() - start)
+    return len(paths) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-files", type=int, default=500)
+    parser.add_argument("--n-rows", type=int, default=200)
+    parser.add_argument("--n-extra-columns", type=int, default=0, help="Number of extra (e.g. VDD) columns to make the files wider")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = write_synthetic_results_files(pl.Path(temp_dir), args.n_files, args.n_rows, args.n_extra_columns)
+
+        readers = {
+            "pandas read_csv": _read_results_file_pandas,
+            "native (float64)": read_results_file,
+            "native (float32)": lambda path: read_results_file(path, dtype=np.float32),
+            "native (projected)": lambda path: read_results_file(path, columns=["bondlength_*", "EnergyTotal", "Int", "StrainTotal"]),
+        }
+        print(f"{args.n_files} files, {args.n_rows} rows, {len(HEADERS) + args.n_extra_columns} columns")
+        for name, reader in readers.items():
+            print(f"{name:>20}: {files_per_second(reader, paths, args.repeats):10.1f} files/s")
+
+
+if __name__ == "__main__":
+    main()
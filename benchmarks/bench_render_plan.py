@@ -0,0 +1,71 @@
+""" Benchmark of drawing the lines of a plot report (ASM and EDA plots of the same systems): interpolating the drawn lines afterwards
+(`set_axes_details(..., interpolate=True)`) compared with drawing the prepared curves of the render plan """
+import argparse
+import pathlib as pl
+import time
+from typing import List
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from pyfrag_plotter import initialize_pyfrag_plotter  # noqa: E402
+from pyfrag_plotter.config.context import config_context  # noqa: E402
+from pyfrag_plotter.interpolate import spline_cache  # noqa: E402
+from pyfrag_plotter.plot.plot_details import set_axes_details  # noqa: E402
+from pyfrag_plotter.plot.plotter import Plotter  # noqa: E402
+from pyfrag_plotter.pyfrag_object import PyFragResultsObject  # noqa: E402
+
+TERMS = ["EnergyTotal", "Int", "StrainTotal", "Pauli", "Elstat", "OI", "Disp"]
+EXAMPLE_CONFIG = pl.Path(__file__).resolve().parent.parent / "example" / "example_config.ini"
+REPORT = [["EnergyTotal", "Int", "StrainTotal"], ["Int", "Pauli", "Elstat", "OI"], ["Int"], ["Elstat", "OI"], ["OI"]]
+
+
+def synthetic_objects(n_systems: int, n_points: int) -> List[PyFragResultsObject]:
+    rng = np.random.default_rng(42)
+    x = np.linspace(1.5, 3.5, n_points)
+    data = [{"bondlength_1": x, **{term: np.cumsum(rng.normal(size=n_points)) for term in TERMS}} for _ in range(n_systems)]
+    return [PyFragResultsObject(name=f"system_{i}", dataframe=pd.DataFrame(values)) for i, values in enumerate(data)]
+
+
+def draw_report(plotter: Plotter, render_plan: bool) -> float:
+    """Returns the time (s) of drawing the lines of all plots of the report and finishing the axes."""
+    start = time.perf_counter()
+    for keys in REPORT:
+        fig, ax = plt.subplots()
+        if render_plan:
+            plotter.standard_plot_routine(keys, ax)
+        else:
+            # The lines are drawn with the computed points and replaced by the interpolated data
+            for line_style, key in zip(plotter.plot_info.line_styles, keys):
+                for obj, colour in zip(plotter.objects, plotter.plot_info.colours):
+                    ax.plot(obj.get_x_axis("bondlength_1"), obj.get_data_of_key(key), color=colour, linestyle=line_style)
+        set_axes_details(ax=ax, plot_legend=False, interpolate=not render_plan)
+        plt.close(fig)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-systems", type=int, default=12)
+    parser.add_argument("--n-points", type=int, default=60, help="Number of points along the IRC of each system")
+    parser.add_argument("--n-interpolation-points", type=int, default=1000)
+    args = parser.parse_args()
+
+    initialize_pyfrag_plotter(str(EXAMPLE_CONFIG), headless=True)
+    objects = synthetic_objects(args.n_systems, args.n_points)
+    print(f"{len(REPORT)} plots, {args.n_systems} systems, {args.n_points} points, {args.n_interpolation_points} interpolation points")
+
+    with config_context(n_interpolation_points=args.n_interpolation_points, stat_point_type="none", x_lim=[1.5, 3.5], y_lim=[-20.0, 20.0]):
+        for label, render_plan in [("interpolate drawn lines", False), ("render plan", True)]:
+            spline_cache.clear()
+            plotter = Plotter(name="bench", plot_dir=".", pyfrag_objects=objects, irc_coord=("bondlength_1", "r"))
+            elapsed = draw_report(plotter, render_plan)
+            print(f"{label:>24}: {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+""" Benchmark of the header-only schema scan versus fully reading the results files, in files per second """
+import argparse
+import pathlib as pl
+import tempfile
+import time
+
+from bench_read_resultsfile import write_synthetic_results_files
+
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+from pyfrag_plotter.input.schema import scan_results_schema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-files", type=int, default=2000)
+    parser.add_argument("--n-rows", type=int, default=200)
+    parser.add_argument("--n-extra-columns", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = write_synthetic_results_files(pl.Path(temp_dir), args.n_files, args.n_rows, args.n_extra_columns)
+
+        start = time.perf_counter()
+        catalog = scan_results_schema(paths)
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for path in paths:
+            read_results_file(path)
+        read_time = time.perf_counter() - start
+
+        print(f"{args.n_files} files, {args.n_rows} rows, {catalog['n_columns'].iloc[0]} columns")
+        print(f"{'schema scan':>20}: {args.n_files / scan_time:10.1f} files/s")
+        print(f"{'full read':>20}: {args.n_files / read_time:10.1f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+""" Benchmark of the interpolation of the lines of a plot report (the same systems in several plots), with and without the spline cache """
+import argparse
+import pathlib as pl
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.interpolate import interpolate_plot, spline_cache
+
+EXAMPLE_CONFIG = pl.Path(__file__).resolve().parent.parent / "example" / "example_config.ini"
+
+
+def synthetic_lines(n_systems: int, n_terms: int, n_points: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(42)
+    x = np.linspace(1.5, 3.5, n_points)
+    return [(x, rng.normal(scale=20.0, size=n_points)) for _ in range(n_systems * n_terms)]
+
+
+def interpolate_report(lines: List[Tuple[np.ndarray, np.ndarray]], n_plots: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n_plots):
+        for x, y in lines:
+            interpolate_plot(x, y)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-systems", type=int, default=50)
+    parser.add_argument("--n-terms", type=int, default=5, help="Number of terms (lines) per system in each plot")
+    parser.add_argument("--n-plots", type=int, default=8)
+    parser.add_argument("--n-points", type=int, default=60, help="Number of points along the IRC")
+    args = parser.parse_args()
+
+    initialize_pyfrag_plotter(str(EXAMPLE_CONFIG), headless=True)
+    lines = synthetic_lines(args.n_systems, args.n_terms, args.n_points)
+    print(f"{args.n_plots} plots, {args.n_systems} systems, {args.n_terms} terms, {args.n_points} points")
+
+    max_size = spline_cache.max_size
+    spline_cache.max_size = 0
+    uncached = interpolate_report(lines, args.n_plots)
+    print(f"{'no cache':>12}: {uncached * 1e3:8.1f} ms ({spline_cache.misses} splines fitted)")
+
+    spline_cache.max_size = max_size
+    spline_cache.clear()
+    cached = interpolate_report(lines, args.n_plots)
+    print(f"{'spline cache':>12}: {cached * 1e3:8.1f} ms ({spline_cache.misses} splines fitted, {spline_cache.hits} hits, {spline_cache.size / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,27 @@
 import configparser as cp
 import logging
 import os
+import sys
 from typing import Optional
 
 from pyfrag_plotter.config.config_handler import Config
+from pyfrag_plotter.config.context import config_context, create_config, get_config  # noqa: F401
 
 # Global variable that contains the config file. It is first empty, but will be filled in the |init| function
 config: Config = Config(cp.ConfigParser())
 
+# Whether the matplotlib parameters of the config still have to be applied. In headless mode, matplotlib is only imported when the first plot is made
+_plot_parameters_pending: bool = False
 
-def initialize_pyfrag_plotter(user_config_file: Optional[str] = None) -> None:
+
+def is_headless() -> bool:
+    """Returns whether no display is available, such as on compute nodes. Windows and macOS are assumed to always have a display."""
+    if sys.platform.startswith(("win", "cygwin", "darwin")):
+        return False
+    return not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def initialize_pyfrag_plotter(user_config_file: Optional[str] = None, headless: Optional[bool] = None) -> None:
     """
     Initializes the PyFrag plotter configuration.
 
@@ -19,6 +31,10 @@ def initialize_pyfrag_plotter(user_config_file: Optional[str] = None) -> None:
     Args:
         user_config_file (Optional[str]): The path to a custom configuration file. If provided, the settings in this file
         will overwrite the standard configuration. Defaults to None.
+        headless (Optional[bool]): Whether to run without a display. In headless mode, the non-interactive Agg backend is used and importing matplotlib is
+        deferred until the first plot is made, which speeds up the startup of scripts that only load and process data. Defaults to None (detected with `is_headless`).
+        The matplotlib parameters of the config are then applied by the plotting functions of pyfrag_plotter. Scripts that plot with matplotlib.pyplot directly
+        (before any plot of pyfrag_plotter) should call `apply_pending_plot_parameters` first, otherwise the plots do not use the parameters of the config.
 
     Returns:
         None
@@ -26,7 +42,7 @@ def initialize_pyfrag_plotter(user_config_file: Optional[str] = None) -> None:
     Raises:
         ValueError: If the log level specified in the configuration is invalid.
     """
-    global config
+    global config, _plot_parameters_pending
 
     # Get the absolute path of the directory one level above the current directory
     current_dir = os.path.abspath(os.path.dirname(__file__))
@@ -55,12 +71,23 @@ def initialize_pyfrag_plotter(user_config_file: Optional[str] = None) -> None:
     config.validate_config()
     logging.log(logging.INFO, "The config file is valid")
 
-    # Initialize the log level and plot parameters
-    _initialize_plot_parameters()
+    # Initialize the plot parameters, which are deferred in headless mode if matplotlib has not been imported yet
+    headless = is_headless() if headless is None else headless
+    _plot_parameters_pending = headless and "matplotlib" not in sys.modules
+    if not _plot_parameters_pending:
+        _initialize_plot_parameters(headless)
     logging.log(logging.INFO, "Initialized PyFrag plotter Succesfully")
 
 
-def _initialize_plot_parameters() -> None:
+def apply_pending_plot_parameters() -> None:
+    """Applies the matplotlib parameters of the config if these were deferred by |init| in headless mode. Call this before plotting with matplotlib directly."""
+    global _plot_parameters_pending
+    if _plot_parameters_pending:
+        _plot_parameters_pending = False
+        _initialize_plot_parameters(headless=True)
+
+
+def _initialize_plot_parameters(headless: bool = False) -> None:
     """
     Applies plot-specific parameters to matplotlib.
 
@@ -68,18 +95,23 @@ def _initialize_plot_parameters() -> None:
     font family, and font size. It also tries to use the interactive backend for matplotlib, and falls back to the non-interactive
     backend if the interactive backend is not available.
 
+    Args:
+        headless (bool): Whether to use the non-interactive backend (Agg) directly, without importing matplotlib.pyplot. Defaults to False.
+
     Returns:
         None
     """
     import matplotlib as mpl
 
     # In some occations matplotlib cannot use the interactive backend, so we try to use the non-interactive backend
-    try:
-        mpl.use("TkAgg")
-        import matplotlib.pyplot as plt
-    except ImportError:
+    if headless:
         mpl.use("Agg")
-        import matplotlib.pyplot as plt
+    else:
+        try:
+            mpl.use("TkAgg")
+            import matplotlib.pyplot  # noqa: F401
+        except ImportError:
+            mpl.use("Agg")
 
     # Get a list of available fonts of matplotlib
     # import matplotlib.font_manager
@@ -92,15 +124,15 @@ def _initialize_plot_parameters() -> None:
     # print(font.get_name())
 
     # Figure size
-    plt.rcParams["figure.figsize"] = config.get("MATPLOTLIB", "fig_size")
+    mpl.rcParams["figure.figsize"] = config.get("MATPLOTLIB", "fig_size")
 
     # Font family
-    plt.rcParams["font.family"] = config.get("MATPLOTLIB", "font")
+    mpl.rcParams["font.family"] = config.get("MATPLOTLIB", "font")
 
     # Takes care of ticks starting at the edge of the screen
     # plt.rcParams["axes.autolimit_mode"] = "round_numbers"
-    plt.rcParams["axes.xmargin"] = 0.00
-    plt.rcParams["axes.ymargin"] = 0.00
+    mpl.rcParams["axes.xmargin"] = 0.00
+    mpl.rcParams["axes.ymargin"] = 0.00
 
     # Font size for the text in the plot including the title, xticks, and yticks
     font_size = config.get("MATPLOTLIB", "font_size")
@@ -111,10 +143,10 @@ def _initialize_plot_parameters() -> None:
     # Legend font size for within the plot
     legend_font_size = config.get("MATPLOTLIB", "legend_size")
 
-    plt.rc("font", size=font_size)  # controls default text sizes
-    plt.rc("xtick", labelsize=font_size - 2)  # fontsize of the tick labels
-    plt.rc("ytick", labelsize=font_size - 2)  # fontsize of the tick labels
-    plt.rc("figure", titlesize=font_size + 2)  # fontsize of the figure title
-    plt.rc("axes", titlesize=label_font_size)  # fontsize of the axes title
-    plt.rc("axes", labelsize=label_font_size)  # fontsize of the x and y labels
-    plt.rc("legend", fontsize=legend_font_size)  # legend fontsize
+    mpl.rc("font", size=font_size)  # controls default text sizes
+    mpl.rc("xtick", labelsize=font_size - 2)  # fontsize of the tick labels
+    mpl.rc("ytick", labelsize=font_size - 2)  # fontsize of the tick labels
+    mpl.rc("figure", titlesize=font_size + 2)  # fontsize of the figure title
+    mpl.rc("axes", titlesize=label_font_size)  # fontsize of the axes title
+    mpl.rc("axes", labelsize=label_font_size)  # fontsize of the x and y labels
+    mpl.rc("legend", fontsize=legend_font_size)  # legend fontsize
@@ -2,7 +2,9 @@
 from __future__ import annotations
 import re
 import configparser as cp
-from typing import Dict, Callable, Any, List
+from types import MappingProxyType
+from typing import Dict, Callable, Any, List, Mapping, Optional
+from attrs import define
 from pyfrag_plotter.config.validate import validate_config_key
 from pyfrag_plotter.errors import PyFragConfigValidationError
 
@@ -62,12 +64,16 @@ config_key_to_function_mapping: Dict[str, Callable[..., Any]] = {
     "colours": _get_list_str_key,
     "line_styles": _get_list_str_key,
     "outlier_threshold": _get_float_key,
+    "hampel_window": _get_int_key,
+    "hampel_threshold": _get_float_key,
     "trim_option": _get_any_key,
     "vline": _get_float_key,
     "trim_key": _get_str_key,
     "reverse_x_axis": _get_boolean_key,
     "stat_point_type": _get_str_key,
     "n_interpolation_points": _get_int_key,
+    "interpolation_tolerance": _get_float_key,
+    "interpolation_method": _get_str_key,
 
     # EDA keys
     "eda_keys": _get_list_str_key,
@@ -85,23 +91,70 @@ config_key_to_function_mapping: Dict[str, Callable[..., Any]] = {
 }
 
 
+@define(frozen=True)
+class ConfigSnapshot:
+    """Immutable snapshot of the typed values of the config file, such that looking up a value is a dictionary read instead of parsing the raw string.
+
+    Attributes:
+        sections (Mapping[str, Mapping[str, Any]]): The typed values of every option per section. List values are stored as tuples.
+
+    """
+
+    sections: Mapping[str, Mapping[str, Any]]
+
+    @classmethod
+    def compile(cls, config_parser: cp.ConfigParser) -> "ConfigSnapshot":
+        """Parses all options of all sections once. Options that cannot be parsed are left out, such that `Config.get` raises the parsing error when they are requested."""
+        sections: Dict[str, Mapping[str, Any]] = {}
+        for section in config_parser.sections():
+            values: Dict[str, Any] = {}
+            for option in config_parser[section]:
+                if option not in config_key_to_function_mapping:
+                    continue
+                try:
+                    value = config_key_to_function_mapping[option](config_parser, section, option)
+                except ValueError:
+                    continue
+                values[option] = tuple(value) if isinstance(value, list) else value
+            sections[section] = MappingProxyType(values)
+        return cls(MappingProxyType(sections))
+
+
+# Marks options that are not in the snapshot
+_MISSING = object()
+
+
 class Config:
     """An interface for the config file.
 
     This class overloads the get method of the ConfigParser class to ensure that the correct type is returned.
+    The typed values are compiled once into a `ConfigSnapshot` on first use, which is invalidated when the config is overwritten with `overwrite_config`.
 
     Attributes:
         config_parser (ConfigParser): The ConfigParser instance that contains the configuration data.
 
+    Note: the snapshot is not updated when the config_parser is modified directly. Use `overwrite_config` (or `invalidate_snapshot`) afterwards.
     """
 
     def __init__(self, config_parser) -> None:
         self.config_parser: cp.ConfigParser = config_parser
+        self._snapshot: Optional[ConfigSnapshot] = None
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The typed values of the config file, compiled on first access."""
+        if self._snapshot is None:
+            self._snapshot = ConfigSnapshot.compile(self.config_parser)
+        return self._snapshot
+
+    def invalidate_snapshot(self) -> None:
+        """Discards the compiled values, such that they are compiled again from the config parser on the next access."""
+        self._snapshot = None
 
     def get(self, section: str, option: str) -> Any:
         """Gets the value of the specified option in the specified section.
 
-        This method returns the value with the correct type.
+        This method returns the value with the correct type. The value is read from the compiled snapshot; lists are returned as new lists that can be modified by the caller.
 
         Args:
             section (str): The name of the section that contains the option.
@@ -115,6 +168,16 @@ class Config:
             ValueError: If the specified section is not a valid section.
 
         """
+        section_values = self.snapshot.sections.get(section)
+        if section_values is not None:
+            value = section_values.get(option.lower(), _MISSING)
+            if value is not _MISSING:
+                return list(value) if isinstance(value, tuple) else value
+
+        return self.parse(section, option)
+
+    def parse(self, section: str, option: str) -> Any:
+        """Parses the value of the specified option in the specified section from the config parser (without the snapshot). See `get`."""
         option = option.lower()
         if option not in config_key_to_function_mapping:
             raise ValueError(f"Option '{option}' is not a valid option. Valid options are {list(config_key_to_function_mapping.keys())}.\nPlease check the config file.")
@@ -145,9 +208,22 @@ class Config:
         """
         return {section: dict(self.config_parser[section]) for section in self.config_parser.sections()}
 
+    def raw_sections(self) -> Dict[str, Dict[str, str]]:
+        """Returns the raw (unparsed) values of the DEFAULT section and of every section, which can be read with ConfigParser.read_dict."""
+        sections = {"DEFAULT": dict(self.config_parser.defaults())}
+        sections.update({section: dict(self.config_parser.items(section, raw=True)) for section in self.sections})
+        return sections
+
+    def copy(self) -> Config:
+        """Returns an independent copy of the config, of which the config parser can be modified without affecting this config."""
+        config_parser = cp.ConfigParser()
+        config_parser.read_dict(self.raw_sections())
+        return Config(config_parser)
+
     def overwrite_config(self, config_parser: cp.ConfigParser):
         """ Overwrites the current config parser with a new config parser. This is used to overwrite the default config parser with a user-specified config parser with the |init| function."""
         self.config_parser = config_parser
+        self.invalidate_snapshot()
 
     def validate_config(self):
         """ Validates all available config keys. It checks whether:
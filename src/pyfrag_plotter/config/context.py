@@ -0,0 +1,111 @@
+""" Module for using a different configuration per task instead of the module-global config.
+
+The active configuration is stored in a context variable, such that concurrent tasks (threads or asyncio tasks) that enter their own `config_context` see their own settings.
+Functions that read the configuration resolve it with `get_config`: an explicitly passed config takes precedence over the config of the current context,
+which takes precedence over the global config (`pyfrag_plotter.config`, set by |init|).
+"""
+from __future__ import annotations
+
+import configparser as cp
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from pyfrag_plotter.config.config_handler import Config, config_key_to_function_mapping
+
+# The config file that contains the default values of all keys
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.ini")
+
+_active_config: ContextVar[Optional[Config]] = ContextVar("pyfrag_plotter_config", default=None)
+
+
+def get_config(config: Optional[Config] = None) -> Config:
+    """Returns the config that should be used: the explicitly passed config, else the config of the current `config_context`, else the global config."""
+    if config is not None:
+        return config
+
+    active_config = _active_config.get()
+    if active_config is not None:
+        return active_config
+
+    # Imported here, since the global config is created in the __init__ of the package that imports this module
+    import pyfrag_plotter
+
+    return pyfrag_plotter.config
+
+
+def _format_option_value(value: Any) -> str:
+    """Formats a Python value as the raw string of a config file, e.g. (1.0, 2.0) -> "1.0, 2.0" and True -> "true"."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def create_config(base: Optional[Config] = None, user_config_file: Optional[str] = None, **options: Any) -> Config:
+    """Creates a new (validated) config from a base config, a user config file and options that overwrite the values in all sections.
+
+    Args:
+        base (Optional[Config]): The config that is copied. Defaults to None, which reads the default config file of the package.
+        user_config_file (Optional[str]): The path to a config file of which the settings overwrite the base config. Defaults to None.
+        **options: The values of options (e.g. x_lim=(-1.0, 1.0) or trim_option="max") that overwrite the values in the base config and the user config file.
+
+    Raises:
+        ValueError: If an option is not a valid option.
+        PyFragConfigValidationError: If the resulting config is invalid.
+
+    Returns:
+        Config: The new config, which is independent of the base config.
+
+    """
+    if base is None:
+        config = Config(cp.ConfigParser())
+        config.config_parser.read(DEFAULT_CONFIG_FILE)
+    else:
+        config = base.copy()
+
+    if user_config_file is not None:
+        config.config_parser.read(user_config_file)
+
+    for option, value in options.items():
+        option = option.lower()
+        if option not in config_key_to_function_mapping:
+            raise ValueError(f"Option '{option}' is not a valid option. Valid options are {list(config_key_to_function_mapping.keys())}.")
+        raw_value = _format_option_value(value)
+        config.config_parser.set("DEFAULT", option, raw_value)
+        for section in config.sections:
+            config.config_parser.set(section, option, raw_value)
+
+    config.validate_config()
+    return config
+
+
+@contextmanager
+def config_context(config: Optional[Config] = None, user_config_file: Optional[str] = None, **options: Any) -> Iterator[Config]:
+    """Context manager that activates a config for the current context (thread or asyncio task) only.
+
+    Args:
+        config (Optional[Config]): The config to activate. Defaults to None, which uses the config that is currently used (see `get_config`).
+        user_config_file (Optional[str]): The path to a config file of which the settings overwrite the config. Defaults to None.
+        **options: The values of options that overwrite the config, see `create_config`. The config itself is not modified.
+
+    Yields:
+        Config: The active config.
+
+    Example:
+        >>> with config_context(x_lim=(-1.0, 1.0), trim_option="max"):
+        ...     obj = create_pyfrag_object_from_dir(pyfrag_dir)
+        ...     plotter.plot_asm()
+
+    """
+    active_config = get_config(config)
+    if user_config_file is not None or options:
+        active_config = create_config(active_config, user_config_file, **options)
+
+    token = _active_config.set(active_config)
+    try:
+        yield active_config
+    finally:
+        _active_config.reset(token)
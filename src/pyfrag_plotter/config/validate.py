@@ -8,6 +8,7 @@ ALLOWED_VALUES: Dict[str, Sequence[Any]] = {
     "trim_option": ["min", "max", "x_lim", "false"],
     "reverse_x_axis": ["false", "true"],
     "stat_point_type": ["min", "max", "none"],
+    "interpolation_method": ["linear", "pchip", "akima", "cubic", "smoothing"],
     "eda_keys": ["Int", "Pauli", "Elstat", "OI", "Disp"],
     "asm_keys": ["EnergyTotal", "StrainTotal", "Int"],
     "asm_strain_keys": ["StrainTotal", "frag1Strain", "frag2Strain"]
@@ -0,0 +1,291 @@
+""" Module that contains a persistent on-disk cache for the parsed PyFrag input files (.in) and results files (.txt).
+
+PyFrag result directories do not change once a job has finished, so parsing the same files over and over again is wasted work.
+The cache stores the parsed data in a compact binary format (.npz) and is content-addressed:
+
+    - A "stat key" is computed from the absolute path, size and modification time of a file. It points to the content hash of the file.
+    - The parsed data is stored under the content hash, such that identical files (e.g. copied result directories) share one entry.
+
+On a warm run only the file is stat-ed and the .npz file is loaded, i.e. no text parsing and no hashing of the file content is done.
+The cache is bounded in size by evicting the least recently used entries, together with the stat keys that point to them.
+
+The cache can be inspected and cleaned from the command line with `pyfrag-plotter-cache` (or `python -m pyfrag_plotter.input.cache`).
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pyfrag_plotter.input.read_inputfile import read_inputfile
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+
+# The cache directory can be set with an environment variable, which is useful for sharing a cache on a compute cluster
+CACHE_DIR_ENV_VARIABLE = "PYFRAG_PLOTTER_CACHE_DIR"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pyfrag_plotter")
+DEFAULT_MAX_SIZE = 512 * 1024**2  # bytes
+
+_BLOBS_DIR = "blobs"
+_STATS_DIR = "stats"
+
+
+def _hash_file_content(path: str, chunk_size: int = 1024**2) -> str:
+    """Returns the (blake2b) hash of the content of a file."""
+    file_hash = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _stat_key(path: str) -> str:
+    """Returns a key based on the absolute path, size and modification time of a file."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+    return hashlib.blake2b(key.encode(), digest_size=20).hexdigest()
+
+
+def _write_atomic(path: str, write_func: Callable[[Any], None]) -> None:
+    """Writes a file through a temporary file, such that concurrent readers (e.g. other processes) never see a partial file."""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write_func(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+# ====================================================================================================
+# Serialization of the parsed data ===================================================================
+# ====================================================================================================
+
+
+def _save_results(f, df: pd.DataFrame) -> None:
+    np.savez(
+        f,
+        values=df.to_numpy(),
+        index=df.index.to_numpy(),
+        index_name=np.array("" if df.index.name is None else df.index.name),
+        columns=np.array(df.columns, dtype=str),
+    )
+
+
+def _load_results(path: str) -> pd.DataFrame:
+    with np.load(path, allow_pickle=False) as data:
+        index_name = str(data["index_name"]) or None
+        index = pd.Index(data["index"], name=index_name)
+        return pd.DataFrame(data["values"], index=index, columns=data["columns"].tolist())
+
+
+def _save_inputfile(f, inputfile_data: Dict[str, Any]) -> None:
+    # The values are tuples, lists or strings. JSON does not know tuples, so the type is stored alongside the value.
+    encoded = {key: [type(value).__name__, value] for key, value in inputfile_data.items()}
+    np.savez(f, inputfile_data=np.array(json.dumps(encoded)))
+
+
+def _load_inputfile(path: str) -> Dict[str, Any]:
+    with np.load(path, allow_pickle=False) as data:
+        encoded = json.loads(str(data["inputfile_data"]))
+    return {key: tuple(value) if type_name == "tuple" else value for key, (type_name, value) in encoded.items()}
+
+
+_SERIALIZERS: Dict[str, Tuple[Callable[[str], Any], Callable[[Any, Any], None], Callable[[str], Any]]] = {
+    # kind: (parse function, save function, load function)
+    "inputfile": (read_inputfile, _save_inputfile, _load_inputfile),
+    "results": (read_results_file, _save_results, _load_results),
+}
+
+
+# ====================================================================================================
+# Cache ==============================================================================================
+# ====================================================================================================
+
+
+class ParseCache:
+    """A persistent, content-addressed and size-bounded cache for parsed PyFrag input and results files.
+
+    Attributes:
+        cache_dir (str): The directory containing the cache.
+        max_size (int): The maximum size of the cache in bytes. If exceeded, the least recently used entries are removed.
+        hits (int): The number of files that were loaded from the cache.
+        misses (int): The number of files that had to be parsed.
+
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.cache_dir = os.environ.get(CACHE_DIR_ENV_VARIABLE, DEFAULT_CACHE_DIR) if cache_dir is None else cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None
+
+        os.makedirs(os.path.join(self.cache_dir, _BLOBS_DIR), exist_ok=True)
+        os.makedirs(os.path.join(self.cache_dir, _STATS_DIR), exist_ok=True)
+
+    def read_inputfile(self, inputfile: str) -> Dict[str, Any]:
+        """Returns the parsed input file (see `read_inputfile`), either from the cache or by parsing the file."""
+        return self._get("inputfile", inputfile)
+
+    def read_results_file(self, results_file: str) -> pd.DataFrame:
+        """Returns the parsed results file (see `read_results_file`), either from the cache or by parsing the file."""
+        return self._get("results", results_file)
+
+    def _get(self, kind: str, path: str) -> Any:
+        parse_func, save_func, load_func = _SERIALIZERS[kind]
+
+        stat_path = os.path.join(self.cache_dir, _STATS_DIR, _stat_key(path))
+        try:
+            with open(stat_path, "r") as f:
+                content_hash = f.read().strip()
+        except FileNotFoundError:
+            # Unknown (or modified) file: the content hash is computed and stored for the next time
+            content_hash = _hash_file_content(path)
+            _write_atomic(stat_path, lambda f: f.write(content_hash.encode()))
+            if self._size is not None:
+                self._size += os.path.getsize(stat_path)
+
+        blob_path = os.path.join(self.cache_dir, _BLOBS_DIR, f"{kind}_{content_hash}.npz")
+        try:
+            data = load_func(blob_path)
+            os.utime(blob_path)  # marks the entry as recently used
+            self.hits += 1
+            return data
+        except FileNotFoundError:
+            pass
+
+        self.misses += 1
+        data = parse_func(path)
+        _write_atomic(blob_path, lambda f: save_func(f, data))
+
+        self._size = self._compute_size() if self._size is None else self._size + os.path.getsize(blob_path)
+        if self._size > self.max_size:
+            self.prune()
+        return data
+
+    def _blobs(self) -> List[os.DirEntry]:
+        with os.scandir(os.path.join(self.cache_dir, _BLOBS_DIR)) as entries:
+            return [entry for entry in entries if entry.name.endswith(".npz")]
+
+    def _stats(self) -> List[os.DirEntry]:
+        with os.scandir(os.path.join(self.cache_dir, _STATS_DIR)) as entries:
+            return [entry for entry in entries if not entry.name.endswith(".tmp")]
+
+    def _compute_size(self) -> int:
+        return sum(entry.stat().st_size for entry in self._blobs()) + sum(entry.stat().st_size for entry in self._stats())
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached entries and the stat keys that point to them in bytes."""
+        return self._compute_size()
+
+    @property
+    def n_entries(self) -> int:
+        """The number of cached entries."""
+        return len(self._blobs())
+
+    def prune(self, max_size: Optional[int] = None) -> int:
+        """Removes the least recently used entries until the cache is smaller than `max_size` (defaults to the max_size of the cache).
+
+        The stat keys that point to the content hash of a removed entry (or to no entry at all) are removed as well, and count towards the size of the cache.
+
+        Returns:
+            int: The number of removed entries.
+
+        """
+        max_size = self.max_size if max_size is None else max_size
+
+        # Oldest entries (least recently used) first. The blobs of the different kinds of files with the same content share the stat keys
+        blobs = sorted(((entry.stat().st_mtime, entry.stat().st_size, entry.path, entry.name[:-len(".npz")].split("_", 1)[-1]) for entry in self._blobs()))
+        n_blobs_per_hash: Dict[str, int] = {}
+        for *_, content_hash in blobs:
+            n_blobs_per_hash[content_hash] = n_blobs_per_hash.get(content_hash, 0) + 1
+
+        # The stat keys per content hash
+        stats: Dict[str, List[Tuple[str, int]]] = {}
+        for entry in self._stats():
+            try:
+                with open(entry.path, "r") as f:
+                    content_hash = f.read().strip()
+                stats.setdefault(content_hash, []).append((entry.path, entry.stat().st_size))
+            except FileNotFoundError:
+                pass
+
+        def remove_stats(content_hash: str) -> int:
+            removed_size = 0
+            for stat_path, stat_size in stats.pop(content_hash, []):
+                try:
+                    os.remove(stat_path)
+                except FileNotFoundError:
+                    pass
+                removed_size += stat_size
+            return removed_size
+
+        # Stat keys of which the entry has been removed before (or was never written)
+        for content_hash in [content_hash for content_hash in stats if content_hash not in n_blobs_per_hash]:
+            remove_stats(content_hash)
+
+        size = sum(blob_size for _, blob_size, _, _ in blobs) + sum(stat_size for entries in stats.values() for _, stat_size in entries)
+
+        n_removed = 0
+        for _, blob_size, blob_path, content_hash in blobs:
+            if size <= max_size:
+                break
+            try:
+                os.remove(blob_path)
+            except FileNotFoundError:
+                pass
+            size -= blob_size
+            n_removed += 1
+
+            n_blobs_per_hash[content_hash] -= 1
+            if n_blobs_per_hash[content_hash] == 0:
+                size -= remove_stats(content_hash)
+
+        self._size = size
+        return n_removed
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(os.path.join(self.cache_dir, _BLOBS_DIR), exist_ok=True)
+        os.makedirs(os.path.join(self.cache_dir, _STATS_DIR), exist_ok=True)
+        self._size = 0
+
+
+# ====================================================================================================
+# Command line interface =============================================================================
+# ====================================================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line interface for inspecting, pruning and clearing the parse cache."""
+    parser = argparse.ArgumentParser(prog="pyfrag-plotter-cache", description="Inspect, prune or clear the pyfrag_plotter parse cache.")
+    parser.add_argument("command", choices=["info", "prune", "clear"])
+    parser.add_argument("--cache-dir", default=None, help=f"The cache directory. Defaults to ${CACHE_DIR_ENV_VARIABLE} or {DEFAULT_CACHE_DIR}.")
+    parser.add_argument("--max-size", type=float, default=DEFAULT_MAX_SIZE / 1024**2, help="The maximum size of the cache in MB (used by 'prune').")
+    args = parser.parse_args(argv)
+
+    cache = ParseCache(cache_dir=args.cache_dir, max_size=int(args.max_size * 1024**2))
+
+    if args.command == "prune":
+        n_removed = cache.prune()
+        print(f"Removed {n_removed} entries from {cache.cache_dir}")
+    elif args.command == "clear":
+        cache.clear()
+        print(f"Cleared {cache.cache_dir}")
+
+    print(f"{cache.cache_dir}: {cache.n_entries} entries, {cache.size / 1024**2:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
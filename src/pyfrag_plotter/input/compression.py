@@ -0,0 +1,57 @@
+""" Module for reading (archived) compressed PyFrag files, e.g. "pyfrag_ureas.txt.gz" or "ureas.in.xz".
+
+The files are decompressed while they are read (streaming), so no decompressed copies are written to disk.
+The gzip (.gz), bzip2 (.bz2) and xz (.xz) formats are supported by the standard library. The zstandard (.zst) format requires the optional `zstandard` package.
+"""
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+from typing import IO, Callable, Dict
+
+
+def _open_zstd(path: str) -> IO[bytes]:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(f"Reading {path} requires the zstandard package. Install it with 'pip install zstandard'.") from e
+
+    return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+
+
+# Extension of the compressed file: function that opens the file as a binary stream of the decompressed content
+COMPRESSED_FILE_OPENERS: Dict[str, Callable[[str], IO[bytes]]] = {
+    ".gz": lambda path: gzip.open(path, "rb"),
+    ".bz2": lambda path: bz2.open(path, "rb"),
+    ".xz": lambda path: lzma.open(path, "rb"),
+    ".zst": _open_zstd,
+}
+
+
+def strip_compression_extension(filename: str) -> str:
+    """Removes the compression extension (if any) from the filename, e.g. "pyfrag_ureas.txt.gz" -> "pyfrag_ureas.txt"."""
+    root, extension = os.path.splitext(filename)
+    return root if extension in COMPRESSED_FILE_OPENERS else filename
+
+
+def is_compressed(filename: str) -> bool:
+    """Returns whether the file is compressed, based on its extension."""
+    return os.path.splitext(filename)[1] in COMPRESSED_FILE_OPENERS
+
+
+def open_binary(path: str) -> IO[bytes]:
+    """Opens a (possibly compressed) file for reading its (decompressed) content as bytes."""
+    extension = os.path.splitext(path)[1]
+    if extension in COMPRESSED_FILE_OPENERS:
+        return COMPRESSED_FILE_OPENERS[extension](path)
+    return open(path, "rb")
+
+
+def open_text(path: str) -> IO[str]:
+    """Opens a (possibly compressed) file for reading its (decompressed) content as text."""
+    if not is_compressed(path):
+        return open(path, "r")
+    return io.TextIOWrapper(open_binary(path))
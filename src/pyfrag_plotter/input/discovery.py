@@ -0,0 +1,173 @@
+""" Module for discovering PyFrag job directories in a (large) campaign directory.
+
+A campaign root is walked with os.scandir, skipping subtrees that never contain PyFrag jobs (restart folders, AMS/PLAMS scratch directories, hidden directories).
+A directory containing a pyfrag input file (.in) and a pyfrag results file (pyfrag*.txt) is a job directory and is not descended into further.
+
+The result of a walk can be persisted in a small JSON index. The next discovery only re-scans directories whose modification time changed,
+which on a shared filesystem reduces a walk over tens of thousands of directories to one stat call per directory.
+"""
+from __future__ import annotations
+
+import fnmatch
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from attrs import define, field
+
+from pyfrag_plotter.input.pyfrag_files import find_candidate_files, select_pyfrag_files
+
+# Directory names (glob patterns) that are not searched for PyFrag jobs
+DEFAULT_EXCLUDE_PATTERNS: Sequence[str] = (
+    "restart*",
+    "*_restart",
+    "*.results",
+    "plams_workdir*",
+    "ams.*",
+    "__pycache__",
+    ".*",
+)
+
+_INDEX_VERSION = 1
+
+
+@define
+class PyFragJob:
+    """Attrs class containing the files of one PyFrag job directory.
+
+    Attributes:
+        directory (str): The absolute path to the job directory.
+        input_file (str): The absolute path to the pyfrag input file (.in).
+        results_file (str): The absolute path to the pyfrag results file (pyfrag*.txt).
+        mtime_ns (int): The modification time of the directory in nanoseconds at the time of discovery.
+
+    """
+
+    directory: str
+    input_file: str
+    results_file: str
+    mtime_ns: int
+
+
+@define
+class DiscoveryResult:
+    """Attrs class containing the result of walking a campaign directory.
+
+    Attributes:
+        jobs (List[PyFragJob]): The job directories sorted by path.
+        ambiguous (Dict[str, Tuple[List[str], List[str]]]): Directories with multiple candidate input or results files that could not be matched by name,
+            mapped to the candidate (input files, results files).
+        n_scanned (int): The number of directories that were listed (i.e. not taken from the index).
+
+    """
+
+    jobs: List[PyFragJob] = field(factory=list)
+    ambiguous: Dict[str, Tuple[List[str], List[str]]] = field(factory=dict)
+    n_scanned: int = 0
+
+    @property
+    def directories(self) -> List[str]:
+        """The job directories, which can be passed directly to `create_pyfrag_objects_from_dirs`."""
+        return [job.directory for job in self.jobs]
+
+
+def _is_excluded(dirname: str, exclude: Sequence[str]) -> bool:
+    return any(fnmatch.fnmatch(dirname, pattern) for pattern in exclude)
+
+
+def _scan_directory(directory: str, mtime_ns: int, exclude: Sequence[str]) -> Dict[str, Any]:
+    """Lists one directory and returns its index entry."""
+    input_files, results_files, subdirs = find_candidate_files(directory)
+    return {
+        "mtime_ns": mtime_ns,
+        "input_files": input_files,
+        "results_files": results_files,
+        "subdirs": [subdir for subdir in subdirs if not _is_excluded(os.path.basename(subdir), exclude)],
+    }
+
+
+def _load_index(index_file: Optional[str], root: str, exclude: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """Loads the index if it exists and was created with the same root and exclude patterns."""
+    if index_file is None or not os.path.isfile(index_file):
+        return {}
+
+    try:
+        with open(index_file, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        logging.log(logging.WARNING, f"Could not read discovery index {index_file}. Walking the whole directory tree.")
+        return {}
+
+    if index.get("version") != _INDEX_VERSION or index.get("root") != root or index.get("exclude") != list(exclude):
+        return {}
+    return index["directories"]
+
+
+def _save_index(index_file: str, root: str, exclude: Sequence[str], directories: Dict[str, Dict[str, Any]]) -> None:
+    temp_file = f"{index_file}.tmp"
+    with open(temp_file, "w") as f:
+        json.dump({"version": _INDEX_VERSION, "root": root, "exclude": list(exclude), "directories": directories}, f)
+    os.replace(temp_file, index_file)
+
+
+def discover_pyfrag_jobs(root: str, index_file: Optional[str] = None, exclude: Sequence[str] = DEFAULT_EXCLUDE_PATTERNS) -> DiscoveryResult:
+    """Recursively searches a campaign directory for PyFrag job directories.
+
+    Args:
+        root (str): The campaign directory to search.
+        index_file (Optional[str]): A JSON file to persist the directory index in. If it exists, only directories that changed since the last discovery are listed. Defaults to None (no index).
+        exclude (Sequence[str]): Glob patterns of directory names that are skipped (including their subdirectories). Defaults to DEFAULT_EXCLUDE_PATTERNS.
+
+    Raises:
+        NotADirectoryError: If the root is not a directory.
+
+    Returns:
+        DiscoveryResult: The discovered job directories and the ambiguous directories.
+
+    Note: symbolic links to directories are not followed.
+    """
+    if not os.path.isdir(root):
+        raise NotADirectoryError(f"{root} is not a directory")
+
+    root = os.path.abspath(root)
+    old_index = _load_index(index_file, root, exclude)
+    new_index: Dict[str, Dict[str, Any]] = {}
+    result = DiscoveryResult()
+
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            continue
+
+        # The modification time of a directory changes when entries are added, removed or renamed, so an unchanged directory does not need to be listed again
+        entry = old_index.get(directory)
+        if entry is None or entry["mtime_ns"] != mtime_ns:
+            entry = _scan_directory(directory, mtime_ns, exclude)
+            result.n_scanned += 1
+        new_index[directory] = entry
+
+        input_files, results_files = entry["input_files"], entry["results_files"]
+        if input_files and results_files:
+            selected_files = select_pyfrag_files(input_files, results_files)
+            if selected_files is None:
+                result.ambiguous[directory] = (input_files, results_files)
+            else:
+                result.jobs.append(PyFragJob(directory, selected_files[0], selected_files[1], mtime_ns))
+            # Job directories only contain scratch directories of the job itself
+            continue
+
+        stack.extend(reversed(entry["subdirs"]))
+
+    result.jobs.sort(key=lambda job: job.directory)
+
+    for directory, (input_files, results_files) in result.ambiguous.items():
+        logging.log(logging.WARNING, f"Skipping {directory}: multiple pyfrag input files {input_files} or txt files {results_files} found.")
+
+    if index_file is not None:
+        _save_index(index_file, root, exclude, new_index)
+
+    return result
@@ -1,6 +1,67 @@
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
+import logging
 import os
 
+from pyfrag_plotter.input.compression import strip_compression_extension
+
+
+def is_pyfrag_input_file(filename: str) -> bool:
+    """Returns whether the filename is a (candidate) pyfrag input file, e.g. "ureas.in" or "ureas.in.gz"."""
+    return strip_compression_extension(filename).endswith('.in')
+
+
+def is_pyfrag_results_file(filename: str) -> bool:
+    """Returns whether the filename is a (candidate) pyfrag results file, e.g. "pyfrag_ureas.txt" or "pyfrag_ureas.txt.xz"."""
+    return filename.startswith('pyfrag') and strip_compression_extension(filename).endswith('.txt')
+
+
+def select_pyfrag_files(input_files: Sequence[str], results_files: Sequence[str]) -> Optional[Tuple[str, str]]:
+    """Selects the pyfrag input file and results file from the candidate files found in a directory.
+
+    If there is exactly one candidate of each, these are returned. If there are multiple candidates, the pair with matching names
+    (e.g. "ureas.in" and "pyfrag_ureas.txt") is returned. Otherwise, the directory is ambiguous and None is returned.
+
+    Args:
+        input_files (Sequence[str]): The candidate input files (file names or paths).
+        results_files (Sequence[str]): The candidate results files (file names or paths).
+
+    Returns:
+        Optional[Tuple[str, str]]: The selected input file and results file, or None if the selection is ambiguous (or if a file is missing).
+
+    """
+    if not input_files or not results_files:
+        return None
+
+    if len(input_files) == 1 and len(results_files) == 1:
+        return input_files[0], results_files[0]
+
+    # "pyfrag_ureas.txt" belongs to "ureas.in" (also if one or both of them are compressed)
+    matching_pairs = [
+        (input_file, results_file)
+        for input_file in input_files
+        for results_file in results_files
+        if strip_compression_extension(os.path.basename(results_file))[len('pyfrag'):].lstrip('_') == strip_compression_extension(os.path.basename(input_file))[:-len('.in')] + '.txt'
+    ]
+    if len(matching_pairs) == 1:
+        return matching_pairs[0]
+    return None
+
+
+def find_candidate_files(pyfrag_dir: str) -> Tuple[List[str], List[str], List[str]]:
+    """Scans a directory once (with os.scandir) and returns the candidate input files, candidate results files and the subdirectories (all sorted absolute paths)."""
+    input_files: List[str] = []
+    results_files: List[str] = []
+    subdirs: List[str] = []
+    with os.scandir(pyfrag_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif is_pyfrag_input_file(entry.name):
+                input_files.append(entry.path)
+            elif is_pyfrag_results_file(entry.name):
+                results_files.append(entry.path)
+    return sorted(input_files), sorted(results_files), sorted(subdirs)
+
 
 def get_pyfrag_files(pyfrag_dir: str) -> Tuple[str, str]:
     """Searches for pyfrag input files and pyfrag txt files in a given folder and returns a tuple containing the absolute path to the pyfrag input file and the pyfrag txt file
@@ -15,24 +76,20 @@ def get_pyfrag_files(pyfrag_dir: str) -> Tuple[str, str]:
     Returns:
         List[Tuple[str, str]]: A list of tuples containing the absolute path to the pyfrag input file and the pyfrag txt file.
 
+    Note: if the folder contains multiple candidate files that cannot be matched by name, a warning is logged and the first files (in alphabetical order) are used.
     """
     if not os.path.isdir(pyfrag_dir):
         raise NotADirectoryError(f"{pyfrag_dir} is not a directory")
 
-    files = os.listdir(pyfrag_dir)
-
-    # Search for pyfrag input file and pyfrag txt file
-    pyfrag_input_file = ""
-    pyfrag_txt_file = ""
-    for file in files:
-        if file.endswith('.in'):
-            pyfrag_input_file = os.path.join(pyfrag_dir, file)
-        if file.startswith('pyfrag') and file.endswith('.txt'):
-            pyfrag_txt_file = os.path.join(pyfrag_dir, file)
+    input_files, results_files, _ = find_candidate_files(pyfrag_dir)
 
     # Check if both files were found
-    if not (pyfrag_input_file and pyfrag_txt_file):
+    if not (input_files and results_files):
         raise FileNotFoundError(f"Could not find pyfrag input file or pyfrag txt file in {pyfrag_dir}")
 
-    # Add the files to the list as a tuple
-    return pyfrag_input_file, pyfrag_txt_file
+    selected_files = select_pyfrag_files(input_files, results_files)
+    if selected_files is None:
+        logging.log(logging.WARNING, f"Multiple pyfrag input files {input_files} or txt files {results_files} found in {pyfrag_dir}. Using {input_files[0]} and {results_files[0]}.")
+        selected_files = input_files[0], results_files[0]
+
+    return selected_files
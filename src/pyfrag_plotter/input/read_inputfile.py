@@ -3,36 +3,47 @@ import os
 from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
 
 from pyfrag_plotter.errors import PyFragInputError
+from pyfrag_plotter.input.compression import open_text
+
+
+_SECTION_START_PATTERN = re.compile(r"^\s*PyFrag\s*$", re.IGNORECASE)
+_SECTION_END_PATTERN = re.compile(r"^\s*PyFrag END\s*$", re.IGNORECASE)
+_COMMENT_PATTERN = re.compile(r"\s*[#!;:]\s*")
 
 
 def _extract_pyfrag_section(filename: str) -> List[str]:
-    with open(filename, "r") as f:
-        lines = f.readlines()
+    """Returns the lines between "PyFrag" and "PyFrag END". The file is read line by line and reading stops at "PyFrag END", so the (possibly large) AMS blocks are skipped."""
+    section: List[str] = []
+    in_section = False
 
-    start_index = -1
-    end_index = -1
+    with open_text(filename) as f:
+        for line in f:
+            if _SECTION_END_PATTERN.match(line):
+                if in_section:
+                    return section
+                break
+            if _SECTION_START_PATTERN.match(line):
+                in_section = True
+                section = []
+            elif in_section:
+                section.append(line)
 
-    for i, line in enumerate(lines):
-        if re.match(r"^\s*PyFrag\s*$", line, re.IGNORECASE):
-            start_index = i+1
-        if re.match(r"^\s*PyFrag END\s*$", line, re.IGNORECASE):
-            end_index = i-1
-            break
+    raise ValueError("Could not find PyFrag section in file. Check if the lines 'PyFrag' and 'PyFrag END' are present in the file.")
 
-    if any(index == -1 for index in (start_index, end_index)):
-        raise ValueError("Could not find PyFrag section in file. Check if the lines 'PyFrag' and 'PyFrag END' are present in the file.")
 
-    return lines[start_index:end_index+1]
+def _tokenize_line(line: str) -> List[str]:
+    """Removes the comment (starting with #, !, ; or :) from the line and splits the line into its fields."""
+    return _COMMENT_PATTERN.split(line.strip(), maxsplit=1)[0].split()
 
 
-def _check_line_length(line: str, input_key: str, limits: Sequence[int]) -> List[str]:
+def _check_line_length(line: Union[str, List[str]], input_key: str, limits: Sequence[int]) -> List[str]:
     """Checks if the line has the correct length for reading the specified input key.
 
     This function checks if the line has the correct length for reading the specified input key. If the line does not have the correct length, an error is raised.
     The function returns a list containing the values of the line.
 
     Args:
-        line (str): The line containing the keyword and the values.
+        line (Union[str, List[str]]): The line containing the keyword and the values, or the fields of the line if it has already been tokenized.
         input_key (str): The keyword to be read.
         limits (Sequence[int]): The limits of the length of the line such as (3, 4) for bondlength and angle.
 
@@ -43,14 +54,14 @@ def _check_line_length(line: str, input_key: str, limits: Sequence[int]) -> List
         List[str]: A list containing the values of the line.
 
     """
-    line_content: list[str] = re.split(r"\s*[#!;:]\s*", line.strip())[0].split()
+    line_content: List[str] = _tokenize_line(line) if isinstance(line, str) else line
 
     if len(line_content) not in limits:
         raise PyFragInputError(f"Length of the {input_key} not correct. Make sure to specify the correct format", input_key)
     return line_content
 
 
-def _read_bondlength_line(line: str) -> Tuple[int, int, float]:
+def _read_bondlength_line(line: Union[str, List[str]]) -> Tuple[int, int, float]:
     """Reads the line containing the "bondlength" keyword. The correct format for the line is:
 
     bondlength atom1 atom2 [bondlength] (optional)
@@ -68,7 +79,7 @@ def _read_bondlength_line(line: str) -> Tuple[int, int, float]:
     return int(atom1), int(atom2), float(bondlength)
 
 
-def _read_bondangle_line(line: str) -> Tuple[int, int, float]:
+def _read_bondangle_line(line: Union[str, List[str]]) -> Tuple[int, int, float]:
     """Reads the line containing the "angle" keyword. The correct format for the line is:
 
     angle atom1 atom2 [angle] (optional)
@@ -86,7 +97,7 @@ def _read_bondangle_line(line: str) -> Tuple[int, int, float]:
     return int(atom1), int(atom2), float(angle)
 
 
-def _read_dihedral_angle(line: str) -> Tuple[int, int, int, float]:
+def _read_dihedral_angle(line: Union[str, List[str]]) -> Tuple[int, int, int, float]:
     """Reads the line containing the "dihedral" keyword. The correct format for the line is:
 
     dihedral atom1 atom2 atom3 [dihedral_angle] (optional)
@@ -104,7 +115,7 @@ def _read_dihedral_angle(line: str) -> Tuple[int, int, int, float]:
     return int(atom1), int(atom2), int(atom3), float(dihedral_angle)
 
 
-def _read_overlap_line(line: str) -> Union[Tuple[str, str, str, str, str, str], Tuple[str, str, str, str]]:
+def _read_overlap_line(line: Union[str, List[str]]) -> Union[Tuple[str, str, str, str, str, str], Tuple[str, str, str, str]]:
     """Reads the line containing the "overlap" keyword. The correct formats are:
 
     overlap frag1 HOMO frag2 LUMO
@@ -125,7 +136,7 @@ def _read_overlap_line(line: str) -> Union[Tuple[str, str, str, str, str, str],
     return str(irrep1), str(frag1), str(index1), str(irrep2), str(frag2), str(index2)
 
 
-def _read_population_line(line: str) -> Union[Tuple[str, str], Tuple[str, str, str]]:
+def _read_population_line(line: Union[str, List[str]]) -> Union[Tuple[str, str], Tuple[str, str, str]]:
     """Reads the line containing the "population" keyword. The correct formats are:
 
     population frag1 HOMO
@@ -144,7 +155,7 @@ def _read_population_line(line: str) -> Union[Tuple[str, str], Tuple[str, str, s
     return str(irrep1), str(frag1), str(index1)
 
 
-def _read_orbitalenergy_line(line: str) -> Union[Tuple[str, str], Tuple[str, str, str]]:
+def _read_orbitalenergy_line(line: Union[str, List[str]]) -> Union[Tuple[str, str], Tuple[str, str, str]]:
     """Reads the line containing the "orbitalenergy" keyword. The correct formats are:
 
     orbitalenergy frag1 HOMO
@@ -163,14 +174,14 @@ def _read_orbitalenergy_line(line: str) -> Union[Tuple[str, str], Tuple[str, str
     return str(irrep1), str(frag1), str(index1)
 
 
-def _read_vdd_line(line: str) -> List[int]:
+def _read_vdd_line(line: Union[str, List[str]]) -> List[int]:
     """Reads the line containing the "vdd" keyword. The correct formats are:
 
     vdd 1 2 3 4
     vdd 3 6 8
 
     """
-    line_content: list[str] = re.split(r"\s*[#!;:]\s*", line.strip())[0].split()
+    line_content: List[str] = _tokenize_line(line) if isinstance(line, str) else line
     try:
         all([int(atom_index) for atom_index in line_content[1:]])
     except ValueError:
@@ -179,7 +190,7 @@ def _read_vdd_line(line: str) -> List[int]:
     return [int(atom_index) for atom_index in line_content[1:]]
 
 
-def _read_irrep_line(line: str) -> List[str]:
+def _read_irrep_line(line: Union[str, List[str]]) -> List[str]:
     """Reads the line containing the "irrep" keyword. The correct formats are:
 
     irrepOI AA
@@ -204,11 +215,17 @@ read_functions: Dict[str, Callable] = {
 }
 
 
+# Maps the leading keyword of a line (lowercase) to the key in the returned dictionary and the function that reads the line
+_line_readers: Dict[str, Tuple[str, Callable]] = {key.lower(): (key, func) for key, func in read_functions.items()}
+_line_readers["irrepoi"] = ("irrep", _read_irrep_line)
+
+
 def read_inputfile(inputfile: str) -> Dict[str, Any]:
     """Extracts extra specifications from the PyFrag input file.
 
     This function takes the PyFrag input file as an argument and extracts extra specifications such as orbitalenergy, overlap, population of a certain fragment and MO.
     The function returns a dictionary containing the extracted specifications.
+    Each line of the PyFrag section is tokenized once and dispatched on its leading keyword (e.g. "bondlength" or "irrepOI").
 
     Args:
         inputfile (str): The PyFrag input file.
@@ -223,15 +240,20 @@ def read_inputfile(inputfile: str) -> Dict[str, Any]:
 
     counter = {key: 0 for key in read_functions}
     for line in pyfrag_section:
+        line_content = _tokenize_line(line)
+        if not line_content:
+            continue
+
+        keyword = line_content[0].lower()
 
         # Property keys such as bondlength, angle, dihedral, overlap, population, orbitalenergy, vdd
-        for key, func in read_functions.items():
-            if key.lower() in line.lower():
-                counter[key] += 1
-                input_keys[f"{key}_{counter[key]}"] = func(line)
+        if keyword in _line_readers:
+            key, func = _line_readers[keyword]
+            counter[key] += 1
+            input_keys[f"{key}_{counter[key]}"] = func(line_content)
 
         # Special keys such as name
-        if "name" in line.lower():
+        elif keyword == "name":
             input_keys["name"] = line.split()[1]
 
     # Add the name of the inputfile to the dictionary if it is not specified in the inputfile
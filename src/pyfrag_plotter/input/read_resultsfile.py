@@ -1,26 +1,316 @@
+import fnmatch
+import io
+import os
+import warnings
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+from attrs import define, field
+
+from pyfrag_plotter.errors import PyFragResultsProcessingError
+from pyfrag_plotter.input.compression import is_compressed, open_binary, open_text
+
+# Headers that PyFrag writes without a suffix when only one of them is specified in the input file
+SINGLE_COORDINATE_HEADERS: Sequence[str] = ("bondlength", "angle", "dihedral")
+
+
+def _rename_single_coordinate_headers(headers: Sequence[str]) -> List[str]:
+    """Renames single IRC coordinates (e.g. "bondlength") to their indexed counterpart (e.g. "bondlength_1")."""
+    headers = list(headers)
+    for header in SINGLE_COORDINATE_HEADERS:
+        if header in headers and not any(col.startswith(f"{header}_") for col in headers):
+            headers = [f"{header}_1" if col == header else col for col in headers]
+    return headers
+
+
+def _parse_numeric_block(body: str, n_columns: int, dtype: npt.DTypeLike) -> np.ndarray:
+    """Converts the whitespace-separated body of a results file into a 2D array with shape (n_rows, n_columns).
+
+    The whole body is converted in bulk by the NumPy text parser, which checks that every row contains the same number of values. Only if a row does not fit
+    the header (e.g. the last row is still being written by PyFrag) the rows are parsed one by one and padded with NaN values.
+    """
+    try:
+        with warnings.catch_warnings():
+            # NumPy warns when the body does not contain any rows yet, which is handled below
+            warnings.simplefilter("ignore", UserWarning)
+            values = np.loadtxt(io.StringIO(body), dtype=dtype, comments=None, ndmin=2)
+    except ValueError:
+        values = None
+
+    # Checking the rows (instead of only the total number of values) prevents ragged rows from being reshaped across the row boundaries
+    if values is not None and values.shape[1] == n_columns:
+        return values
+
+    rows = [line.split() for line in body.splitlines()]
+    rows = [row for row in rows if row]
+    block = np.full((len(rows), n_columns), np.nan, dtype=dtype)
+    for i, row in enumerate(rows):
+        if len(row) > n_columns:
+            raise PyFragResultsProcessingError(key="read_results_file", message=f"Row {i + 1} contains {len(row)} values while the header only specifies {n_columns} columns.")
+        block[i, :len(row)] = np.array(row, dtype=dtype)
+    return block
+
+
+def _parse_numeric_columns(results_file: str, n_columns: int, column_indices: Sequence[int], dtype: npt.DTypeLike) -> np.ndarray:
+    """Converts only the specified columns of the body of a results file into a 2D array with shape (n_rows, len(column_indices)).
+
+    The file is streamed by the NumPy text parser, which skips the values of the other columns instead of converting them.
+    Rows that do not fit the header are handled by `_parse_numeric_block`.
+    """
+    with open_text(results_file) as f:
+        f.readline()
+        try:
+            with warnings.catch_warnings():
+                # NumPy warns when the file does not contain any rows yet, which is fine
+                warnings.simplefilter("ignore", UserWarning)
+                return np.loadtxt(f, dtype=dtype, usecols=column_indices, ndmin=2)
+        except ValueError:
+            pass
+
+    # The file is opened again, since compressed streams cannot always be rewound
+    with open_text(results_file) as f:
+        f.readline()
+        body = f.read()
+    return _parse_numeric_block(body, n_columns, dtype)[:, column_indices]
 
 
-def read_results_file(results_file: str) -> pd.DataFrame:
+def _parse_numeric_chunk(body: str, n_columns: int, column_indices: Sequence[int], dtype: npt.DTypeLike) -> np.ndarray:
+    """Converts the specified columns of a part of the body of a results file, skipping the values of the other columns like `_parse_numeric_columns`."""
+    if len(column_indices) < n_columns:
+        try:
+            return np.loadtxt(io.StringIO(body), dtype=dtype, usecols=column_indices, ndmin=2)
+        except ValueError:
+            pass
+    return _parse_numeric_block(body, n_columns, dtype)[:, column_indices]
+
+
+def read_results_header(results_file: str) -> List[str]:
+    """Reads only the header of a results file and returns the column names, starting with the name of the index column (#IRC)."""
+    with open_text(results_file) as f:
+        header = f.readline().split()
+
+    if not header:
+        raise PyFragResultsProcessingError(key="read_results_file", message=f"No header found in {results_file}.")
+
+    return header[:1] + _rename_single_coordinate_headers(header[1:])
+
+
+def select_columns(header: Sequence[str], columns: Sequence[str]) -> List[str]:
+    """Returns the columns of the header that match any of the column names or glob patterns (e.g. "bondlength_*"), in the order of the header."""
+    patterns = [column for column in columns if any(char in column for char in "*?[")]
+    names = set(columns)
+    return [column for column in header if column in names or any(fnmatch.fnmatchcase(column, pattern) for pattern in patterns)]
+
+
+def _read_results_columns(results_file: str, columns: Sequence[str], dtype: npt.DTypeLike = np.float64) -> pd.DataFrame:
+    """Reads only the specified columns of the results file. The other columns are skipped while parsing. See `read_results_file` for the format of the returned DataFrame."""
+    header = read_results_header(results_file)
+
+    missing_columns = [column for column in columns if column not in header[1:]]
+    if missing_columns:
+        raise KeyError(f"Columns {missing_columns} not found in {results_file}. Available columns are {header[1:]}.")
+
+    column_indices = [0] + [header.index(column) for column in columns]
+    block = _parse_numeric_columns(results_file, len(header), column_indices, dtype)
+
+    index = pd.Index(block[:, 0], name=header[0])
+    return pd.DataFrame(block[:, 1:], index=index, columns=list(columns), copy=False)
+
+
+def read_results_file(results_file: str, dtype: npt.DTypeLike = np.float64, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
     """
     A function to read the pyfrag output file (with ".txt" extension) and return a pandas dataframe.
 
+    The header (e.g. "#IRC bondlength EnergyTotal ...") is tokenized once and the numeric body is converted in bulk into a single contiguous NumPy block,
+    which is only wrapped in a DataFrame at the end.
+
     Args:
-        results_file (str): The path to the results file (.txt).
+        results_file (str): The path to the results file (.txt), which can be compressed (e.g. .txt.gz, see `open_text`).
+        dtype (npt.DTypeLike): The floating point type of the data. Defaults to np.float64, but np.float32 halves the memory usage.
+        columns (Optional[Sequence[str]]): The columns to read, given as names or glob patterns (e.g. "vdd_*"). The values of the other columns are skipped while parsing.
+            Columns that are not in the file are ignored. Defaults to None (all columns).
 
     Returns:
         pd.DataFrame: A pandas dataframe containing the data with #IRC steps as index.
     """
-    df = pd.read_csv(results_file, header=0, delim_whitespace=True, dtype=float, index_col=0)
+    if columns is not None:
+        header = read_results_header(results_file)
+        return _read_results_columns(results_file, select_columns(header[1:], columns), dtype)
+
+    with open_text(results_file) as f:
+        header = f.readline().split()
+        body = f.read()
+
+    if not header:
+        raise PyFragResultsProcessingError(key="read_results_file", message=f"No header found in {results_file}.")
+
+    block = _parse_numeric_block(body, len(header), dtype)
+
+    # The first column (#IRC) is used as index, and if there is only one bondlength, angle, or dihedral, it is renamed to bondlength_1 (etc.)
+    index = pd.Index(block[:, 0], name=header[0])
+    columns = _rename_single_coordinate_headers(header[1:])
+    return pd.DataFrame(block[:, 1:], index=index, columns=columns, copy=False)
+
+
+# Number of bytes at the start and at the end of the parsed part of a file that are compared to detect a rewritten file
+_FINGERPRINT_SIZE = 4096
+
+# Number of bytes of text that the incremental reader converts at once, which limits the memory used for the columns that are not kept
+_READ_CHUNK_SIZE = 1 << 24
+
+
+@define
+class IncrementalResultsReader:
+    """Reads a results file that is still being written by PyFrag in increments of complete rows.
+
+    The reader remembers the byte offset up to which the file has been parsed, so every call to `read` only parses the rows that have been appended since.
+    A last row that is still being written (i.e. does not end with a newline yet) is left for the next call.
+    A rewritten file (e.g. by a restarted PyFrag job) is detected by its inode, its modification time and the bytes at the start and at the end of the parsed part.
+    The parsed rows are stored in a buffer that grows by doubling its size, such that appending rows does not copy the rows that have been read before.
+
+    Attributes:
+        results_file (str): The path to the results file (.txt).
+        dtype (npt.DTypeLike): The floating point type of the data. Defaults to np.float64.
+        columns (Optional[List[str]]): The columns (names or glob patterns) that are kept, see `select_columns`. Defaults to None (all columns).
+        offset (int): The byte offset up to which the file has been parsed.
+        header (List[str]): The column names as written in the file, starting with the name of the index column (#IRC).
+
+    """
+
+    results_file: str
+    dtype: npt.DTypeLike = np.float64
+    columns: Optional[List[str]] = None
+    offset: int = 0
+    header: List[str] = field(factory=list)
+    # The positions of the kept columns in the header (including the index column) and the buffer of which the first _n_rows rows have been parsed
+    _column_indices: List[int] = field(factory=list, repr=False)
+    _buffer: Optional[np.ndarray] = field(default=None, repr=False)
+    _n_rows: int = field(default=0, repr=False)
+    # The identity (device and inode) and the modification time of the file, and the first and last bytes of the parsed part of the file
+    _file_id: Optional[Tuple[int, int]] = field(default=None, repr=False)
+    _mtime_ns: int = field(default=0, repr=False)
+    _head: bytes = field(default=b"", repr=False)
+    _tail: bytes = field(default=b"", repr=False)
+
+    def reset(self) -> None:
+        """Forgets the parsed rows, such that the next call to `read` parses the file from the start."""
+        self.offset = 0
+        self.header = []
+        self._column_indices = []
+        self._buffer = None
+        self._n_rows = 0
+        self._file_id = None
+        self._mtime_ns = 0
+        self._head = b""
+        self._tail = b""
+
+    def _is_rewritten(self, f: BinaryIO, file_id: Tuple[int, int], mtime_ns: int) -> bool:
+        """Checks whether the parsed part of the file has changed since the last call, e.g. because the PyFrag job was restarted and the file was rewritten."""
+        if file_id != self._file_id or mtime_ns < self._mtime_ns:
+            return True
+        if not is_compressed(self.results_file) and os.path.getsize(self.results_file) < self.offset:
+            return True
+
+        head = f.read(len(self._head))
+        f.seek(self.offset - len(self._tail))
+        return head != self._head or f.read(len(self._tail)) != self._tail
+
+    def _set_header(self, header: List[str]) -> None:
+        """Stores the header and the positions of the columns that are kept."""
+        if not header:
+            raise PyFragResultsProcessingError(key="read_results_file", message=f"No header found in {self.results_file}.")
+
+        self.header = header
+        names = _rename_single_coordinate_headers(header[1:])
+        kept_names = set(names if self.columns is None else select_columns(names, self.columns))
+        self._column_indices = [0] + [i + 1 for i, name in enumerate(names) if name in kept_names]
+
+    def _append(self, block: np.ndarray) -> None:
+        """Appends the parsed rows to the buffer, which is reallocated with (at least) twice its size if it is full."""
+        n_rows = self._n_rows + len(block)
+        if self._buffer is None or n_rows > len(self._buffer):
+            buffer = np.empty((max(n_rows, 0 if self._buffer is None else 2 * len(self._buffer)), block.shape[1]), dtype=self.dtype)
+            if self._buffer is not None:
+                buffer[:self._n_rows] = self._buffer[:self._n_rows]
+            self._buffer = buffer
+        self._buffer[self._n_rows:n_rows] = block
+        self._n_rows = n_rows
+
+    def read(self) -> int:
+        """Parses the complete rows that have been appended to the file since the last call.
+
+        If the parsed part of the file has changed (e.g. the PyFrag job was restarted and the file was rewritten), the file is parsed from the start.
+
+        Returns:
+            int: The number of new rows.
+
+        """
+        stat = os.stat(self.results_file)
+        file_id = (stat.st_dev, stat.st_ino)
+
+        with open_binary(self.results_file) as f:
+            if self.offset > 0 and self._is_rewritten(f, file_id, stat.st_mtime_ns):
+                self.reset()
+            f.seek(self.offset)
+            new_bytes = f.read()
+
+        self._file_id, self._mtime_ns = file_id, stat.st_mtime_ns
+        end = new_bytes.rfind(b"\n") + 1
+        if end == 0:
+            return 0
+        if self.offset == 0:
+            self._head = new_bytes[:min(end, _FINGERPRINT_SIZE)]
+        self._tail = (self._tail + new_bytes[:end])[-_FINGERPRINT_SIZE:]
+        self.offset += end
+        body = new_bytes[:end].decode()
+
+        if not self.header:
+            header_line, _, body = body.partition("\n")
+            self._set_header(header_line.split())
+
+        n_previous_rows = self._n_rows
+        start = 0
+        while start < len(body):
+            stop = body.find("\n", start + _READ_CHUNK_SIZE) + 1 or len(body)
+            block = _parse_numeric_chunk(body[start:stop], len(self.header), self._column_indices, self.dtype)
+            if len(block) > 0:
+                self._append(block)
+            start = stop
+        return self._n_rows - n_previous_rows
+
+    def add_columns(self, data: pd.DataFrame) -> None:
+        """Adds columns that have been read separately (e.g. by `LazyResultsTable.load`) to the parsed rows, such that the following reads keep these columns as well.
+
+        Args:
+            data (pd.DataFrame): The columns in the format of `read_results_file`, containing (at least) the rows that have been parsed.
+
+        """
+        if self.columns is not None:
+            self.columns.extend(key for key in data.columns if key not in self.columns)
+        if not self.header:
+            return
 
-    # if there is only one bondlength, rename it to bondlength_1
-    if 'bondlength' in df.columns and not any(col.startswith('bondlength_') for col in df.columns):
-        df = df.rename(columns={'bondlength': 'bondlength_1'})
+        names = _rename_single_coordinate_headers(self.header[1:])
+        new_columns = [key for key in data.columns if names.index(key) + 1 not in self._column_indices]
+        if new_columns and self._buffer is not None:
+            buffer = np.empty((len(self._buffer), len(self._column_indices) + len(new_columns)), dtype=self.dtype)
+            buffer[:self._n_rows, :len(self._column_indices)] = self._buffer[:self._n_rows]
+            buffer[:self._n_rows, len(self._column_indices):] = data[new_columns].to_numpy()[:self._n_rows]
+            self._buffer = buffer
+        self._column_indices = self._column_indices + [names.index(key) + 1 for key in new_columns]
 
-    if 'angle' in df.columns and not any(col.startswith('angle_') for col in df.columns):
-        df = df.rename(columns={'angle': 'angle_1'})
+    @property
+    def n_rows(self) -> int:
+        """The number of rows that have been parsed."""
+        return self._n_rows
 
-    if 'dihedral' in df.columns and not any(col.startswith('dihedral_') for col in df.columns):
-        df = df.rename(columns={'dihedral': 'dihedral_1'})
+    @property
+    def data(self) -> pd.DataFrame:
+        """The parsed rows of the kept columns in the same format as returned by `read_results_file`. The DataFrame is a view of the buffer of the reader."""
+        block = self._buffer[:self._n_rows] if self._buffer is not None else np.empty((0, len(self._column_indices) or 1), dtype=self.dtype)
+        names = _rename_single_coordinate_headers(self.header[1:])
 
-    return df
+        index = pd.Index(block[:, 0], name=self.header[0] if self.header else None)
+        return pd.DataFrame(block[:, 1:], index=index, columns=[names[i - 1] for i in self._column_indices[1:]], copy=False)
@@ -0,0 +1,99 @@
+""" Module for scanning the schema (columns and number of rows) of many PyFrag results files (.txt) without loading their data.
+
+Only the header line of each file is tokenized, and the rows are counted by counting the newlines in large binary chunks.
+The catalog that is returned can be used to select systems (e.g. only systems with a dispersion term) and to pre-size arrays before loading the data.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from pyfrag_plotter.input.compression import open_binary
+from pyfrag_plotter.input.discovery import discover_pyfrag_jobs
+from pyfrag_plotter.input.read_resultsfile import _rename_single_coordinate_headers
+
+# Columns for which the catalog contains a "has_<column>" entry
+FLAG_COLUMNS: Sequence[str] = ("Disp", "StrainTotal", "frag1Strain", "frag2Strain")
+
+# Column families (e.g. vdd_1, vdd_2, ...) for which the catalog contains a "n_<family>" entry
+COUNTED_COLUMN_FAMILIES: Sequence[str] = ("bondlength", "angle", "dihedral", "overlap", "population", "orbitalenergy", "vdd", "irrepOI")
+
+_FAMILY_PATTERN = re.compile(r"^([A-Za-z]+)_\d+$")
+_CHUNK_SIZE = 1024**2  # bytes
+
+
+def read_results_schema(results_file: str) -> Dict[str, Any]:
+    """Reads the header and counts the data rows of a results file without parsing the data.
+
+    Args:
+        results_file (str): The path to the results file (.txt), which can be compressed (e.g. .txt.gz).
+
+    Returns:
+        Dict[str, Any]: One row of the catalog, see `scan_results_schema`.
+
+    Note: empty lines at the end of the file are not counted, but an incomplete last row (without a trailing newline) is.
+    """
+    with open_binary(results_file) as f:
+        header = f.readline().decode().split()
+        n_newlines = 0
+        n_trailing_newlines = 0
+        has_data = False
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            n_newlines += chunk.count(b"\n")
+            data = chunk.rstrip(b"\r\n")
+            if data:
+                has_data = True
+                n_trailing_newlines = chunk[len(data):].count(b"\n")
+            else:
+                n_trailing_newlines += chunk.count(b"\n")
+
+    # The last row might not end with a newline, while trailing empty lines should not be counted
+    n_rows = n_newlines - n_trailing_newlines + (1 if has_data else 0)
+
+    columns = _rename_single_coordinate_headers(header[1:])
+    families = [match.group(1) for match in map(_FAMILY_PATTERN.match, columns) if match is not None]
+
+    schema: Dict[str, Any] = {"path": os.path.abspath(results_file), "n_rows": n_rows, "n_columns": len(columns), "columns": tuple(columns)}
+    schema.update({f"has_{column}": column in columns for column in FLAG_COLUMNS})
+    schema.update({f"n_{family}": families.count(family) for family in COUNTED_COLUMN_FAMILIES})
+    return schema
+
+
+def _try_read_results_schema(results_file: str) -> Optional[Dict[str, Any]]:
+    try:
+        return read_results_schema(results_file)
+    except (OSError, EOFError, UnicodeDecodeError) as e:
+        logging.log(logging.WARNING, f"Skipping {results_file}: {e}")
+        return None
+
+
+def scan_results_schema(results_files: Union[str, Sequence[str]], workers: Optional[int] = None, index_file: Optional[str] = None) -> pd.DataFrame:
+    """Scans the schema of many results files and returns a catalog with one row per file.
+
+    Args:
+        results_files (Union[str, Sequence[str]]): The paths to the results files, or a campaign directory that is searched with `discover_pyfrag_jobs`.
+        workers (Optional[int]): The number of threads used for reading the files. Defaults to the default of ThreadPoolExecutor.
+        index_file (Optional[str]): The discovery index (see `discover_pyfrag_jobs`), only used if a campaign directory is given. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The catalog with the columns "path", "n_rows", "n_columns", "columns" (tuple of the column names),
+            "has_<column>" for the FLAG_COLUMNS and "n_<family>" for the COUNTED_COLUMN_FAMILIES. Files that cannot be read are skipped with a warning.
+
+    Example:
+        >>> catalog = scan_results_schema("campaign")
+        >>> with_dispersion = catalog[catalog["has_Disp"] & (catalog["n_rows"] > 10)]
+
+    """
+    if isinstance(results_files, str):
+        results_files = [job.results_file for job in discover_pyfrag_jobs(results_files, index_file=index_file).jobs]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        schemas: List[Dict[str, Any]] = [schema for schema in pool.map(_try_read_results_schema, results_files) if schema is not None]
+
+    columns = ["path", "n_rows", "n_columns", "columns"] + [f"has_{column}" for column in FLAG_COLUMNS] + [f"n_{family}" for family in COUNTED_COLUMN_FAMILIES]
+    return pd.DataFrame(schemas, columns=columns)
@@ -1,30 +1,322 @@
-""" Module that contains functions for interpolating data """
-from typing import Optional, Sequence, Tuple, Union
+""" Module that contains functions for interpolating data
+
+scipy is imported when data is interpolated for the first time, such that importing this module does not slow down scripts that only load and process data.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import scipy as sp
-from scipy.interpolate import BSpline, make_interp_spline
 
-from pyfrag_plotter import config
+from pyfrag_plotter.config.config_handler import Config
+from pyfrag_plotter.config.context import get_config
 from pyfrag_plotter.errors import PyFragInterpolationError
 from pyfrag_plotter.pyfrag_object import Array1D, PyFragResultsObject
 
+if TYPE_CHECKING:
+    from scipy.interpolate import BSpline, PPoly
+
+# ====================================================================================================
+# Interpolation methods ==============================================================================
+# ====================================================================================================
+
+# An interpolator evaluates all interpolated columns at the given points, shape (points, columns)
+Interpolator = Callable[[np.ndarray], np.ndarray]
+
+
+class LinearInterpolator:
+    """Piecewise linear interpolation of all columns at once, i.e. `np.interp` for 2D y data. Points outside the range of x are extrapolated with the outer segments."""
+
+    def __init__(self, x: np.ndarray, y: np.ndarray) -> None:
+        # The data is copied, since the interpolator can be cached and would change with the arrays of the caller otherwise
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+
+    def __call__(self, points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=np.float64)
+        i = np.clip(np.searchsorted(self.x, points, side="right") - 1, 0, len(self.x) - 2)
+        weights = (points - self.x[i]) / (self.x[i + 1] - self.x[i])
+        weights = weights.reshape(weights.shape + (1,) * (self.y.ndim - 1))
+        return self.y[i] * (1.0 - weights) + self.y[i + 1] * weights
+
+
+def _make_pchip(x: np.ndarray, y: np.ndarray) -> Interpolator:
+    from scipy.interpolate import PchipInterpolator
+
+    return PchipInterpolator(x, y, axis=0)
+
+
+def _make_akima(x: np.ndarray, y: np.ndarray) -> Interpolator:
+    from scipy.interpolate import Akima1DInterpolator
+
+    return Akima1DInterpolator(x, y, axis=0)
+
+
+def _make_cubic(x: np.ndarray, y: np.ndarray) -> Interpolator:
+    from scipy.interpolate import make_interp_spline
+
+    return make_interp_spline(x, y, k=min(3, len(x) - 1))
+
+
+def _make_smoothing(x: np.ndarray, y: np.ndarray) -> Interpolator:
+    from scipy.interpolate import make_smoothing_spline
+
+    # The smoothing parameter is chosen by generalized cross-validation
+    return make_smoothing_spline(x, y)
+
+
+# The interpolation methods that can be selected with the "interpolation_method" key of the config or per call
+INTERPOLATION_METHODS: Dict[str, Callable[[np.ndarray, np.ndarray], Interpolator]] = {
+    "linear": LinearInterpolator,
+    "pchip": _make_pchip,
+    "akima": _make_akima,
+    "cubic": _make_cubic,
+    "smoothing": _make_smoothing,
+}
+
+
+def _resolve_method(method: Optional[str], config: Optional[Config] = None) -> str:
+    """Returns the given interpolation method, or the method of the config if no method is given."""
+    if method is None:
+        method = get_config(config).get("SHARED", "interpolation_method")
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError(f"Unknown interpolation method '{method}'. Available methods are: {', '.join(INTERPOLATION_METHODS)}.")
+    return method
+
+
+def make_interpolator(x: np.ndarray, y: np.ndarray, method: str = "cubic") -> Interpolator:
+    """Fits an interpolator through the data points, which evaluates all columns of y at once.
+
+    The available methods (see `INTERPOLATION_METHODS`) are:
+
+    - "linear": straight lines between the data points (as `np.interp`)
+    - "pchip": the shape preserving piecewise cubic Hermite interpolation, which does not overshoot between the data points
+    - "akima": the Akima interpolation, which overshoots less than the cubic spline near outliers
+    - "cubic": the interpolating cubic B-spline (of a lower degree for fewer than four data points)
+    - "smoothing": a cubic smoothing spline, which does not pass through the data points but through the trend of noisy data
+
+    Args:
+        x (np.ndarray): The strictly increasing x-axis data.
+        y (np.ndarray): The y-axis data, either 1D or 2D with one column per interpolated term.
+        method (str): The interpolation method. Defaults to "cubic".
+
+    Raises:
+        ValueError: If the method is unknown or the data cannot be interpolated, e.g. because x is not strictly increasing.
+
+    Returns:
+        Interpolator: A callable that evaluates the interpolated data at an array of points, shape (points, columns) for 2D y data.
+    """
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError(f"Unknown interpolation method '{method}'. Available methods are: {', '.join(INTERPOLATION_METHODS)}.")
+
+    # The data is copied, such that interpolators that keep the data points (e.g. PCHIP) do not change with the arrays of the caller
+    x = np.array(x, dtype=np.float64)
+    y = np.array(y, dtype=np.float64)
+    if len(x) < 2 or np.any(np.diff(x) <= 0):
+        raise ValueError("x must be strictly increasing and contain at least two points.")
+    return INTERPOLATION_METHODS[method](x, y)
+
+
+def _interpolator_size(interpolator: Interpolator) -> int:
+    """Returns the memory (in bytes) of the arrays that define the interpolator, i.e. the knots and coefficients of splines and the breakpoints and coefficients of piecewise polynomials."""
+    return sum(getattr(interpolator, name).nbytes for name in ("t", "c", "x", "y") if isinstance(getattr(interpolator, name, None), np.ndarray))
+
+
+# ====================================================================================================
+# Spline cache =======================================================================================
+# ====================================================================================================
+
+DEFAULT_SPLINE_CACHE_SIZE = 64 * 1024**2  # bytes
+
+
+class SplineCache:
+    """An in-memory cache of fitted splines (and other interpolators) that is bounded in size by evicting the least recently used splines.
+
+    The same lines are interpolated by every plot that shows them (e.g. `plot_asm`, `plot_eda` and `plot_arbitrary_keys`). The splines are keyed by
+    a hash of the data points and the degree of the spline (or the interpolation method), such that identical data is only fitted once. The "cubic" interpolator
+    is the cubic spline of `get_spline`, so both share the same key.
+
+    Attributes:
+        max_size (int): The maximum memory (in bytes) of the knots and coefficients of the cached splines. A max_size of 0 disables the cache.
+        hits (int): The number of splines that were taken from the cache.
+        misses (int): The number of splines that had to be fitted.
+        size (int): The memory (in bytes) of the knots and coefficients of the cached splines.
 
-def interpolate_plot(x_axis: np.ndarray, y_axis: np.ndarray, x_range: Optional[Sequence[float]] = None) -> Union[Tuple[np.ndarray, BSpline], Tuple[np.ndarray, np.ndarray]]:
     """
-    Interpolates the data to a finer grid for plotting purposes using the scipy spline library.
+
+    def __init__(self, max_size: int = DEFAULT_SPLINE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._splines: OrderedDict[str, Tuple[Interpolator, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._splines)
+
+    @staticmethod
+    def key(x: np.ndarray, y: np.ndarray, k: Union[int, str]) -> str:
+        """Returns the (blake2b) hash of the data points and the degree of the spline (or the interpolation method). The y data can be 2D (one column per interpolated term)."""
+        key_hash = hashlib.blake2b(f"k={k}".encode(), digest_size=16)
+        for values in (x, y):
+            values = np.ascontiguousarray(values, dtype=np.float64)
+            # The shape separates the x and y data, since the same bytes can be split differently
+            key_hash.update(str(values.shape).encode())
+            key_hash.update(values.tobytes())
+        return key_hash.hexdigest()
+
+    def get_spline(self, x: np.ndarray, y: np.ndarray, k: int = 3) -> BSpline:
+        """Returns the interpolating spline of the data points (see `scipy.interpolate.make_interp_spline`), either from the cache or by fitting it.
+
+        Raises:
+            ValueError: If the spline cannot be fitted, e.g. because x is not strictly increasing.
+
+        """
+        from scipy.interpolate import make_interp_spline
+
+        return self._get(self.key(x, y, k), lambda: make_interp_spline(x, y, k=k))
+
+    def get_interpolator(self, x: np.ndarray, y: np.ndarray, method: str = "cubic") -> Interpolator:
+        """Returns the interpolator of the data points (see `make_interpolator`), either from the cache or by fitting it.
+
+        Raises:
+            ValueError: If the method is unknown or the data cannot be interpolated, e.g. because x is not strictly increasing.
+
+        """
+        # The cubic interpolator is the interpolating spline of `get_spline`, such that e.g. the lines of the plots and `find_stationary_points` share the spline
+        k: Union[int, str] = min(3, len(x) - 1) if method == "cubic" else method
+        return self._get(self.key(x, y, k), lambda: make_interpolator(x, y, method))
+
+    def get_piecewise_polynomial(self, x: np.ndarray, y: np.ndarray, method: str = "cubic") -> PPoly:
+        """Returns the interpolator of the data points (see `make_interpolator`) as a piecewise cubic polynomial, either from the cache or by fitting and converting it.
+
+        The pieces of many interpolators can be evaluated at once, see `interpolate_cube`.
+
+        Raises:
+            ValueError: If the method is unknown or the data cannot be interpolated, e.g. because x is not strictly increasing.
+
+        """
+        return self._get(self.key(x, y, f"{method} (piecewise)"), lambda: _piecewise_polynomial(make_interpolator(x, y, method)))  # type: ignore since PPoly is an interpolator
+
+    def _get(self, key: str, fit: Callable[[], Interpolator]) -> Interpolator:
+        with self._lock:
+            if key in self._splines:
+                self._splines.move_to_end(key)
+                self.hits += 1
+                return self._splines[key][0]
+            self.misses += 1
+
+        spline = fit()
+        self._add(key, spline)
+        return spline
+
+    def _add(self, key: str, spline: Interpolator) -> None:
+        spline_size = _interpolator_size(spline)
+        if spline_size > self.max_size:
+            return
+
+        with self._lock:
+            if key in self._splines:
+                return
+            self._splines[key] = (spline, spline_size)
+            self.size += spline_size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._splines.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self) -> None:
+        """Removes all splines from the cache and resets the hit and miss counters."""
+        with self._lock:
+            self._splines.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# The cache that is used by `interpolate_plot`
+spline_cache = SplineCache()
+
+# ====================================================================================================
+# Interpolation ======================================================================================
+# ====================================================================================================
+
+# Number of (evenly spaced) points that the adaptive sampling starts with
+_N_INITIAL_SAMPLES = 9
+
+# Positions within an interval (relative to its width) at which the deviation of the spline from the straight line between the vertices is measured
+_PROBE_POSITIONS = np.array([0.25, 0.5, 0.75])
+
+
+def adaptive_samples(spline: Interpolator, x_min: float, x_max: float, tolerance: float, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Samples a spline densely where it is curved and sparsely where it is flat, such that the line through the samples deviates about `tolerance` at most from the spline.
+
+    The sampling starts with a few evenly spaced points and bisects the intervals in which the straight line between the vertices deviates more than the tolerance
+    from the spline (at a quarter, half and three quarters of the interval). All intervals of a refinement step are evaluated at once.
+
+    Args:
+        spline (Interpolator): The spline (or other interpolator, see `make_interpolator`) to sample.
+        x_min (float): The start of the sampled range.
+        x_max (float): The end of the sampled range.
+        tolerance (float): The maximum deviation (in the units of the data) of the line through the samples from the spline.
+        max_points (int): The maximum number of samples. If the tolerance cannot be reached with this number of samples, the intervals with the largest deviation are refined first.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (increasing) x-axis values of the samples and the values of the spline at the samples.
+    """
+    x = np.linspace(x_min, x_max, max(2, min(_N_INITIAL_SAMPLES, max_points)))
+    y = spline(x)
+
+    while len(x) < max_points:
+        # The deviation of the line between the vertices from the spline within every interval
+        widths = np.diff(x)
+        probes = x[:-1, None] + widths[:, None] * _PROBE_POSITIONS
+        chords = y[:-1, None] + (y[1:] - y[:-1])[:, None] * _PROBE_POSITIONS
+        deviations = np.abs(spline(probes) - chords).max(axis=1)
+
+        refine = np.flatnonzero(deviations > tolerance)
+        if len(refine) == 0:
+            break
+
+        # Refine the intervals with the largest deviation if not all of them fit within the maximum number of samples
+        if len(x) + len(refine) > max_points:
+            refine = np.sort(refine[np.argsort(deviations[refine])[::-1][:max_points - len(x)]])
+
+        midpoints = x[refine] + widths[refine] / 2
+        x = np.insert(x, refine + 1, midpoints)
+        y = np.insert(y, refine + 1, spline(midpoints))
+
+    return x, y
+
+
+def interpolate_plot(
+    x_axis: np.ndarray, y_axis: np.ndarray, x_range: Optional[Sequence[float]] = None, config: Optional[Config] = None, method: Optional[str] = None
+) -> Union[Tuple[np.ndarray, BSpline], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Interpolates the data to a finer grid for plotting purposes using the scipy spline library (or another interpolation method, see `make_interpolator`).
+    The fitted splines are cached in `spline_cache`, such that the same line is only fitted once when it is shown in several plots.
 
     Args:
         x_axis (np.ndarray): The x-axis data to interpolate.
         y_axis (np.ndarray): The y-axis data to interpolate.
         x_range (Optional[Sequence[float]], optional): The range of x-axis values to interpolate over. Defaults to None.
+        config (Optional[Config], optional): The config that provides the number of interpolation points and the x-axis direction.
+            Defaults to None (the config of the current context, see `get_config`).
+        method (Optional[str], optional): The interpolation method (see `INTERPOLATION_METHODS`). Defaults to None (the "interpolation_method" of the config).
 
     Returns:
         Tuple[np.ndarray, BSpline]: The interpolated x-axis and y-axis data.
     """
+    config = get_config(config)
+    method = _resolve_method(method, config)
     n_interpolation_points = config.get("SHARED", "n_interpolation_points")
     reverse_axis = config.get("SHARED", "reverse_x_axis")
+    tolerance = config.get("SHARED", "interpolation_tolerance")
 
     # This option is used to disable interpolation, which is useful for non-strictly increasing (of decreasing) data
     if n_interpolation_points == 0:
@@ -40,10 +332,14 @@ def interpolate_plot(x_axis: np.ndarray, y_axis: np.ndarray, x_range: Optional[S
     y_filtered = y_axis[mask] if not reverse_axis else y_axis[mask][::-1]
 
     try:
-        X_Y_Spline = make_interp_spline(x_filtered, y_filtered, k=3)
+        X_Y_Spline = spline_cache.get_interpolator(x_filtered, y_filtered, method)
     except ValueError as e:
         raise PyFragInterpolationError(f"Error: {e}\nThe data could not be interpolated. This is likely due to the data not strictly increasing. Please check the data, and possibly adjust the x.")
 
+    # Samples the curved parts of the spline more densely than the flat parts
+    if tolerance > 0:
+        return adaptive_samples(X_Y_Spline, x_min, x_max, tolerance, n_interpolation_points)
+
     # Returns evenly spaced numbers over a specified interval.
     X_ = np.linspace(x_min, x_max, n_interpolation_points)
     Y_ = X_Y_Spline(X_)
@@ -71,52 +367,348 @@ def remove_duplicate_x_values(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray,
     return x[unique_indices], y[unique_indices]
 
 
-def interpolate_data(input_data: Union[PyFragResultsObject, pd.DataFrame], irc_coord: str, point: float) -> pd.DataFrame:
+def interpolate_data(
+    input_data: Union[PyFragResultsObject, pd.DataFrame], irc_coord: str, points: Union[float, Sequence[float], np.ndarray], method: Optional[str] = "linear"
+) -> pd.DataFrame:
     """
     Interpolates data that can be in the format of a PyFragResultsObject or a pandas DataFrame.
 
-    This function takes input data in the format of a PyFragResultsObject or a pandas DataFrame and interpolates the data at a specified point along the x-axis.
+    This function takes input data in the format of a PyFragResultsObject or a pandas DataFrame and (by default linearly) interpolates all columns at the specified points along the x-axis.
+    The input data is not modified: the columns of a lazily created object that have not been loaded yet are read into a temporary DataFrame instead of into the object.
 
     Args:
         input_data (Union[PyFragResultsObject, pd.DataFrame]): The input data to interpolate.
         irc_coord (str): The name of the x-axis coordinate to interpolate along.
-        point (float): The point along the x-axis to interpolate at.
+        points (Union[float, Sequence[float], np.ndarray]): The point or points along the x-axis to interpolate at.
+        method (Optional[str], optional): The interpolation method (see `INTERPOLATION_METHODS`). None selects the "interpolation_method" of the config. Defaults to "linear".
 
     Raises:
-        TypeError: If the input data is not a PyFragResultsObject or a pandas DataFrame.
+        PyFragInterpolationError: If a point lies outside the range of the x-axis or the data cannot be interpolated.
 
     Returns:
-        pandas DataFrame: A pandas DataFrame containing the interpolated data.
+        pandas DataFrame: A new pandas DataFrame containing the interpolated data, with one row per point.
     """
+    method = _resolve_method(method)
 
     if isinstance(input_data, PyFragResultsObject):
-        input_data = input_data.dataframe
+        input_data = _get_all_columns(input_data)
+
+    return _interpolate_dataframe(input_data, irc_coord, points, method=method)
 
-    return _interpolate_dataframe(input_data, irc_coord, point)
 
+def _get_all_columns(obj: PyFragResultsObject) -> pd.DataFrame:
+    """Returns the data of all columns of the object, without loading the missing columns of a lazily created object into the object (see `PyFragResultsObject.materialize`)."""
+    if obj.lazy_table is None:
+        return obj.dataframe
 
-def _interpolate_dataframe(df: pd.DataFrame, irc_coord: str, point: float, x_axis: Union[pd.Series, Array1D, None] = None) -> pd.DataFrame:
+    missing_keys = [key for key in obj.lazy_table.columns if key not in obj.dataframe.columns]
+    loaded_data = obj.lazy_table.load(missing_keys, keep_in_reader=False)
+    return pd.concat([obj.dataframe, loaded_data], axis=1)[obj.lazy_table.columns]
+
+
+def _interpolate_dataframe(
+    df: pd.DataFrame, irc_coord: str, points: Union[float, Sequence[float], np.ndarray], x_axis: Union[pd.Series, Array1D, None] = None, method: str = "linear"
+) -> pd.DataFrame:
     """
-    This function takes a pandas DataFrame and interpolates the data at a specified point along the x-axis. The interpolated data is stored in the DataFrame.
+    This function takes a pandas DataFrame and interpolates all columns at the specified points along the x-axis in one (vectorized) evaluation.
 
     Args:
-        df (pd.DataFrame): The pandas DataFrame to interpolate.
+        df (pd.DataFrame): The pandas DataFrame to interpolate. The DataFrame is not modified.
         irc_coord (str): The name of the x-axis coordinate to interpolate along.
-        point (float): The point along the x-axis to interpolate at.
+        points (Union[float, Sequence[float], np.ndarray]): The point or points along the x-axis to interpolate at.
         x_axis (Union[pd.Series, Array1D, None], optional): The x-axis data. If None, the data from the 'irc_coord' column of the DataFrame is used. Defaults to None.
+        method (str, optional): The interpolation method (see `INTERPOLATION_METHODS`). Defaults to "linear".
+
+    Raises:
+        PyFragInterpolationError: If a point lies outside the range of the x-axis or the data cannot be interpolated.
+
+    Returns:
+        pandas DataFrame: The interpolated DataFrame with one row per point.
+    """
+    # First, determine the x-axis (in increasing order)
+    x = np.asarray(df[irc_coord] if x_axis is None else x_axis, dtype=np.float64)
+    order = np.argsort(x, kind="stable")
+    x = x[order]
+    points = np.atleast_1d(np.asarray(points, dtype=np.float64))
+
+    if len(x) == 0 or np.any(points < x[0]) or np.any(points > x[-1]):
+        raise PyFragInterpolationError(f"The points {points.tolist()} could not be interpolated along {irc_coord}, which ranges from {np.min(x, initial=np.nan)} to {np.max(x, initial=np.nan)}.")
+
+    # Interpolate all columns at once, the rows of the 2D array are the points along the x-axis
+    try:
+        interpolated = make_interpolator(x, df.to_numpy(dtype=np.float64)[order], method)(points)
+    except ValueError as e:
+        raise PyFragInterpolationError(f"Error: {e}\nThe data could not be interpolated along {irc_coord}. This is likely due to duplicate values of {irc_coord}.")
+
+    return pd.DataFrame(interpolated, columns=df.columns)
+
+
+# ====================================================================================================
+# Interpolation of many systems at common coordinates ================================================
+# ====================================================================================================
+
+# The factorials of the powers of the (at most cubic) polynomial pieces, which convert the coefficients into derivatives
+_FACTORIALS = np.array([1.0, 1.0, 2.0, 6.0])
+
+
+def interpolate_cube(
+    objects: Sequence[PyFragResultsObject], irc_coord: str, points: Union[Sequence[float], np.ndarray], terms: Sequence[str], method: Optional[str] = None
+) -> np.ndarray:
+    """Evaluates the terms of many systems at the same values of the IRC coordinate, e.g. for comparing the activation strain terms at consistent geometries.
+
+    For each system, one spline (or other interpolator) is fitted through all terms at once (see `SplineCache`). The polynomial pieces of all systems are gathered,
+    such that all systems are evaluated at once at the points that lie within the range of their IRC coordinate. The order of the data along the IRC (increasing or decreasing coordinate) does not matter.
+
+    Args:
+        objects (Sequence[PyFragResultsObject]): The systems to interpolate.
+        irc_coord (str): The name of the IRC coordinate (e.g. "bondlength_1") at which the terms are evaluated.
+        points (Union[Sequence[float], np.ndarray]): The values of the IRC coordinate at which the terms are evaluated.
+        terms (Sequence[str]): The terms to evaluate (e.g. "EnergyTotal", "Int" and "StrainTotal").
+        method (Optional[str], optional): The interpolation method (see `INTERPOLATION_METHODS`). Defaults to None (the "interpolation_method" of the config).
 
     Returns:
-        pandas DataFrame: The interpolated DataFrame at the specified point (1 row).
+        np.ndarray: The cube of shape (systems, points, terms). Points outside the range of the IRC coordinate of a system and terms that a system does not have are NaN.
+            All terms of a system that cannot be interpolated (e.g. because its IRC coordinate contains duplicate values) are NaN as well, which is logged as a warning.
+
+    Example:
+        >>> points = np.linspace(1.8, 3.0, 25)
+        >>> cube = interpolate_cube(objs, "bondlength_1", points, ["EnergyTotal", "Int", "StrainTotal"])
+        >>> cube[:, 10, 0]  # The total energy of all systems at the 11th point
+
+    """
+    method = _resolve_method(method)
+    points = np.asarray(points, dtype=np.float64).ravel()
+    cube = np.full((len(objects), len(points), len(terms)), np.nan)
+
+    # The polynomial pieces of all systems (with NaN coefficients for the terms that a system does not have) and the piece and offset of every evaluated point
+    pieces: List[np.ndarray] = []
+    system_ids: List[np.ndarray] = []
+    point_ids: List[np.ndarray] = []
+    piece_ids: List[np.ndarray] = []
+    offsets: List[np.ndarray] = []
+    n_pieces = 0
+    for i, obj in enumerate(objects):
+        obj.load_keys([irc_coord, *terms])
+        available = [j for j, term in enumerate(terms) if term in obj.dataframe.columns]
+        x = obj.get_x_axis(irc_coord).astype(np.float64)
+        if not available or len(x) < 2:
+            continue
+
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        inside = np.flatnonzero((points >= x[0]) & (points <= x[-1]))
+        if len(inside) == 0:
+            continue
+
+        # Stacking the columns is much faster than selecting a sub-frame for the few terms of a system
+        y = np.column_stack([obj.dataframe[terms[j]].to_numpy(dtype=np.float64) for j in available])[order]
+        try:
+            piecewise_polynomial = spline_cache.get_piecewise_polynomial(x, y, method)
+        except ValueError as e:
+            logging.log(logging.WARNING, f"{e}\nThe data of {obj.name} could not be interpolated along {irc_coord}, so its terms are NaN. This is likely due to duplicate values of {irc_coord}.")
+            continue
+
+        breakpoints = piecewise_polynomial.x
+        system_pieces = np.full((4, len(breakpoints) - 1, len(terms)), np.nan)
+        system_pieces[:, :, available] = piecewise_polynomial.c
+        point_pieces = np.clip(np.searchsorted(breakpoints, points[inside], side="right") - 1, 0, len(breakpoints) - 2)
+
+        pieces.append(system_pieces)
+        system_ids.append(np.full(len(inside), i))
+        point_ids.append(inside)
+        piece_ids.append(n_pieces + point_pieces)
+        offsets.append(points[inside] - breakpoints[point_pieces])
+        n_pieces += len(breakpoints) - 1
+
+    if not pieces:
+        return cube
+
+    # Evaluate the pieces of all systems at once (Horner's scheme), gathering one coefficient of the pieces at a time
+    c = np.concatenate(pieces, axis=1)
+    all_piece_ids = np.concatenate(piece_ids)
+    dx = np.concatenate(offsets)[:, None]
+    values = c[0][all_piece_ids]
+    for power in range(1, 4):
+        values *= dx
+        values += c[power][all_piece_ids]
+    cube[np.concatenate(system_ids), np.concatenate(point_ids)] = values
+    return cube
+
+
+def _piecewise_polynomial(interpolator: Interpolator) -> PPoly:
+    """Converts an interpolator into a piecewise cubic polynomial in the power basis (see `scipy.interpolate.PPoly`) with the coefficients of shape (4, pieces, columns),
+    of which the coefficients of lower degree pieces (e.g. of linear interpolation) start with zeros.
     """
-    # First, determine the x-axis
-    x_axis = df[irc_coord] if x_axis is None else x_axis  # type: ignore
+    from scipy.interpolate import BSpline, PPoly
+
+    if isinstance(interpolator, LinearInterpolator):
+        x, y = interpolator.x, interpolator.y.reshape(len(interpolator.x), -1)
+        c = np.zeros((4, len(x) - 1, y.shape[1]))
+        c[2] = np.diff(y, axis=0) / np.diff(x)[:, None]
+        c[3] = y[:-1]
+        return PPoly(c, x)
+
+    if isinstance(interpolator, BSpline):
+        # The coefficients are the derivatives at the left ends of the pieces, divided by the factorial of their order
+        k = interpolator.k
+        breakpoints = np.unique(interpolator.t[k:len(interpolator.t) - k])
+        left = breakpoints[:-1]
+        c = np.zeros((4, len(left), int(np.prod(interpolator.c.shape[1:]))))
+        for m in range(k + 1):
+            c[3 - m] = interpolator(left, nu=m).reshape(len(left), -1) / _FACTORIALS[m]
+        return PPoly(c, breakpoints)
+
+    # The other interpolators (e.g. PCHIP and Akima) are piecewise polynomials already
+    c = interpolator.c  # type: ignore since the other interpolators are scipy PPoly instances
+    padded_c = np.zeros((4, c.shape[1], int(np.prod(c.shape[2:]))))
+    padded_c[4 - len(c):] = c.reshape(len(c), c.shape[1], -1)
+    return PPoly(padded_c, interpolator.x)  # type: ignore since the other interpolators are scipy PPoly instances
+
+
+# ====================================================================================================
+# Stationary points ==================================================================================
+# ====================================================================================================
+
+
+def _fit_sorted_spline(obj: PyFragResultsObject, irc_coord: str, keys: Sequence[str], k: int) -> Tuple[np.ndarray, np.ndarray, BSpline]:
+    """Returns the (increasing) IRC coordinate, the data of the keys in the same order and the interpolating spline of the keys (one column per key)."""
+    obj.load_keys([irc_coord, *keys])
+    missing_keys = [key for key in keys if key not in obj.dataframe.columns]
+    if missing_keys:
+        raise PyFragInterpolationError(f"The keys {missing_keys} are not available in {obj.name}.")
+
+    x = obj.get_x_axis(irc_coord).astype(np.float64)
+    order = np.argsort(x, kind="stable")
+    x = x[order]
+    # Stacking the columns is much faster than selecting a sub-frame for the few keys of a system
+    y = np.column_stack([obj.dataframe[key].to_numpy(dtype=np.float64) for key in keys])[order]
 
-    for key in df.columns:
-        # Get the y-axis
-        y_axis = df[key]
+    try:
+        # A single key is fitted as 1D data, such that the spline is shared with the line of the key (see `interpolate_plot`)
+        spline = spline_cache.get_spline(x, y[:, 0] if len(keys) == 1 else y, k=min(k, len(x) - 1))
+    except ValueError as e:
+        raise PyFragInterpolationError(f"Error: {e}\nThe data of {obj.name} could not be interpolated along {irc_coord}. This is likely due to duplicate values of {irc_coord}.")
+    return x, y, spline
+
+
+def _taylor_coefficients(spline: BSpline) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the left ends and widths of the polynomial pieces of the spline and the derivatives (0 to 3) of the first column at the left ends, shape (4, pieces)."""
+    piecewise_polynomial = _piecewise_polynomial(spline)
+    breakpoints = piecewise_polynomial.x
+    return breakpoints[:-1], np.diff(breakpoints), piecewise_polynomial.c[::-1, :, 0] * _FACTORIALS[:, None]
 
-        # Interpolate
-        df[key] = sp.interpolate.interp1d(x_axis, y_axis)(point)
 
-    # Return the interpolated dataframe at the specified point (1 row)
-    return df.iloc[[0]]
+def _derivative_roots(derivatives: np.ndarray, widths: np.ndarray) -> np.ndarray:
+    """Returns the two roots (NaN if absent) of the derivative within every polynomial piece, in the local coordinate of the piece, shape (pieces, 2).
+
+    The derivative of the (at most cubic) piece is the quadratic d1 + d2 * t + d3 / 2 * t**2.
+    """
+    a, b, c = derivatives[3] / 2, derivatives[2], derivatives[1]
+    roots = np.full((len(widths), 2), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Quadratic pieces: the numerically stable form of the quadratic formula
+        discriminant = b**2 - 4 * a * c
+        quadratic = (a != 0) & (discriminant >= 0)
+        q = -0.5 * (b + np.copysign(np.sqrt(np.where(quadratic, discriminant, 0.0)), b))
+        roots[:, 0] = np.where(quadratic, q / a, np.nan)
+        roots[:, 1] = np.where(quadratic & (q != 0), c / q, np.nan)
+
+        # Linear pieces (e.g. splines of a lower degree)
+        linear = (a == 0) & (b != 0)
+        roots[:, 0] = np.where(linear, -c / b, roots[:, 0])
+
+    roots[~((roots >= 0) & (roots <= widths[:, None]))] = np.nan
+    return roots
+
+
+def find_stationary_points(
+    objects: Sequence[PyFragResultsObject],
+    irc_coord: str,
+    terms: Optional[Sequence[str]] = None,
+    key: str = "EnergyTotal",
+    peak: str = "max",
+    k: int = 3,
+) -> pd.DataFrame:
+    """Locates the stationary point (e.g. the transition state) of every system on the interpolating spline of the key instead of at a computed IRC point.
+
+    One spline is fitted per system through the key and the terms (see `SplineCache`). The stationary points are the roots of the derivative of the spline of the key,
+    which is a quadratic polynomial between two knots, such that the roots of all pieces of all systems are computed at once. The maximum (or minimum) of the roots
+    with a negative (or positive) curvature is selected. If the spline has no such root, e.g. because the energy increases along the whole IRC, or if a computed point
+    (typically an end of the IRC) has a higher (or lower) value than that root, the computed point with the highest (or lowest) value is returned instead.
+
+    Args:
+        objects (Sequence[PyFragResultsObject]): The systems.
+        irc_coord (str): The name of the IRC coordinate (e.g. "bondlength_1") along which the key is interpolated.
+        terms (Optional[Sequence[str]]): The terms that are evaluated at the stationary point. Defaults to None (only the key).
+        key (str): The term of which the stationary point is located. Defaults to "EnergyTotal".
+        peak (str): The type of the stationary point, either "max" or "min". Defaults to "max".
+        k (int): The degree of the splines, at most 3. Defaults to 3 (cubic).
+
+    Raises:
+        ValueError: If the peak is not "max" or "min", or if k is larger than 3.
+        PyFragInterpolationError: If a system does not contain the keys or cannot be interpolated, e.g. because the IRC coordinate contains duplicate values.
+
+    Returns:
+        pd.DataFrame: One row per system (indexed by the name of the system) with the columns `irc_coord` (the location of the stationary point),
+            the key and the terms (the interpolated values at the stationary point), "curvature" (the second derivative of the key) and "is_stationary"
+            (False if the computed point with the highest or lowest value is returned, since no stationary point was found or the stationary point is not the global extreme).
+
+    Example:
+        >>> transition_states = find_stationary_points(objs, "bondlength_1", terms=["Int", "StrainTotal"])
+
+    """
+    if peak not in ("max", "min"):
+        raise ValueError(f"Peak '{peak}' is not valid. Valid options are ['max', 'min'].")
+    if k > 3:
+        raise ValueError(f"The degree of the splines should be at most 3, not {k}.")
+
+    keys = list(dict.fromkeys([key, *([] if terms is None else terms)]))
+    sign = 1.0 if peak == "max" else -1.0
+
+    splines: List[BSpline] = []
+    fallback_coordinates = np.empty(len(objects))
+    fallback_values = np.empty(len(objects))
+    pieces: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for i, obj in enumerate(objects):
+        x, y, spline = _fit_sorted_spline(obj, irc_coord, keys, k)
+        splines.append(spline)
+        fallback_index = np.argmax(sign * y[:, 0])
+        fallback_coordinates[i], fallback_values[i] = x[fallback_index], y[fallback_index, 0]
+        pieces.append(_taylor_coefficients(spline))
+
+    # The roots of the derivative of all pieces of all systems
+    system_ids = np.repeat(np.arange(len(objects)), [len(left) for left, _, _ in pieces])
+    left = np.concatenate([left for left, _, _ in pieces])
+    widths = np.concatenate([width for _, width, _ in pieces])
+    derivatives = np.concatenate([derivatives for _, _, derivatives in pieces], axis=1)
+    roots = _derivative_roots(derivatives, widths)
+
+    # The value and curvature of the key at the roots, of which the roots with the right curvature are candidates
+    candidate_pieces, candidate_roots = np.nonzero(np.isfinite(roots))
+    t = roots[candidate_pieces, candidate_roots]
+    d = derivatives[:, candidate_pieces]
+    values = d[0] + d[1] * t + d[2] / 2 * t**2 + d[3] / 6 * t**3
+    curvatures = d[2] + d[3] * t
+    is_candidate = sign * curvatures < 0
+    candidate_systems = system_ids[candidate_pieces][is_candidate]
+    candidate_coordinates = (left[candidate_pieces] + t)[is_candidate]
+
+    # Select the highest (or lowest) candidate of every system, if it is not exceeded by the highest (or lowest) computed point
+    order = np.lexsort((-sign * values[is_candidate], candidate_systems))
+    selected_systems, first = np.unique(candidate_systems[order], return_index=True)
+    is_global = sign * values[is_candidate][order][first] >= sign * fallback_values[selected_systems]
+    selected_systems, first = selected_systems[is_global], first[is_global]
+    coordinates = fallback_coordinates.copy()
+    coordinates[selected_systems] = candidate_coordinates[order][first]
+    is_stationary = np.zeros(len(objects), dtype=bool)
+    is_stationary[selected_systems] = True
+
+    values = np.array([spline(coordinate) for spline, coordinate in zip(splines, coordinates)]).reshape(len(objects), len(keys))
+    stationary_points = pd.DataFrame(values, columns=keys, index=pd.Index([obj.name for obj in objects], name="name"))
+    # The IRC coordinate itself can also be one of the terms
+    if irc_coord not in keys:
+        stationary_points.insert(0, irc_coord, coordinates)
+    stationary_points["curvature"] = [float(np.ravel(spline(coordinate, nu=2))[0]) if spline.k >= 2 else 0.0 for spline, coordinate in zip(splines, coordinates)]
+    stationary_points["is_stationary"] = is_stationary
+    return stationary_points
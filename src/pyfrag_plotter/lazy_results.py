@@ -0,0 +1,112 @@
+""" Module for lazily loading the columns of a results file (.txt).
+
+A results file can contain many columns (e.g. VDD charges, overlaps and populations), while a plot usually only needs a few of them.
+A LazyResultsTable records the header and location of the file and only reads the columns that control the processing (trimming, duplicate removal, dispersion check and outlier removal).
+The resulting row selection is applied to every other column when it is requested for the first time.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from attrs import define, field
+
+from pyfrag_plotter.config.config_handler import Config
+from pyfrag_plotter.input.read_resultsfile import IncrementalResultsReader, _read_results_columns, read_results_header, select_columns
+from pyfrag_plotter.processing_funcs import get_processed_rows, get_processing_columns, take_processed_rows
+
+
+@define
+class LazyResultsTable:
+    """Attrs class containing the location, the columns and the processed row selection of a results file.
+
+    Attributes:
+        results_file (str): The path to the results file (.txt).
+        columns (List[str]): The columns that are available after processing, in the order of the file.
+        row_positions (np.ndarray): The positions of the rows in the results file that remain after processing.
+        index (pd.Index): The index of the processed data.
+        dtype (npt.DTypeLike): The floating point type of the data.
+        n_rows (int): The number of (unprocessed) rows in the results file.
+        reader (Optional[IncrementalResultsReader]): The reader that keeps the unprocessed rows of the columns that have been read (the columns needed for processing and the loaded columns),
+            such that `PyFragResultsObject.refresh` only parses the appended rows. It is created on the first refresh.
+
+    """
+
+    results_file: str
+    columns: List[str]
+    row_positions: np.ndarray
+    index: pd.Index
+    dtype: npt.DTypeLike = np.float64
+    n_rows: int = 0
+    reader: Optional[IncrementalResultsReader] = field(default=None, repr=False)
+
+    def load(self, keys: Sequence[str], keep_in_reader: bool = True) -> pd.DataFrame:
+        """Reads the specified columns from the results file and applies the processed row selection.
+
+        Args:
+            keys (Sequence[str]): The columns to read. Columns that are not available are ignored.
+            keep_in_reader (bool): If True, the unprocessed columns are added to the reader, such that `PyFragResultsObject.refresh` only parses the appended rows of these columns.
+                Use False for columns that are not added to the object. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The processed data of the requested columns.
+
+        """
+        keys = [key for key in keys if key in self.columns]
+        raw_data = _read_results_columns(self.results_file, keys, self.dtype)
+        if self.reader is not None and keep_in_reader:
+            if len(raw_data) >= self.reader.n_rows:
+                self.reader.add_columns(raw_data)
+            else:
+                # The file has been rewritten since it was read, so the next refresh reads it again
+                self.reader.reset()
+        return pd.DataFrame(raw_data.to_numpy()[self.row_positions], index=self.index, columns=keys)
+
+
+def create_lazy_results_table(
+    results_file: str,
+    trim_option: Optional[Union[str, float, int, Sequence]] = None,
+    trim_key: Optional[str] = None,
+    outlier_threshold: Optional[float] = None,
+    dtype: npt.DTypeLike = np.float64,
+    columns: Optional[Sequence[str]] = None,
+    monotonicity: Optional[Dict[str, int]] = None,
+    config: Optional[Config] = None,
+) -> Tuple[LazyResultsTable, pd.DataFrame]:
+    """Creates a LazyResultsTable by only reading and processing the columns that determine which rows are kept.
+
+    These are the trim key, the IRC coordinates (bondlength_x, angle_x, dihedral_x), "EnergyTotal" (outliers) and "Disp" (removed if zero everywhere).
+    The rows are processed like `process_results_file` does, such that the lazily loaded data is identical to the data of `create_pyfrag_object_from_dir`.
+    The values of the other columns are converted in chunks and discarded, see `IncrementalResultsReader`.
+
+    Args:
+        results_file (str): The path to the results file (.txt).
+        trim_option, trim_key, outlier_threshold, monotonicity, config: See `process_results_file`.
+        dtype (npt.DTypeLike): The floating point type of the data. Defaults to np.float64.
+        columns (Optional[Sequence[str]]): The columns (names or glob patterns) that can be loaded, see `read_results_file`. The columns needed for processing are always read.
+            Defaults to None (all columns).
+
+    Returns:
+        Tuple[LazyResultsTable, pd.DataFrame]: The lazy table and the processed data of the columns that have been read.
+
+    """
+    header = read_results_header(results_file)[1:]
+    processing_columns = get_processing_columns(trim_key, config)
+    if columns is not None:
+        header = select_columns(header, list(columns) + processing_columns)
+
+    # The dispersion term is read as well, since it is removed during processing if it is zero everywhere
+    control_columns = select_columns(header, processing_columns + ["Disp"])
+    reader = IncrementalResultsReader(results_file, dtype, columns=control_columns)
+    reader.read()
+    control_data = reader.data
+
+    row_positions, index, kept_columns = get_processed_rows(control_data, trim_option, trim_key, outlier_threshold, monotonicity, config)
+    processed_data = take_processed_rows(control_data, row_positions, index, kept_columns)
+
+    # The dispersion term is not available anymore if it has been removed during processing
+    columns = [key for key in header if key != "Disp" or key in kept_columns]
+
+    # The reader is not kept, since the unprocessed rows are only needed once the object is refreshed
+    table = LazyResultsTable(results_file=results_file, columns=columns, row_positions=row_positions, index=index, dtype=dtype, n_rows=reader.n_rows)
+    return table, processed_data
@@ -1,15 +1,30 @@
+from __future__ import annotations
+
 import inspect
 import math
-from typing import Callable, Optional, Sequence, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Tuple
 
-import matplotlib.figure
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.ticker import FormatStrFormatter, MaxNLocator
 
-from pyfrag_plotter import config
+from pyfrag_plotter.config.config_handler import Config
+from pyfrag_plotter.config.context import get_config
 from pyfrag_plotter.interpolate import interpolate_plot
 
+if TYPE_CHECKING:
+    import matplotlib.figure
+    import matplotlib.pyplot as plt
+
+
+def _import_pyplot() -> ModuleType:
+    """Imports matplotlib.pyplot when the first plot is made, after applying the plot parameters that |init| deferred in headless mode."""
+    from pyfrag_plotter import apply_pending_plot_parameters
+
+    apply_pending_plot_parameters()
+    import matplotlib.pyplot as plt
+
+    return plt
+
 
 def replace_overlapping_keys(func: Callable) -> Callable:
     """A decorator that replaces overlapping keys between kwargs and function arguments with top-level input.
@@ -69,6 +84,7 @@ def set_figure_details(
         clear_plot (bool, optional): Whether to clear the plot. If True, the current plot is cleared. Defaults to False.
         tight_layout (bool, optional): Whether to adjust the padding between and around the subplots. If True, the padding is adjusted. Defaults to True.
     """
+    plt = _import_pyplot()
     fig = plt.gcf() if fig is None else fig
 
     # Removes the empty axes from the figure
@@ -82,7 +98,8 @@ def set_figure_details(
 
     # Adds a title to the figure
     if title is not None:
-        fig.suptitle(title, fontweight="bold", y=1.00)
+        # The title is included in the layout again if it was excluded when the figure was cleared (see `clear_data_artists`)
+        fig.suptitle(title, fontweight="bold", y=1.00, in_layout=True)
 
     # Saves the figure in standard .png format.
     if savefig is not None:
@@ -95,6 +112,53 @@ def set_figure_details(
         plt.clf()
 
 
+def set_axes_style(ax: plt.Axes) -> None:
+    """
+    Applies the style of the axes that does not depend on the plotted data: the tick formatters, the tick markers and the borders of the graph.
+
+    This style is applied by |ax_details|, but only needs to be applied once to axes that are reused for several plots.
+
+    Args:
+        ax (plt.Axes): The axes to style.
+    """
+    from matplotlib.ticker import FormatStrFormatter
+
+    # Set the y-axis formatter to round to one decimal place
+    ax.xaxis.set_major_formatter(FormatStrFormatter("%.1f"))
+    ax.yaxis.set_major_formatter(FormatStrFormatter("%.1f"))
+
+    # Axes adjustments: tick markers
+    ax.tick_params(which="both", width=1.5)
+    ax.tick_params(which="major", length=7)
+
+    # Removes the top en right border of the graph
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+
+    # Makes the x and y axis wider
+    ax.spines["left"].set_linewidth(1.5)
+    ax.spines["bottom"].set_linewidth(1.5)
+
+    # Adds more spacing between ticks and the labels
+    ax.tick_params(pad=6)
+
+
+def clear_data_artists(ax: plt.Axes) -> None:
+    """
+    Removes the plotted data from the axes (lines, markers, collections such as the zero line, texts and legends) and the titles, but keeps the style of the axes (see `set_axes_style`).
+
+    Args:
+        ax (plt.Axes): The axes to clear.
+    """
+    for artist in [*ax.lines, *ax.collections, *ax.patches, *ax.texts, *ax.artists]:
+        artist.remove()
+    ax.legend_ = None
+    ax.set_title("")
+
+    # The title of the figure (see |fig_details|) is emptied and excluded from the layout, since the empty title would still change the layout of the next plot
+    ax.get_figure().suptitle("", in_layout=False)
+
+
 @replace_overlapping_keys
 def set_axes_details(
     ax: Optional[plt.Axes] = None,
@@ -107,6 +171,9 @@ def set_axes_details(
     line_style_labels: Optional[Sequence[str]] = None,
     title: Optional[str] = None,
     vline: float = 0.0,
+    config: Optional[Config] = None,
+    interpolate: bool = True,
+    style: bool = True,
 ) -> None:
     r"""
     Specifies axes options for making a shorter and cleaner code.
@@ -125,8 +192,16 @@ def set_axes_details(
         line_style_labels (Optional[Sequence[str]], optional): The labels for the line styles. If provided, these labels are used in the legend. Defaults to None.
         title (str | None, optional): The title of the subplot. If provided, this title is set. Defaults to None.
         vline (float | None, optional): The x-coordinate of the vertical line. If provided, a vertical line is drawn at this x-coordinate. Defaults to 0.0.
+        config (Optional[Config], optional): The config that provides the default axes options. Defaults to None (the config of the current context, see `get_config`).
+        interpolate (bool, optional): Whether to interpolate the data of the lines on the axes (see `interpolate_plot`).
+            The plots of the |plotter| draw lines that are already interpolated, and disable this. Defaults to True.
+        style (bool, optional): Whether to apply the style of the axes (see `set_axes_style`). Axes that are reused for several plots only need to be styled once. Defaults to True.
     """
+    plt = _import_pyplot()
+    from matplotlib.ticker import MaxNLocator
+
     ax = plt.gca() if ax is None else ax
+    config = get_config(config)
 
     # Plot labels
     ax.set_xlabel(x_label, labelpad=20)
@@ -153,10 +228,11 @@ def set_axes_details(
         ax.set_xlim(ax.get_xlim()[::-1][0], ax.get_xlim()[0])
 
     # Smoothens the plots in the specified range (x_lim) by interpolating the data using the scipy spline library
-    for line in ax.lines:
-        x, y = line.get_data()
-        X_, Y_ = interpolate_plot(x, y)
-        line.set_data(X_, Y_)
+    if interpolate:
+        for line in ax.lines:
+            x, y = line.get_data()
+            X_, Y_ = interpolate_plot(x, y, config=config)
+            line.set_data(X_, Y_)
 
     # Draws a vertical line at the specified point
     # First check for user input, else check for config file input
@@ -173,29 +249,15 @@ def set_axes_details(
     # Draws a horizontal line at y=0 (indicating the 'zero line')
     ax.hlines(0, ax.get_xlim()[0], ax.get_xlim()[1], colors=["grey"], linewidth=0.2)
 
-    # Set the y-axis formatter to round to one decimal place
-    ax.xaxis.set_major_formatter(FormatStrFormatter("%.1f"))
-    ax.yaxis.set_major_formatter(FormatStrFormatter("%.1f"))
-
-    # Axes adjustments: tick markers and number of ticks
-    ax.tick_params(which="both", width=1.5)
-    ax.tick_params(which="major", length=7)
+    # Tick formatters, tick markers and borders of the graph
+    if style:
+        set_axes_style(ax)
 
+    # Axes adjustments: number of ticks
     ax.xaxis.set_major_locator(MaxNLocator(n_max_x_ticks))
     # ax.yaxis.set_major_locator(MaxNLocator(n_max_y_ticks))
     ax.set_yticks(np.linspace(ax.get_ylim()[0], ax.get_ylim()[1], n_max_y_ticks))
 
-    # Removes the top en right border of the graph
-    ax.spines["top"].set_visible(False)
-    ax.spines["right"].set_visible(False)
-
-    # Makes the x and y axis wider
-    ax.spines["left"].set_linewidth(1.5)
-    ax.spines["bottom"].set_linewidth(1.5)
-
-    # Adds more spacing between ticks and the labels
-    ax.tick_params(pad=6)
-
     # Plots the legend below the title showing the system names
     if plot_legend:
         system_name_legend = ax.legend(frameon=False)
@@ -1,16 +1,26 @@
+from __future__ import annotations
+
 import logging
 import os
 import time
 from os.path import join as opj
-from typing import List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 from attrs import define, field
 
-from pyfrag_plotter import config
-from pyfrag_plotter.plot.plot_details import set_axes_details, set_figure_details
+from pyfrag_plotter.config.config_handler import Config
+from pyfrag_plotter.config.context import get_config
+from pyfrag_plotter.errors import PyFragInterpolationError
+from pyfrag_plotter.interpolate import find_stationary_points, interpolate_plot, spline_cache
+from pyfrag_plotter.plot.plot_details import _import_pyplot, clear_data_artists, set_axes_details, set_axes_style, set_figure_details
 from pyfrag_plotter.pyfrag_object import PyFragResultsObject
 
+if TYPE_CHECKING:
+    import matplotlib.figure
+    import matplotlib.pyplot as plt
+
 
 def plot_logger(log_level=logging.INFO):
     def decorator(func):
@@ -26,6 +36,11 @@ def plot_logger(log_level=logging.INFO):
     return decorator
 
 
+def _get_peak_type(config: Optional[Config] = None) -> Optional[str]:
+    peak_type = get_config(config).get("SHARED", "stat_point_type")
+    return peak_type if peak_type != "none" else None
+
+
 @define
 class PlotInfo:
     """Class to hold information about the plot to be generated.
@@ -41,9 +56,61 @@ class PlotInfo:
 
     irc_coord: str
     irc_coord_label: str
-    colours: List[str] = field(factory=lambda: config.get("SHARED", "colours"))
-    line_styles: List[str] = field(factory=lambda: config.get("SHARED", "line_styles"))
-    peak_type: Optional[str] = field(factory=lambda: config.get("SHARED", "stat_point_type") if config.get("SHARED", "stat_point_type") != "none" else None)
+    colours: List[str] = field(factory=lambda: get_config().get("SHARED", "colours"))
+    line_styles: List[str] = field(factory=lambda: get_config().get("SHARED", "line_styles"))
+    peak_type: Optional[str] = field(factory=_get_peak_type)
+
+
+# ====================================================================================================
+# Render plan ========================================================================================
+# ====================================================================================================
+
+# The options of the [SHARED] section that determine the final data of a curve (see `interpolate_plot`)
+_CURVE_OPTIONS = ["n_interpolation_points", "reverse_x_axis", "interpolation_tolerance", "interpolation_method"]
+
+
+@define
+class Curve:
+    """A line of a plot with its final (interpolated) data.
+
+    Attributes:
+        x (np.ndarray): The x-axis data of the line.
+        y (np.ndarray): The y-axis data of the line.
+        colour (str): The colour of the line.
+        line_style (str): The line style of the line.
+        marker (str): The marker of the line. Defaults to "" (no markers).
+        label (Optional[str]): The label of the line in the legend. Defaults to None (not in the legend).
+
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    colour: str
+    line_style: str
+    marker: str = ""
+    label: Optional[str] = None
+
+
+@define
+class RenderPlan:
+    """The curves and peak markers of a plot, which are prepared before any artist is created such that every artist is created once with its final data.
+
+    Attributes:
+        curves (List[Curve]): The lines of the plot, in the order in which they are drawn.
+        peaks (List[Tuple[float, float, str]]): The positions and colours of the peak markers.
+
+    """
+
+    curves: List[Curve] = field(factory=list)
+    peaks: List[Tuple[float, float, str]] = field(factory=list)
+
+    def render(self, ax: plt.Axes) -> None:
+        """Draws the curves and peak markers on the axes."""
+        for curve in self.curves:
+            ax.plot(curve.x, curve.y, label=curve.label, color=curve.colour, linestyle=curve.line_style, marker=curve.marker, zorder=1)
+
+        for x, y, colour in self.peaks:
+            ax.scatter(x, y, color=colour, s=90, zorder=2)
 
 
 class Plotter:
@@ -59,11 +126,23 @@ class Plotter:
         path (str): The directory to save the plots to.
         plot_info (PlotInfo): An instance of the PlotInfo class that contains information about the plot, such as the
                             line styles and colors.
+        config (Optional[Config]): The config used for the plots. If None, the config of the current context is used (see `get_config`).
+        recycle_figures (bool): Whether all plots are made on the same (styled) figure, which is cleared between the plots. If True, the figure
+                            that a plot method returns is only valid until the next plot is made.
 
-    Note: The plotter object can be used with a "with" statement to ensure that the plot directory is removed if it's empty.
+    Note: The plotter object can be used with a "with" statement to ensure that the plot directory is removed if it's empty and that the figures are closed.
+    The prepared (interpolated) curves are cached, such that a line that is shown in several plots (e.g. "Int" in the ASM and EDA plots) is prepared once.
     """
 
-    def __init__(self, name: str, plot_dir: str, pyfrag_objects: Sequence[PyFragResultsObject], irc_coord: Sequence[str]):
+    def __init__(
+        self,
+        name: str,
+        plot_dir: str,
+        pyfrag_objects: Sequence[PyFragResultsObject],
+        irc_coord: Sequence[str],
+        config: Optional[Config] = None,
+        recycle_figures: bool = True,
+    ):
         """
         Initializes the Plotter object.
 
@@ -72,11 +151,27 @@ class Plotter:
             plot_dir (str): The directory to save the plots to.
             pyfrag_objects (Sequence[PyFragResultsObject]): A list of PyFragResultsObject objects that contain the data to be plotted.
             irc_coord (Sequence[str]): A sequence of two strings that specify the IRC coordinate and its label.
+            config (Optional[Config], optional): The config used for the plots. Defaults to None (the config of the current context when plotting).
+            recycle_figures (bool, optional): Whether all plots are made on the same figure, such that the memory does not grow with the number of plots. Defaults to True.
         """
         self.name = name
         self.objects = pyfrag_objects
         self.path = opj(plot_dir, name)
-        self.plot_info = PlotInfo(irc_coord=irc_coord[0], irc_coord_label=irc_coord[1])
+        self.config = config
+        self.recycle_figures = recycle_figures
+        plot_config = get_config(config)
+        self.plot_info = PlotInfo(
+            irc_coord=irc_coord[0],
+            irc_coord_label=irc_coord[1],
+            colours=plot_config.get("SHARED", "colours"),
+            line_styles=plot_config.get("SHARED", "line_styles"),
+            peak_type=_get_peak_type(plot_config),
+        )
+        # The prepared curves per (object index, key): the dataframe and config options they were prepared from, and the x and y data
+        self._curves: Dict[Tuple[int, str], Tuple[pd.DataFrame, List, np.ndarray, np.ndarray]] = {}
+        # The figures that are opened by the plotter and the (styled) figure and axes that are reused for the next plot
+        self._figures: List[matplotlib.figure.Figure] = []
+        self._recycled: Optional[Tuple[matplotlib.figure.Figure, plt.Axes]] = None
 
     def __enter__(self):
         """
@@ -92,49 +187,165 @@ class Plotter:
         """
         Cleans up the plotter object after use with a "with" statement.
 
-        This method makes sure to close the plotter object and remove the plot directory if it's empty.
+        This method makes sure to close the plotter object (and its figures) and remove the plot directory if it's empty.
         """
+        self.close()
         for root, dirs, files in os.walk(self.path, topdown=False):
             for dir in dirs:
                 dir_path = os.path.join(root, dir)
                 if len(os.listdir(dir_path)) == 0:
                     os.rmdir(dir_path)
 
+    def close(self) -> None:
+        """Closes all figures that are opened by the plotter."""
+        if self._figures:
+            plt = _import_pyplot()
+            for fig in self._figures:
+                plt.close(fig)
+        self._figures.clear()
+        self._recycled = None
+
+    def new_figure(self) -> Tuple[matplotlib.figure.Figure, plt.Axes]:
+        """
+        Returns the figure and axes for the next plot.
+
+        If figures are recycled, the figure of the previous plot is cleared (see `clear_data_artists`) and reused, keeping the style of its axes.
+        A new (styled) figure is only created for the first plot, if the axes of the previous plot were removed (e.g. with `clear_plot=True`)
+        or if the figure was closed (e.g. with `plt.close("all")`).
+
+        Returns:
+            fig (plt.Figure): The figure object.
+            ax (plt.Axes): The axes object.
+        """
+        plt = _import_pyplot()
+
+        if self.recycle_figures and self._recycled is not None:
+            fig, ax = self._recycled
+            if plt.fignum_exists(fig.number) and ax in fig.axes:
+                clear_data_artists(ax)
+                plt.figure(fig.number)
+                return fig, ax
+            plt.close(fig)
+            self._figures.remove(fig)
+            self._recycled = None
+
+        fig = plt.figure()
+        ax = fig.add_subplot(111)
+        self._figures.append(fig)
+        if self.recycle_figures:
+            set_axes_style(ax)
+            self._recycled = (fig, ax)
+        return fig, ax
+
     # ------------------------------------------------------------------------------------------------------------- #
     # ------------------------------ ASM, EDA and ASM extra strain plotting routines ------------------------------ #
     # ------------------------------------------------------------------------------------------------------------- #
 
-    def standard_plot_routine(self, keys: Sequence[str], ax: Optional[plt.Axes] = None, markers: Optional[Sequence[str]] = None):
+    def standard_plot_routine(self, keys: Sequence[str], ax: Optional[plt.Axes] = None, markers: Optional[Sequence[str]] = None, config: Optional[Config] = None):
         """
         The standard plot routine for the EDA, ASM and extra strain plots.
 
         This method plots the specified keys for each PyFragResultsObject in the plotter. It supports plotting of multiple keys
-        on the same axes, and allows for customization of the line styles and markers.
+        on the same axes, and allows for customization of the line styles and markers. The lines are drawn with their final (interpolated) data
+        (see `build_render_plan`), so the axes should be finished with `set_axes_details(..., interpolate=False)`.
 
         Args:
             keys (Sequence[str]): The keys to plot. These should match the keys in the corresponding dictionary type (asm, eda or extra_strain).
             ax (Optional[plt.Axes], optional): The axes to plot on. If None, the current axes is used. Defaults to None.
             markers (Optional[Sequence[str]], optional): The markers to use for the lines. If None, no markers are used. Defaults to None.
+            config (Optional[Config], optional): The config that provides the interpolation options. Defaults to None (the config of the plotter).
         """
-        ax = plt.gca() if ax is None else ax
+        ax = _import_pyplot().gca() if ax is None else ax
+        self.build_render_plan(keys, markers, config).render(ax)
+
+    def build_render_plan(self, keys: Sequence[str], markers: Optional[Sequence[str]] = None, config: Optional[Config] = None) -> RenderPlan:
+        """
+        Prepares the curves (one per key and object) and the peak markers of a plot, without creating any artist.
+
+        Args:
+            keys (Sequence[str]): The keys to plot. The peak markers are placed on the lines of the first key.
+            markers (Optional[Sequence[str]], optional): The markers to use for the lines of each object. If None, no markers are used. Defaults to None.
+            config (Optional[Config], optional): The config that provides the interpolation options. Defaults to None (the config of the plotter).
+
+        Returns:
+            RenderPlan: The curves, with the labels (object names) on the curves of the first key, and the peak markers.
+        """
+        config = get_config(self.config if config is None else config)
         markers = [""] * len(self.objects) if markers is None else markers
 
-        x_axes = [obj.get_x_axis(self.plot_info.irc_coord) for obj in self.objects]
+        plan = RenderPlan()
         for i, (line_style, term) in enumerate(zip(self.plot_info.line_styles, keys)):
-            for x_axis, colour, obj, line_marker in zip(x_axes, self.plot_info.colours, self.objects, markers):
-                term_data = obj.get_data_of_key(term)  # eda, asm or extra_strain
+            for j, (colour, obj, line_marker) in enumerate(zip(self.plot_info.colours, self.objects, markers)):
+                x, y = self.prepare_curve(j, term, config)
+                plan.curves.append(Curve(x, y, colour, line_style, line_marker, label=obj.name if i == 0 else None))
+
+        # If a peak type is specified, mark the peaks on the lines of the first key
+        if self.plot_info.peak_type is not None and keys:
+            x_axes = [obj.get_x_axis(self.plot_info.irc_coord) for obj in self.objects]
+            plan.peaks = [(x, y, colour) for (x, y), colour in zip(self._get_peak_points(keys[0], x_axes, config), self.plot_info.colours)]
+        return plan
 
-                # Plot the data. If it's the first object, associate a label with the line
-                if i == 0:
-                    ax.plot(x_axis, term_data, label=obj.name, color=colour, linestyle=line_style, marker=line_marker, zorder=1)
+    def prepare_curve(self, index: int, key: str, config: Optional[Config] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the final data of the line of a key of an object, i.e. the interpolated data (see `interpolate_plot`).
+
+        The curves are cached per object and key, and prepared again if the data of the object (e.g. after `PyFragResultsObject.refresh`) or the interpolation options change.
+
+        Args:
+            index (int): The index of the object in the plotter.
+            key (str): The key to plot (eda, asm or extra_strain).
+            config (Optional[Config], optional): The config that provides the interpolation options. Defaults to None (the config of the plotter).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The x-axis and y-axis data of the line.
+        """
+        config = get_config(self.config if config is None else config)
+        obj = self.objects[index]
+        options = [config.get("SHARED", option) for option in _CURVE_OPTIONS]
+
+        cached = self._curves.get((index, key))
+        if cached is not None and cached[0] is obj.dataframe and cached[1] == options:
+            return cached[2], cached[3]
+
+        x, y = interpolate_plot(obj.get_x_axis(self.plot_info.irc_coord), obj.get_data_of_key(key), config=config)
+        self._curves[(index, key)] = (obj.dataframe, options, x, y)
+        return x, y
+
+    def _get_peak_points(self, key: str, x_axes: Sequence[np.ndarray], config: Config) -> List[Tuple[float, float]]:
+        """Returns the positions of the peak markers on the lines of the key, with the peaks located on the splines of the "EnergyTotal" data (see `find_stationary_points`).
+
+        The height of a marker is taken from the interpolator of the configured interpolation method, such that the marker lies on the drawn line.
+        With linear interpolation (or without interpolation), the lines have their peaks at the computed points, so the computed points with the highest (or lowest) energy are marked.
+        These are marked as well if the data cannot be interpolated, or if the stationary point on the spline is not the global extreme (e.g. the energy keeps decreasing after a local minimum).
+        """
+        peak_indices = [obj.get_peak_index(peak=self.plot_info.peak_type) for obj in self.objects]  # type: ignore since peak_type is not None
+        computed_peaks = [(x_axis[peak_index], obj.get_data_of_key(key)[peak_index]) for x_axis, obj, peak_index in zip(x_axes, self.objects, peak_indices)]
+
+        method = config.get("SHARED", "interpolation_method")
+        if method != "linear" and config.get("SHARED", "n_interpolation_points") != 0:
+            try:
+                stationary_points = find_stationary_points(self.objects, self.plot_info.irc_coord, terms=[key], peak=self.plot_info.peak_type)  # type: ignore since peak_type is not None
+            except (PyFragInterpolationError, ValueError) as e:
+                logging.log(logging.WARNING, f"{e}\nMarking the computed points with the {self.plot_info.peak_type} energy instead.")
+                return computed_peaks
+
+            # The same data as the lines (see `interpolate_plot`), such that the interpolators of the lines are reused from the cache
+            reverse_axis = config.get("SHARED", "reverse_x_axis")
+            peak_points = []
+            for x_axis, obj, computed_peak, (x, y, is_stationary) in zip(
+                x_axes, self.objects, computed_peaks, stationary_points[[self.plot_info.irc_coord, key, "is_stationary"]].itertuples(index=False)
+            ):
+                if not is_stationary:
+                    peak_points.append(computed_peak)
+                elif method == "cubic":
+                    peak_points.append((x, y))
                 else:
-                    # Otherwise, just plot the data
-                    ax.plot(x_axis, term_data, color=colour, linestyle=line_style, marker=line_marker, zorder=1)
+                    y_axis = obj.get_data_of_key(key)
+                    x_axis, y_axis = (x_axis[::-1], y_axis[::-1]) if reverse_axis else (x_axis, y_axis)
+                    peak_points.append((x, float(spline_cache.get_interpolator(x_axis, y_axis, method)(x))))
+            return peak_points
 
-                # If a peak type is specified, plot the peak
-                if i == 0 and self.plot_info.peak_type is not None:
-                    peak_index = obj.get_peak_index(peak=self.plot_info.peak_type)
-                    ax.scatter(x_axis[peak_index], term_data[peak_index], color=colour, s=90, zorder=2)
+        return computed_peaks
 
     @plot_logger()
     def plot_asm(self, keys: Optional[List[str]] = None, **kwargs) -> Tuple[plt.Figure, plt.Axes]:
@@ -151,23 +362,23 @@ class Plotter:
             fig (plt.Figure): The figure object.
             ax (plt.Axes): The axes object.
         """
-        fig = plt.figure()
-        ax = fig.add_subplot(111)
+        fig, ax = self.new_figure()
 
         # Get the keys to plot. If none are specified, plot all of them
         if keys is None:
-            asm_keys: List[str] = config.get("ASM", "asm_keys")
+            asm_keys: List[str] = get_config(self.config).get("ASM", "asm_keys")
         else:
             asm_keys = keys
 
         # Plot the keys
-        self.standard_plot_routine(asm_keys, ax)
+        kwargs.setdefault("config", self.config)
+        self.standard_plot_routine(asm_keys, ax, config=kwargs["config"])
 
         # Since the same keys are plotted for all objects, we can just use the first object to get the labels
         labels = self.objects[0].get_plot_labels(asm_keys)
 
-        # Set the key-specific plot details
-        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs)
+        # Set the key-specific plot details. The lines are already interpolated by the render plan
+        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs, interpolate=False, style=not self.recycle_figures)
         set_figure_details(fig=fig, title=f"ASM_{'_'.join(asm_keys)}", savefig=opj(self.path, f"ASM_{'_'.join(asm_keys)}.png"), line_style_labels=labels, **kwargs)
         return fig, ax
 
@@ -186,22 +397,22 @@ class Plotter:
             fig (plt.Figure): The figure object.
             ax (plt.Axes): The axes object.
         """
-        fig = plt.figure()
-        ax = fig.add_subplot(111)
+        fig, ax = self.new_figure()
 
         # Get the keys to plot. If none are specified, plot all of them
         if keys is None:
-            eda_keys: List[str] = config.get("EDA", "eda_keys")
+            eda_keys: List[str] = get_config(self.config).get("EDA", "eda_keys")
         else:
             eda_keys = keys
 
-        self.standard_plot_routine(eda_keys, ax)
+        kwargs.setdefault("config", self.config)
+        self.standard_plot_routine(eda_keys, ax, config=kwargs["config"])
 
         # Since the same keys are plotted for all objects, we can just use the first object to get the labels
         labels = self.objects[0].get_plot_labels(eda_keys)
 
-        # Set the key-specific plot details
-        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs)
+        # Set the key-specific plot details. The lines are already interpolated by the render plan
+        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs, interpolate=False, style=not self.recycle_figures)
         set_figure_details(fig=fig, title=f"EDA_{'_'.join(eda_keys)}", savefig=opj(self.path, f"EDA_{'_'.join(eda_keys)}.png"), **kwargs)
         return fig, ax
 
@@ -224,22 +435,22 @@ class Plotter:
         Raises:
             ValueError: If any of the specified keys do not exist in the extra strain dictionary.
         """
-        fig = plt.figure()
-        ax = fig.add_subplot(111)
+        fig, ax = self.new_figure()
 
         # Get the keys to plot. If none are specified, plot all of them
         if keys is None:
-            extra_strain_keys: List[str] = config.get("ASM", "asm_strain_keys")
+            extra_strain_keys: List[str] = get_config(self.config).get("ASM", "asm_strain_keys")
         else:
             extra_strain_keys = keys
 
-        self.standard_plot_routine(extra_strain_keys, ax)
+        kwargs.setdefault("config", self.config)
+        self.standard_plot_routine(extra_strain_keys, ax, config=kwargs["config"])
 
         # Since the same keys are plotted for all objects, we can just use the first object to get the labels
         labels = self.objects[0].get_plot_labels(extra_strain_keys)
 
-        # Set the key-specific plot details
-        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs)
+        # Set the key-specific plot details. The lines are already interpolated by the render plan
+        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs, interpolate=False, style=not self.recycle_figures)
         set_figure_details(fig=fig, title=f"Strain_{'_'.join(extra_strain_keys)}", savefig=opj(self.path, f"ASM_{'_'.join(extra_strain_keys)}.png"), **kwargs)
         return fig, ax
 
@@ -306,14 +517,14 @@ class Plotter:
         Raises:
             ValueError: If any of the specified keys do not exist in the dictionaries of the PyFragResultsObject objects.
         """
-        fig = plt.figure()
-        ax = fig.add_subplot(111)
+        fig, ax = self.new_figure()
 
-        self.standard_plot_routine(keys, ax)
+        kwargs.setdefault("config", self.config)
+        self.standard_plot_routine(keys, ax, config=kwargs["config"])
 
         labels = self.objects[0].get_plot_labels(keys)
 
-        # Set the key-specific plot details
-        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs)
+        # Set the key-specific plot details. The lines are already interpolated by the render plan
+        set_axes_details(ax=ax, x_label=self.plot_info.irc_coord_label, line_style_labels=labels, **kwargs, interpolate=False, style=not self.recycle_figures)
         set_figure_details(fig=fig, title=title, savefig=opj(self.path, f"{'_'.join(keys)}.png"), **kwargs)
         return fig, ax
@@ -1,9 +1,11 @@
 import math
-from typing import Any, Callable, Dict, Optional, Sequence, Union
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
 
-from pyfrag_plotter import config
+from pyfrag_plotter.config.config_handler import Config
+from pyfrag_plotter.config.context import get_config
 from pyfrag_plotter.errors import PyFragResultsProcessingError, PyFragResultsProcessingWarning
 
 # ====================================================================================================
@@ -16,6 +18,8 @@ def process_results_file(
     trim_option: Optional[Union[str, float, int, Sequence]] = None,
     trim_key: Optional[str] = None,
     outlier_threshold: Optional[float] = None,
+    monotonicity: Optional[Dict[str, int]] = None,
+    config: Optional[Config] = None,
 ) -> pd.DataFrame:
     """Processes the results file data.
 
@@ -24,6 +28,8 @@ def process_results_file(
         trim_option: An optional argument specifying how to trim the data. Can be "max", "min", "x_limits", or None.
         trim_key: An optional argument specifying the key to use for trimming the data. Can be "EnergyTotal" or None.
         outlier_threshold: An optional argument specifying the threshold for removing outliers. Can be a float or None.
+        monotonicity: An optional dictionary with the known monotonicity of the IRC coordinates, which is filled in when trimming. See `trim_data`.
+        config: The config that provides the values of the arguments that are not specified. If None, the config of the current context is used (see `get_config`).
 
     Returns:
         A pandas DataFrame containing the processed results file data.
@@ -32,19 +38,24 @@ def process_results_file(
         PyFragResultsProcessingError: If an error occurs during processing.
 
     """
-    # Trim the data
-    df = trim_data(df, trim_option, trim_key)
+    # Trims the data, removes duplicate x values, removes the dispersion term if it is 0.0 everywhere and removes outliers
+    # These steps are fused into a single selection of rows, see `process_results_file_fused`
+    return process_results_file_fused(df, trim_option, trim_key, outlier_threshold, monotonicity, config)
 
-    # Remove duplicate x values
-    df = remove_duplicate_x_values_dataframe(df)
 
-    # Remove the dispersion term if it is 0.0 everywhere
-    df = remove_dispersion_term(df)
+def get_processing_columns(trim_key: Optional[str] = None, config: Optional[Config] = None) -> List[str]:
+    """Returns the columns (names and glob patterns) that `process_results_file` needs, i.e. the trim key, the IRC coordinates and "EnergyTotal" (outliers).
 
-    # Remove outliers
-    df = remove_outliers(df, outlier_threshold)
+    Args:
+        trim_key: An optional argument specifying the key to use for trimming the data. If None, the trim_key from the configuration file is used.
+        config: The config that provides the trim_key. If None, the config of the current context is used (see `get_config`).
 
-    return df
+    Returns:
+        List[str]: The column names and glob patterns, which can be passed to the `columns` argument of `read_results_file`.
+
+    """
+    trim_key = get_config(config).get("SHARED", "trim_key") if trim_key is None else trim_key
+    return list(dict.fromkeys([trim_key, "bondlength_*", "angle_*", "dihedral_*", "EnergyTotal"]))
 
 
 # ====================================================================================================
@@ -52,43 +63,141 @@ def process_results_file(
 # ====================================================================================================
 
 
-def _trim_data_str(df: pd.DataFrame, trim_option: str, trim_key: str) -> pd.DataFrame:
-    """Private function that performs the actual trimming of the dataframe with a string trim_option"""
+def _is_x_axis_key(key: str) -> bool:
+    return key.startswith("bondlength_") or key.startswith("angle_") or key.startswith("dihedral_")
+
+
+def column_monotonicity(values: np.ndarray) -> int:
+    """Returns 1 if the values are non-decreasing, -1 if they are non-increasing and 0 otherwise. Values containing NaN are never monotonic, constant values are non-decreasing."""
+    if len(values) < 2:
+        return 1 if len(values) == 1 and not np.isnan(values[0]) else 0
+    diff = np.diff(values)
+    # Comparisons with NaN are False, so NaN values make the column non-monotonic
+    if np.all(diff >= 0):
+        return 1
+    if np.all(diff <= 0):
+        return -1
+    return 0
+
+
+def _get_monotonicity(df: pd.DataFrame, trim_key: str, monotonicity: Optional[Dict[str, int]]) -> int:
+    """Private function that returns the (cached) monotonicity of the trim key. Only the IRC coordinates are checked, since the energies are hardly ever monotonic."""
+    if monotonicity is not None and trim_key in monotonicity:
+        return monotonicity[trim_key]
+    if not _is_x_axis_key(trim_key):
+        return 0
+
+    direction = column_monotonicity(df[trim_key].to_numpy())
+    if monotonicity is not None:
+        monotonicity[trim_key] = direction
+    return direction
+
+
+def _bisect_first(predicate: Callable[[int], bool], low: int, high: int) -> int:
+    """Private function that returns the first position in [low, high) for which the (False ... True) predicate is True, or high if there is none."""
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _sorted_argbest(values: np.ndarray, trim_option: str, direction: int) -> int:
+    """Private function that returns the position of the first maximum or minimum of monotonic values with a binary search, like np.nanargmax/np.nanargmin."""
+    if (trim_option == "max") != (direction > 0):
+        return 0
+
+    # The extreme value is the last value, which can be repeated at the end of the column
+    if direction > 0:
+        return int(np.searchsorted(values, values[-1], "left"))
+    return len(values) - int(np.searchsorted(values[::-1], values[-1], "right"))
+
+
+def _sorted_nearest(values: np.ndarray, target: float, direction: int) -> int:
+    """Private function that returns the position of the first value closest to the target for monotonic values with a binary search, like np.nanargmin(np.abs(values - target))."""
+    # The values before the split lie on one side of the target and their distances to the target decrease, the distances of the other values increase
+    if direction > 0:
+        split = int(np.searchsorted(values, target, "left"))
+    else:
+        split = len(values) - int(np.searchsorted(values[::-1], target, "right"))
+
+    if split == 0:
+        return split
+    closest_before = abs(values[split - 1] - target)
+    if split < len(values) and abs(values[split] - target) < closest_before:
+        return split
+
+    # Several values before the split can have the same (rounded) distance to the target, of which the first one is selected
+    return _bisect_first(lambda i: abs(values[i] - target) <= closest_before, 0, split)
+
+
+def _sorted_limits(values: np.ndarray, x_limits: Sequence[float], direction: int) -> slice:
+    """Private function that returns the positions of the values within the x limits for monotonic values with a binary search."""
+    if direction > 0:
+        return slice(int(np.searchsorted(values, x_limits[0], "left")), int(np.searchsorted(values, x_limits[1], "right")))
+    reversed_values = values[::-1]
+    n_values = len(values)
+    return slice(n_values - int(np.searchsorted(reversed_values, x_limits[1], "right")), n_values - int(np.searchsorted(reversed_values, x_limits[0], "left")))
+
+
+def _label_slice_end(df: pd.DataFrame, position: int) -> slice:
+    """Private function that returns the positions selected by the label-based slicing of `trim_data` (df.loc[:label]), which ends after the (last) row with the label of the selected row."""
+    return slice(None, df.index.slice_locs(end=df.index[position])[1])
+
+
+def _trim_positions_str(df: pd.DataFrame, trim_option: str, trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> slice:
+    """Private function that returns the positions of the rows that are kept when trimming with a string trim_option"""
     trim_option = trim_option.lower().strip()
+    if trim_option not in ["max", "min"]:
+        return slice(None)
 
-    if trim_option in ["false", "none"]:
-        return df
+    values = df[trim_key].to_numpy()
+    direction = _get_monotonicity(df, trim_key, monotonicity)
+    if direction != 0:
+        position = _sorted_argbest(values, trim_option, direction)
+    else:
+        position = int(np.nanargmax(values) if trim_option == "max" else np.nanargmin(values))
+    return _label_slice_end(df, position)
 
-    if trim_option == "max":
-        max_index = df[trim_key].idxmax()
-        df = df.loc[:max_index]
-    elif trim_option == "min":
-        min_index = df[trim_key].idxmin()
-        df = df.loc[:min_index]
 
-    return df
+def _trim_positions_float(df: pd.DataFrame, trim_option: float, trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> slice:
+    """Private function that returns the positions of the rows that are kept when trimming with a float trim_option"""
+    values = df[trim_key].to_numpy()
+    direction = _get_monotonicity(df, trim_key, monotonicity)
+    if direction != 0:
+        position = _sorted_nearest(values, trim_option, direction)
+    else:
+        position = int(np.nanargmin(np.abs(values - trim_option)))
+    return _label_slice_end(df, position)
+
+
+def _trim_data_str(df: pd.DataFrame, trim_option: str, trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> pd.DataFrame:
+    """Private function that performs the actual trimming of the dataframe with a string trim_option"""
+    return df.iloc[_trim_positions_str(df, trim_option, trim_key, monotonicity)]
 
 
-def _trim_data_float(df: pd.DataFrame, trim_option: float, trim_key: str) -> pd.DataFrame:
+def _trim_data_float(df: pd.DataFrame, trim_option: float, trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> pd.DataFrame:
     """Private function that performs the actual trimming of the dataframe with a float trim_option"""
-    index = (df[trim_key] - trim_option).abs().idxmin()
-    df = df.loc[:index]
-    return df
+    return df.iloc[_trim_positions_float(df, trim_option, trim_key, monotonicity)]
 
 
-def _trim_data_int(df: pd.DataFrame, trim_option: int, trim_key: str) -> pd.DataFrame:
+def _trim_data_int(df: pd.DataFrame, trim_option: int, trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> pd.DataFrame:
     """Private function that performs the actual trimming of the dataframe with a integer trim_option"""
     df = df.iloc[:trim_option]
     return df
 
 
-def _trim_data_sequence(df: pd.DataFrame, trim_option: Sequence[float], trim_key: str) -> pd.DataFrame:
-    """Private function that performs the actual trimming of the dataframe with a sequence trim_option"""
+def _trim_positions_sequence(df: pd.DataFrame, trim_option: Sequence[float], trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> Union[slice, np.ndarray]:
+    """Private function that returns the positions of the rows that are kept when trimming with a sequence trim_option.
+
+    For monotonic IRC coordinates, the rows within the x limits are found with a binary search and returned as a slice. Otherwise, the column is scanned.
+    """
 
     x_limits = trim_option
-    reverse_axis = bool(config.get("SHARED", "reverse_x_axis"))
 
-    if not (trim_key.startswith("bondlength_") or trim_key.startswith("angle_") or trim_key.startswith("dihedral_")):
+    if not _is_x_axis_key(trim_key):
         PyFragResultsProcessingWarning(
             section="_trim_data_sequence", message=f"trim_key {trim_key} is not valid. Valid options are bondlength_x, angle_x, and dihedral_x. Proceeding with bondlength_1."
         )
@@ -98,18 +207,25 @@ def _trim_data_sequence(df: pd.DataFrame, trim_option: Sequence[float], trim_key
         raise PyFragResultsProcessingError(key="trim_data_sequence", message=f"Invalid x_limits {x_limits} specified in the configuration file.")
 
     x_data: np.ndarray = df[trim_key].values  # type: ignore since it is a numpy array
+    direction = _get_monotonicity(df, trim_key, monotonicity)
+    if direction != 0:
+        x_positions = _sorted_limits(x_data, x_limits, direction)
+        if x_positions.start >= x_positions.stop:
+            raise PyFragResultsProcessingError(key="trim_data_sequence", message=f"No data points within the specified x limits {x_limits} for key {trim_key}.")
+        return x_positions
+
     x_min = max(x_data.min(), x_limits[0])
     x_max = min(x_data.max(), x_limits[1])
     x_indices = np.where((x_data >= x_min) & (x_data <= x_max))[0]
     if x_indices.size == 0:
         raise PyFragResultsProcessingError(key="trim_data_sequence", message=f"No data points within the specified x limits {x_limits} for key {trim_key}.")
 
-    if not reverse_axis:
-        x_indices = np.concatenate(([max(0, x_indices[0])], x_indices, [min(x_data.size - 1, x_indices[-1])]))
-    else:
-        x_indices = np.concatenate(([max(0, x_indices[0])], x_indices, [min(x_data.size - 1, x_indices[-1])]))
+    return x_indices
+
 
-    df = df.iloc[x_indices]
+def _trim_data_sequence(df: pd.DataFrame, trim_option: Sequence[float], trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> pd.DataFrame:
+    """Private function that performs the actual trimming of the dataframe with a sequence trim_option"""
+    df = df.iloc[_trim_positions_sequence(df, trim_option, trim_key, monotonicity)]
     return df
 
 
@@ -121,7 +237,38 @@ _overload_types: Dict[Any, Callable[..., pd.DataFrame]] = {
 }
 
 
-def trim_data(df: pd.DataFrame, trim_option: Optional[Union[str, float, int, Sequence]] = None, trim_key: Optional[str] = None) -> pd.DataFrame:
+def _resolve_trim_arguments(
+    df: pd.DataFrame, trim_option: Optional[Union[str, float, int, Sequence]], trim_key: Optional[str], config: Optional[Config] = None
+) -> Tuple[Union[str, float, int, Sequence], str]:
+    """Private function that reads the trim_option and trim_key from the configuration file if they are not specified and checks them."""
+    config = get_config(config)
+    trim_key = config.get("SHARED", "trim_key") if trim_key is None else trim_key
+    trim_option = config.get("SHARED", "trim_option") if trim_option is None else trim_option
+
+    # Sometimes, users might specify a trim_key in the config file that is not in the dataframe
+    if trim_key not in df.columns:
+        raise PyFragResultsProcessingError(key="trim_data", message=f"trim_key {trim_key} is not a valid key. Check if 'trim_key' in the config file is correct.")
+
+    # Check if the trim_option is a valid type such as a string, float, or integer
+    if not isinstance(trim_option, (str, float, int, Sequence)):
+        raise PyFragResultsProcessingError(key="trim_data", message=f"trim_option {trim_option} is not a valid type. Valid types are str, float, and int")
+
+    # Handle the case where the trim_option is a string but needs to be converted to a sequence (i.e. x_lim)
+    if isinstance(trim_option, str):
+        trim_option = trim_option.lower().strip()
+        if trim_option in ["x_lim", "xlim", "x_limits", "xlimits"]:
+            trim_option = tuple(config.get("SHARED", "x_lim"))
+
+    return trim_option, trim_key
+
+
+def trim_data(
+    df: pd.DataFrame,
+    trim_option: Optional[Union[str, float, int, Sequence]] = None,
+    trim_key: Optional[str] = None,
+    monotonicity: Optional[Dict[str, int]] = None,
+    config: Optional[Config] = None,
+) -> pd.DataFrame:
     """'Overloaded' function to trim the dataframe based on the type of the trim_option.
 
     This function trims the given dataframe based on the type of the trim_option.
@@ -132,6 +279,9 @@ def trim_data(df: pd.DataFrame, trim_option: Optional[Union[str, float, int, Seq
         df (pd.DataFrame): The dataframe to trim.
         trim_parameter (Optional[Union[str, float, int]]): The parameter to use for trimming. Defaults to None.
         trim_key (Optional[str]): The key to use for reading the trim_parameter from the configuration file. Defaults to None.
+        monotonicity (Optional[Dict[str, int]]): The known monotonicity of the columns (see `column_monotonicity`). Monotonic IRC coordinates are trimmed with a binary search instead of a scan.
+            The monotonicity of the trim key is detected and stored in the dictionary if it is missing, such that it is detected only once. Defaults to None (detected on every call).
+        config (Optional[Config]): The config that provides the trim_option and trim_key if they are not specified. Defaults to None (the config of the current context, see `get_config`).
 
     Raises:
         PyFragResultsProcessingError: If the trim_option is not a valid type.
@@ -140,30 +290,49 @@ def trim_data(df: pd.DataFrame, trim_option: Optional[Union[str, float, int, Seq
         pd.DataFrame: The trimmed dataframe.
 
     """
-    trim_key = config.get("SHARED", "trim_key") if trim_key is None else trim_key
-    trim_option = config.get("SHARED", "trim_option") if trim_option is None else trim_option
-
-    # Sometimes, users might specify a trim_key in the config file that is not in the dataframe
-    if trim_key not in df.columns:
-        raise PyFragResultsProcessingError(key="trim_data", message=f"trim_key {trim_key} is not a valid key. Check if 'trim_key' in the config file is correct.")
-
-    # Check if the trim_option is a valid type such as a string, float, or integer
-    if not isinstance(trim_option, (str, float, int, Sequence)):
-        raise PyFragResultsProcessingError(key="trim_data", message=f"trim_option {trim_option} is not a valid type. Valid types are str, float, and int")
-
-    # Handle the case where the trim_option is a string but needs to be converted to a sequence (i.e. x_lim)
-    if isinstance(trim_option, str):
-        trim_option = trim_option.lower().strip()
-        if trim_option in ["x_lim", "xlim", "x_limits", "xlimits"]:
-            trim_option = tuple(config.get("SHARED", "x_lim"))
+    trim_option, trim_key = _resolve_trim_arguments(df, trim_option, trim_key, config)
 
     for key, func in _overload_types.items():
         if isinstance(trim_option, key):
-            return func(df, trim_option, trim_key)
+            return func(df, trim_option, trim_key, monotonicity)
 
     return df
 
 
+def trim_ranges(
+    df: pd.DataFrame,
+    trim_option: Optional[Union[str, float, int, Sequence]] = None,
+    trim_key: Optional[str] = None,
+    monotonicity: Optional[Dict[str, int]] = None,
+    config: Optional[Config] = None,
+) -> List[range]:
+    """Returns the rows that `trim_data` keeps as ranges of row positions, without trimming (copying) the dataframe.
+
+    The trimmed data of a range can be taken as a view with df.iloc[r.start:r.stop]. Apart from the x-limits trimming of non-monotonic IRC coordinates, the rows are a single range.
+
+    Args:
+        df (pd.DataFrame): The dataframe to trim.
+        trim_option, trim_key, monotonicity, config: See `trim_data`.
+
+    Returns:
+        List[range]: The consecutive row positions that are kept, in increasing order.
+
+    Example:
+        >>> [kept_rows] = trim_ranges(df, (1.5, 3.0), "bondlength_1")
+        >>> trimmed_df = df.iloc[kept_rows.start:kept_rows.stop]
+
+    """
+    trim_option, trim_key = _resolve_trim_arguments(df, trim_option, trim_key, config)
+    positions = _trim_positions(df, trim_option, trim_key, monotonicity)
+
+    if isinstance(positions, slice):
+        return [range(*positions.indices(len(df)))]
+
+    # Splits the positions where they are not consecutive
+    split_at = np.flatnonzero(np.diff(positions) != 1) + 1
+    return [range(int(run[0]), int(run[-1]) + 1) for run in np.split(positions, split_at) if len(run) > 0]
+
+
 # ====================================================================================================
 # Dispersion term check ==============================================================================
 # ====================================================================================================
@@ -197,19 +366,21 @@ def remove_dispersion_term(df: pd.DataFrame) -> pd.DataFrame:
 # ====================================================================================================
 
 
-def remove_outliers(df: pd.DataFrame, outlier_threshold: Optional[float] = None) -> pd.DataFrame:
+def remove_outliers(df: pd.DataFrame, outlier_threshold: Optional[float] = None, config: Optional[Config] = None) -> pd.DataFrame:
     """Removes outliers from the dataframe.
 
     This function takes a pandas DataFrame containing the results file data and removes outliers from the dataframe. The function returns the modified DataFrame.
 
     Args:
         df (pd.DataFrame): The DataFrame containing the results file data.
+        outlier_threshold (Optional[float]): The threshold for removing outliers. If None, the outlier_threshold from the configuration file is used.
+        config (Optional[Config]): The config that provides the outlier_threshold. Defaults to None (the config of the current context, see `get_config`).
 
     Returns:
         pd.DataFrame: The modified DataFrame without outliers.
 
     """
-    outlier_threshold = config.get("SHARED", "outlier_threshold") if outlier_threshold is None else outlier_threshold
+    outlier_threshold = get_config(config).get("SHARED", "outlier_threshold") if outlier_threshold is None else outlier_threshold
 
     # Calculate the difference between each func and its two nearest neighbors from both ends
     diff = df["EnergyTotal"].diff().abs()
@@ -225,6 +396,128 @@ def remove_outliers(df: pd.DataFrame, outlier_threshold: Optional[float] = None)
     return df
 
 
+# ====================================================================================================
+# Robust outlier detection (Hampel filter) ===========================================================
+# ====================================================================================================
+
+# The energy terms that are checked for outliers by default (if present in the dataframe)
+HAMPEL_ENERGY_KEYS: Sequence[str] = ("EnergyTotal", "Int", "Elstat", "Pauli", "OI", "Disp", "StrainTotal", "frag1Strain", "frag2Strain")
+
+# Scales the median absolute deviation (MAD) to the standard deviation of normally distributed data
+_MAD_SCALE = 1.4826
+
+# Number of windows that are processed at once, such that the window arrays fit in the CPU cache
+_HAMPEL_CHUNK_SIZE = 2048
+
+
+def _sorted_lanes(lanes: List[np.ndarray]) -> List[np.ndarray]:
+    """Private function that sorts the elements of a list of equally shaped arrays elementwise (odd-even transposition sort), such that lanes[i] contains the i-th smallest values.
+
+    NaN values propagate through np.minimum and np.maximum, so a NaN value in a window makes the sorted values of that window NaN.
+    """
+    buffer = np.empty_like(lanes[0])
+    for sweep in range(len(lanes)):
+        for i in range(sweep % 2, len(lanes) - 1, 2):
+            np.minimum(lanes[i], lanes[i + 1], out=buffer)
+            np.maximum(lanes[i], lanes[i + 1], out=lanes[i + 1])
+            lanes[i], buffer = buffer, lanes[i]
+    return lanes
+
+
+def _rolling_median_and_mad(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Private function that returns the centered rolling median and median absolute deviation (MAD) of every column of a 2D array.
+
+    The windows are sorted with vectorized min/max operations over all columns at once, which is linear in the number of rows for a fixed window.
+    The rows at the edges, which do not have a complete window, use the first or last complete window. If there are fewer rows than the window, the window is shortened to the (odd) number of rows.
+    """
+    n_rows = len(values)
+    if n_rows == 0:
+        return values.copy(), values.copy()
+    window = min(window, n_rows if n_rows % 2 == 1 else n_rows - 1)
+    half_window = window // 2
+
+    medians = np.empty_like(values)
+    mads = np.empty_like(values)
+    n_windows = n_rows - window + 1
+    for start in range(0, n_windows, _HAMPEL_CHUNK_SIZE):
+        stop = min(start + _HAMPEL_CHUNK_SIZE, n_windows)
+        # Lane i contains the i-th value of every window that starts in the chunk
+        median = _sorted_lanes([values[start + i:stop + i].copy() for i in range(window)])[half_window]
+        mad = _sorted_lanes([np.abs(values[start + i:stop + i] - median) for i in range(window)])[half_window]
+        medians[start + half_window:stop + half_window] = median
+        mads[start + half_window:stop + half_window] = mad
+
+    medians[:half_window], mads[:half_window] = medians[half_window], mads[half_window]
+    medians[n_rows - half_window:], mads[n_rows - half_window:] = medians[n_rows - half_window - 1], mads[n_rows - half_window - 1]
+    return medians, mads
+
+
+def hampel_outliers(
+    df: pd.DataFrame, keys: Optional[Sequence[str]] = None, window: Optional[int] = None, threshold: Optional[float] = None, config: Optional[Config] = None
+) -> Tuple[np.ndarray, pd.DataFrame]:
+    """Detects outliers in all energy terms at once with a Hampel filter (rolling median and median absolute deviation).
+
+    A point is an outlier in a term if it deviates more than `threshold` scaled median absolute deviations (MAD) from the median of the window centered at the point.
+    Unlike `remove_outliers`, which only checks the differences with the neighbouring points of "EnergyTotal", this also detects SCF convergence glitches in e.g. "Pauli" or "OI".
+    The filter runs on all terms simultaneously and is linear in the number of rows.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the results file data.
+        keys (Optional[Sequence[str]]): The terms to check. Defaults to None, which checks the terms of HAMPEL_ENERGY_KEYS that are in the dataframe.
+        window (Optional[int]): The number of points in the window, which should be odd and at least 3. If None, the hampel_window from the configuration file is used.
+        threshold (Optional[float]): The number of scaled MADs above which a point is an outlier. If None, the hampel_threshold from the configuration file is used.
+        config (Optional[Config]): The config that provides the window and threshold. Defaults to None (the config of the current context, see `get_config`).
+
+    Raises:
+        PyFragResultsProcessingError: If the window is not an odd number of at least 3 points or if a key is not in the dataframe.
+
+    Returns:
+        Tuple[np.ndarray, pd.DataFrame]: The boolean mask of the rows that are an outlier in any term, and the diagnostics with the same index as the dataframe:
+            the robust score |x - median| / (1.4826 * MAD) of every term (NaN if the window contains missing values or if the point and its window are constant)
+            and the number of terms in which the row is an outlier ("n_outlier_keys").
+
+    Example:
+        >>> outliers, diagnostics = hampel_outliers(df, window=7, threshold=3.0)
+        >>> df = df[~outliers]
+
+    """
+    config = get_config(config)
+    window = config.get("SHARED", "hampel_window") if window is None else window
+    threshold = config.get("SHARED", "hampel_threshold") if threshold is None else threshold
+    keys = [key for key in HAMPEL_ENERGY_KEYS if key in df.columns] if keys is None else list(keys)
+
+    if window < 3 or window % 2 == 0:
+        raise PyFragResultsProcessingError(key="hampel_outliers", message=f"The window {window} should be an odd number of at least 3 points. Check if 'hampel_window' in the config file is correct.")
+    missing_keys = [key for key in keys if key not in df.columns]
+    if missing_keys:
+        raise PyFragResultsProcessingError(key="hampel_outliers", message=f"The keys {missing_keys} are not in the dataframe.")
+
+    values = df[keys].to_numpy(dtype=np.float64) if keys else np.empty((len(df), 0))
+    medians, mads = _rolling_median_and_mad(values, window)
+
+    # Points that deviate in a constant window (MAD of zero) have an infinite score, while points without any deviation have no score (0/0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.abs(values - medians) / (_MAD_SCALE * mads)
+    is_outlier = scores > threshold
+
+    diagnostics = pd.DataFrame(scores, index=df.index, columns=keys)
+    diagnostics["n_outlier_keys"] = is_outlier.sum(axis=1)
+    return is_outlier.any(axis=1), diagnostics
+
+
+def remove_outliers_hampel(
+    df: pd.DataFrame, keys: Optional[Sequence[str]] = None, window: Optional[int] = None, threshold: Optional[float] = None, config: Optional[Config] = None
+) -> pd.DataFrame:
+    """Removes the rows that are an outlier in any energy term according to the Hampel filter, see `hampel_outliers` for the arguments.
+
+    Returns:
+        pd.DataFrame: The modified DataFrame without outliers.
+
+    """
+    outliers, _ = hampel_outliers(df, keys, window, threshold, config)
+    return df[~outliers]
+
+
 # ====================================================================================================
 # Removing duplicate x values ========================================================================
 # ====================================================================================================
@@ -253,3 +546,350 @@ def remove_duplicate_x_values_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 
     # Return the modified DataFrame
     return df
+
+
+# ====================================================================================================
+# Fused processing engine ============================================================================
+# ====================================================================================================
+
+
+def _trim_positions(df: pd.DataFrame, trim_option: Union[str, float, int, Sequence], trim_key: str, monotonicity: Optional[Dict[str, int]] = None) -> Union[slice, np.ndarray]:
+    """Returns the positions of the rows that `trim_data` keeps, either as a slice or as an array (the x-limits trimming of non-monotonic IRC coordinates).
+
+    The trim_option and trim_key should already be resolved with `_resolve_trim_arguments`.
+    """
+    if isinstance(trim_option, str):
+        return _trim_positions_str(df, trim_option, trim_key, monotonicity)
+    if isinstance(trim_option, float):
+        return _trim_positions_float(df, trim_option, trim_key, monotonicity)
+    if isinstance(trim_option, int):
+        return slice(None, trim_option)
+    if isinstance(trim_option, Sequence):
+        return _trim_positions_sequence(df, trim_option, trim_key, monotonicity)
+    return slice(None)
+
+
+def _outlier_mask(energies: np.ndarray, outlier_threshold: float) -> np.ndarray:
+    """Returns the mask of the outliers as determined by `remove_outliers`, computed with NumPy instead of three (reversed) pandas diff passes."""
+    if not np.issubdtype(energies.dtype, np.floating):
+        energies = energies.astype(np.float64)
+
+    # The differences with the previous row and the rows two positions before and after. Comparisons with NaN (at the edges) are False.
+    diff = np.full(energies.shape, np.nan, dtype=energies.dtype)
+    diff[1:] = np.abs(energies[1:] - energies[:-1])
+    diff_two = np.abs(energies[2:] - energies[:-2])
+    diff_forward = np.full(energies.shape, np.nan, dtype=energies.dtype)
+    diff_forward[2:] = diff_two
+    diff_backward = np.full(energies.shape, np.nan, dtype=energies.dtype)
+    diff_backward[:-2] = diff_two
+
+    return (diff > outlier_threshold) & (diff_forward > outlier_threshold) & (diff_backward > outlier_threshold)
+
+
+def process_results_file_fused(
+    df: pd.DataFrame,
+    trim_option: Optional[Union[str, float, int, Sequence]] = None,
+    trim_key: Optional[str] = None,
+    outlier_threshold: Optional[float] = None,
+    monotonicity: Optional[Dict[str, int]] = None,
+    config: Optional[Config] = None,
+) -> pd.DataFrame:
+    """Processes the results file data in one pass, yielding the same result as `trim_data`, `remove_duplicate_x_values_dataframe`, `remove_dispersion_term` and `remove_outliers` applied in sequence.
+
+    Instead of creating a new DataFrame in every step, the row positions that are kept are computed on the NumPy arrays of the columns that are involved
+    (the trim key, the IRC coordinates, "Disp" and "EnergyTotal"). The selection is applied to the DataFrame only once at the end.
+
+    Args:
+        df: A pandas DataFrame containing the results file data.
+        trim_option: An optional argument specifying how to trim the data. See `trim_data`.
+        trim_key: An optional argument specifying the key to use for trimming the data. See `trim_data`.
+        outlier_threshold: An optional argument specifying the threshold for removing outliers. Can be a float or None.
+        monotonicity: An optional dictionary with the known monotonicity of the IRC coordinates, which is filled in when trimming. See `trim_data`.
+        config: The config that provides the values of the arguments that are not specified. If None, the config of the current context is used (see `get_config`).
+
+    Returns:
+        A pandas DataFrame containing the processed results file data.
+
+    Raises:
+        PyFragResultsProcessingError: If an error occurs during processing.
+
+    """
+    return take_processed_rows(df, *get_processed_rows(df, trim_option, trim_key, outlier_threshold, monotonicity, config))
+
+
+def get_processed_rows(
+    df: pd.DataFrame,
+    trim_option: Optional[Union[str, float, int, Sequence]] = None,
+    trim_key: Optional[str] = None,
+    outlier_threshold: Optional[float] = None,
+    monotonicity: Optional[Dict[str, int]] = None,
+    config: Optional[Config] = None,
+) -> Tuple[np.ndarray, pd.Index, List[str]]:
+    """Determines which rows and columns `process_results_file` keeps, using only the columns that control the processing (the trim key, the IRC coordinates, "Disp" and "EnergyTotal").
+
+    Args:
+        df: A pandas DataFrame containing the results file data.
+        trim_option, trim_key, outlier_threshold, monotonicity, config: See `process_results_file_fused`.
+
+    Returns:
+        The positions of the kept rows in df, the index of the processed data and the kept columns. These can be applied with `take_processed_rows`.
+
+    Raises:
+        PyFragResultsProcessingError: If an error occurs during processing.
+
+    """
+    trim_option, trim_key = _resolve_trim_arguments(df, trim_option, trim_key, config)
+    outlier_threshold = get_config(config).get("SHARED", "outlier_threshold") if outlier_threshold is None else outlier_threshold
+
+    # Trimming
+    rows = np.arange(len(df))[_trim_positions(df, trim_option, trim_key, monotonicity)]
+
+    # Duplicate x values, keeping the last occurrence (the same hash-based duplicate detection as DataFrame.drop_duplicates)
+    for x_axis_key in [key for key in df.columns if _is_x_axis_key(key)]:
+        x_data = df[x_axis_key].to_numpy()[rows]
+        rows = rows[~pd.Series(x_data, copy=False).duplicated(keep="last").to_numpy()]
+
+    # Dispersion term that is 0.0 everywhere (math.isclose with the default tolerances is only True for exactly 0.0)
+    remove_dispersion = "Disp" in df.columns and bool(np.all(df["Disp"].to_numpy()[rows] == 0.0))
+
+    # Outliers
+    outliers = _outlier_mask(df["EnergyTotal"].to_numpy()[rows], outlier_threshold)
+    kept_positions = np.flatnonzero(~outliers)
+
+    # The index is reset after removing the duplicates, so the index refers to the rows before the outliers were removed
+    columns = [key for key in df.columns if key != "Disp" or not remove_dispersion]
+    return rows[kept_positions], pd.RangeIndex(len(rows)).take(kept_positions), columns
+
+
+def take_processed_rows(df: pd.DataFrame, row_positions: np.ndarray, index: pd.Index, columns: Sequence[str]) -> pd.DataFrame:
+    """Selects the rows and columns determined by `get_processed_rows` from the results file data and sets the index of the processed data."""
+    processed_df = df.take(row_positions)
+    for key in df.columns.difference(columns):
+        # Deleting the column from the new DataFrame avoids a second copy of the data
+        del processed_df[key]
+    processed_df.index = index
+    return processed_df
+
+
+# ====================================================================================================
+# Batched processing of many systems =================================================================
+# ====================================================================================================
+
+
+def _segment_ids(lengths: np.ndarray) -> np.ndarray:
+    """Returns the segment (system) id of every element of a ragged array with the given segment lengths."""
+    return np.repeat(np.arange(len(lengths)), lengths)
+
+
+def _segment_positions(lengths: np.ndarray) -> np.ndarray:
+    """Returns the position of every element of a ragged array within its own segment."""
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return np.arange(int(lengths.sum())) - np.repeat(offsets, lengths)
+
+
+def _segment_first_argbest(values: np.ndarray, lengths: np.ndarray, find_max: bool) -> np.ndarray:
+    """Returns the position (within the segment) of the first maximum or minimum of every segment, ignoring NaN values like np.nanargmax/np.nanargmin.
+
+    Raises:
+        ValueError: If a segment is empty or only contains NaN values (like np.nanargmax/np.nanargmin).
+    """
+    segment_ids = _segment_ids(lengths)
+    is_nan = np.isnan(values)
+    if np.any(np.bincount(segment_ids[~is_nan], minlength=len(lengths)) == 0):
+        raise ValueError("attempt to get argmax/argmin of an empty (or all-NaN) sequence")
+
+    fill_value = -np.inf if find_max else np.inf
+    filled = np.where(is_nan, fill_value, values)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    best = (np.maximum if find_max else np.minimum).reduceat(filled, offsets)
+
+    # The first element of every segment that equals the best value of the segment (NaN values never do)
+    candidates = np.flatnonzero((filled == best[segment_ids]) & ~is_nan)
+    first_candidates = candidates[np.searchsorted(segment_ids[candidates], np.arange(len(lengths)))]
+    return first_candidates - offsets
+
+
+def _batched_trim_positions(
+    dfs: Sequence[pd.DataFrame],
+    lengths: np.ndarray,
+    trim_option: Union[str, float, int, Sequence],
+    trim_key: str,
+    concatenated_column: Callable[[str], np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the row positions (within each system) that `trim_data` keeps for every system, as a ragged array (positions, lengths)."""
+    if isinstance(trim_option, str) and trim_option not in ["max", "min"]:
+        return _segment_positions(lengths), lengths
+
+    if isinstance(trim_option, int):
+        stops = np.array([len(range(n)[:trim_option]) for n in lengths], dtype=np.int64)
+        return _segment_positions(stops), stops
+
+    if isinstance(trim_option, (str, float)):
+        values = concatenated_column(trim_key)
+        if isinstance(trim_option, float):
+            best_positions = _segment_first_argbest(np.abs(values - trim_option), lengths, find_max=False)
+        else:
+            best_positions = _segment_first_argbest(values, lengths, find_max=trim_option == "max")
+
+        # The label-based slicing of `trim_data` ends after the selected row, unless the index is not monotonic and unique
+        stops = best_positions + 1
+        for i, df in enumerate(dfs):
+            if not (df.index.is_monotonic_increasing and df.index.is_unique):
+                stops[i] = df.index.slice_locs(end=df.index[best_positions[i]])[1]
+        return _segment_positions(stops), stops
+
+    if isinstance(trim_option, Sequence):
+        # The x-limits trimming has many special cases, which are handled per system by the same function as `trim_data`
+        positions = [np.arange(len(df))[_trim_positions_sequence(df, trim_option, trim_key)] for df in dfs]
+        return np.concatenate(positions), np.array([len(p) for p in positions], dtype=np.int64)
+
+    return _segment_positions(lengths), lengths
+
+
+def _column_data(df: pd.DataFrame, values: Optional[np.ndarray], key: str) -> np.ndarray:
+    """Returns the data of a column, taken from the NumPy block of the DataFrame if it has a single data type (which is much faster than df[key])."""
+    if values is None:
+        return df[key].to_numpy()
+    return values[:, df.columns.get_loc(key)]
+
+
+def _process_results_group(
+    dfs: Sequence[pd.DataFrame],
+    blocks: Sequence[Optional[np.ndarray]],
+    x_axis_keys: Sequence[str],
+    trim_option: Union[str, float, int, Sequence],
+    trim_key: str,
+    outlier_threshold: float,
+) -> List[pd.DataFrame]:
+    """Processes systems with the same IRC coordinates in one vectorized pass on a ragged (values + lengths) layout.
+
+    The blocks are the NumPy arrays of the DataFrames with a single data type (None for the other DataFrames).
+    """
+    lengths = np.array([len(df) for df in dfs], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    def concatenated_column(key: str) -> np.ndarray:
+        return np.concatenate([_column_data(df, values, key) for df, values in zip(dfs, blocks)])
+
+    # Trimming. The rows are stored as positions in the concatenated columns.
+    local_rows, row_lengths = _batched_trim_positions(dfs, lengths, trim_option, trim_key, concatenated_column)
+    segment_ids = _segment_ids(row_lengths)
+    rows = offsets[segment_ids] + local_rows
+
+    # Duplicate x values, keeping the last occurrence within every system
+    for x_axis_key in x_axis_keys:
+        x_data = concatenated_column(x_axis_key)[rows]
+        duplicated = pd.DataFrame({"system": segment_ids, "x": x_data}).duplicated(keep="last").to_numpy()
+        rows, segment_ids = rows[~duplicated], segment_ids[~duplicated]
+    row_lengths = np.bincount(segment_ids, minlength=len(dfs))
+
+    # Dispersion terms that are 0.0 everywhere
+    has_dispersion = np.array(["Disp" in df.columns for df in dfs])
+    remove_dispersion = np.zeros(len(dfs), dtype=bool)
+    if has_dispersion.any():
+        disp_data = np.concatenate(
+            [_column_data(df, values, "Disp") if has_disp else np.zeros(len(df)) for df, values, has_disp in zip(dfs, blocks, has_dispersion)]
+        )[rows]
+        n_nonzero = np.bincount(segment_ids, weights=disp_data != 0.0, minlength=len(dfs))
+        remove_dispersion = has_dispersion & (n_nonzero == 0)
+
+    # Outliers, where the differences with rows of other systems (at the edges of every system) are ignored
+    energies = concatenated_column("EnergyTotal")[rows]
+    positions = _segment_positions(row_lengths)
+    outliers = _outlier_mask(energies, outlier_threshold) & (positions >= 2) & (positions < row_lengths[segment_ids] - 2)
+
+    kept = ~outliers
+    kept_rows, kept_segment_ids, kept_positions = rows[kept], segment_ids[kept], positions[kept]
+    split_at = np.cumsum(np.bincount(kept_segment_ids, minlength=len(dfs)))[:-1]
+
+    # The columns without the dispersion term, shared by the systems with the same columns
+    columns_without_dispersion: Dict[Tuple[Any, ...], Tuple[np.ndarray, pd.Index]] = {}
+
+    processed_dfs = []
+    for i, (system_rows, system_positions) in enumerate(zip(np.split(kept_rows - offsets[kept_segment_ids], split_at), np.split(kept_positions, split_at))):
+        df, values = dfs[i], blocks[i]
+
+        # The index is reset after removing the duplicates, so the index refers to the rows before the outliers were removed
+        if len(system_positions) == row_lengths[i]:
+            index = pd.RangeIndex(row_lengths[i])
+        else:
+            index = pd.RangeIndex(row_lengths[i]).take(system_positions)
+
+        if values is None:
+            processed_df = df.take(system_rows)
+            if remove_dispersion[i]:
+                del processed_df["Disp"]
+            processed_df.index = index
+        elif remove_dispersion[i]:
+            columns = tuple(df.columns)
+            if columns not in columns_without_dispersion:
+                column_mask = df.columns != "Disp"
+                columns_without_dispersion[columns] = column_mask, df.columns[column_mask]
+            column_mask, kept_columns = columns_without_dispersion[columns]
+            processed_df = pd.DataFrame(values[system_rows][:, column_mask], index=index, columns=kept_columns)
+        else:
+            processed_df = pd.DataFrame(values[system_rows], index=index, columns=df.columns)
+        processed_dfs.append(processed_df)
+    return processed_dfs
+
+
+def process_results_files(
+    dfs: Sequence[pd.DataFrame],
+    trim_option: Optional[Union[str, float, int, Sequence]] = None,
+    trim_key: Optional[str] = None,
+    outlier_threshold: Optional[float] = None,
+    config: Optional[Config] = None,
+) -> List[pd.DataFrame]:
+    """Processes the results file data of many systems at once, yielding the same results as calling `process_results_file` for every system.
+
+    The columns that determine which rows are kept are concatenated into one ragged array (values + lengths per system), such that trimming,
+    duplicate removal, the dispersion check and outlier removal are done in a few vectorized passes for all systems instead of one pass per system.
+    This removes most of the pandas overhead when processing many short IRCs.
+
+    Args:
+        dfs: The pandas DataFrames containing the results file data of the systems.
+        trim_option: An optional argument specifying how to trim the data. See `trim_data`.
+        trim_key: An optional argument specifying the key to use for trimming the data. See `trim_data`.
+        outlier_threshold: An optional argument specifying the threshold for removing outliers. Can be a float or None.
+        config: The config that provides the values of the arguments that are not specified. If None, the config of the current context is used (see `get_config`).
+
+    Returns:
+        The processed DataFrames in the same order as the input.
+
+    Raises:
+        PyFragResultsProcessingError: If an error occurs during processing.
+
+    """
+    if len(dfs) == 0:
+        return []
+
+    resolved_trim_option, resolved_trim_key = _resolve_trim_arguments(dfs[0], trim_option, trim_key, config)
+    for df in dfs[1:]:
+        if resolved_trim_key not in df.columns:
+            raise PyFragResultsProcessingError(key="trim_data", message=f"trim_key {resolved_trim_key} is not a valid key. Check if 'trim_key' in the config file is correct.")
+    outlier_threshold = get_config(config).get("SHARED", "outlier_threshold") if outlier_threshold is None else outlier_threshold
+
+    # Systems can only be processed together if the same duplicate removal steps apply and the data types are the same
+    groups: Dict[Tuple[Any, ...], List[int]] = defaultdict(list)
+    blocks: List[Optional[np.ndarray]] = []
+    x_axis_keys_of_columns: Dict[Tuple[Any, ...], Tuple[str, ...]] = {}
+    for i, df in enumerate(dfs):
+        columns = tuple(df.columns)
+        if columns not in x_axis_keys_of_columns:
+            x_axis_keys_of_columns[columns] = tuple(key for key in columns if _is_x_axis_key(key))
+        x_axis_keys = x_axis_keys_of_columns[columns]
+
+        dtypes = df.dtypes.to_numpy()
+        is_single_dtype = len(dtypes) > 0 and all(dtype == dtypes[0] for dtype in dtypes) and not pd.api.types.is_object_dtype(dtypes[0])
+        blocks.append(df.to_numpy() if is_single_dtype else None)
+
+        key_dtypes = tuple(dtypes[df.columns.get_loc(key)] for key in (resolved_trim_key, "EnergyTotal") + x_axis_keys if key in df.columns)
+        groups[(x_axis_keys, key_dtypes)].append(i)
+
+    processed_dfs: List[Optional[pd.DataFrame]] = [None] * len(dfs)
+    for (x_axis_keys, _), indices in groups.items():
+        group_dfs = [dfs[i] for i in indices]
+        group_blocks = [blocks[i] for i in indices]
+        for i, processed_df in zip(indices, _process_results_group(group_dfs, group_blocks, x_axis_keys, resolved_trim_option, resolved_trim_key, outlier_threshold)):
+            processed_dfs[i] = processed_df
+    return processed_dfs  # type: ignore
@@ -1,17 +1,25 @@
 """ Module that combines the data from inputfile and outputfile into a PyFragResultsObject object """
+import configparser as cp
+import logging
+import os
 from collections import OrderedDict
-from typing import Annotated, Any, Callable, Dict, List, Literal, Optional, Protocol, Sequence, TypeVar, Union
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Annotated, Any, Callable, Dict, List, Literal, Optional, Protocol, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
 from attrs import define, field
 
+from pyfrag_plotter.config.config_handler import Config
+from pyfrag_plotter.config.context import get_config
 from pyfrag_plotter.errors import PyFragResultsObjectError
+from pyfrag_plotter.input.cache import ParseCache
 from pyfrag_plotter.input.pyfrag_files import get_pyfrag_files
 from pyfrag_plotter.input.read_inputfile import read_inputfile
-from pyfrag_plotter.input.read_resultsfile import read_results_file
-from pyfrag_plotter.processing_funcs import process_results_file
+from pyfrag_plotter.input.read_resultsfile import IncrementalResultsReader, read_results_file, read_results_header, select_columns
+from pyfrag_plotter.lazy_results import LazyResultsTable, create_lazy_results_table
+from pyfrag_plotter.processing_funcs import column_monotonicity, get_processed_rows, get_processing_columns, take_processed_rows
 
 # Type alias for 1D numpy array with variable length but with a fixed dtype (np.float64)
 DType = TypeVar("DType", bound=np.generic)
@@ -192,6 +200,32 @@ class Irrep:
         return f"{self.irrep}"
 
 
+@define
+class ResultsSource:
+    """Attrs class containing the results file of a PyFragResultsObject and the arguments it has been read and processed with, such that the object can be refreshed.
+
+    Attributes:
+        results_file (str): The path to the results file (.txt).
+        columns (Optional[List[str]]): The columns (names or glob patterns) that have been read. None means all columns.
+        processing_kwargs (Dict[str, Any]): The keyword arguments passed to `process_results_file`.
+        n_rows (int): The number of (unprocessed) rows that have been read so far.
+        reader (Optional[IncrementalResultsReader]): The reader that keeps the unprocessed rows read so far. It is created on the first `PyFragResultsObject.refresh`, such that objects
+            that are never refreshed do not keep a copy of the unprocessed data. Lazily created objects use the reader of their `LazyResultsTable`.
+        row_positions (Optional[np.ndarray]): The positions of the (unprocessed) rows that remain after processing, see `get_processed_rows`.
+        monotonicity (Dict[str, int]): The monotonicity of the (unprocessed) IRC coordinates used for trimming (see `column_monotonicity`). It is detected once and
+            only checked for the appended rows when the object is refreshed.
+
+    """
+
+    results_file: str
+    columns: Optional[List[str]] = None
+    processing_kwargs: Dict[str, Any] = field(factory=dict)
+    n_rows: int = 0
+    reader: Optional[IncrementalResultsReader] = None
+    row_positions: Optional[np.ndarray] = None
+    monotonicity: Dict[str, int] = field(factory=dict)
+
+
 @define
 class PyFragResultsObject:
     """
@@ -212,6 +246,9 @@ class PyFragResultsObject:
         orbitalenergy (List[OrbitalEnergy]): The orbital energy data for the PyFrag calculation.
         vdd (List[VDD]): The VDD data for the PyFrag calculation.
         irrep (List[Irrep]): The irrep data for the PyFrag calculation.
+        lazy_table (Optional[LazyResultsTable]): If set, the dataframe only contains the columns that have been requested so far.
+            Other columns are read from the results file on first access. Use `materialize` to load all columns.
+        source (Optional[ResultsSource]): The results file the object has been created from, which is used by `refresh`.
 
     """
 
@@ -226,13 +263,111 @@ class PyFragResultsObject:
     orbitalenergy: List[OrbitalEnergy] = field(factory=list)
     vdd: List[VDD] = field(factory=list)
     irrep: List[Irrep] = field(factory=list)
+    lazy_table: Optional[LazyResultsTable] = field(default=None, repr=False)
+    source: Optional[ResultsSource] = field(default=None, repr=False)
+
+    def load_keys(self, keys: Sequence[str]) -> None:
+        """Reads the keys that are not yet in the dataframe from the results file at once (only for lazily created objects, the dataframe of other objects contains all keys).
+
+        Args:
+            keys (Sequence[str]): The keys to load. Keys that are not in the results file are ignored.
+
+        """
+        if self.lazy_table is None:
+            return
+
+        missing_keys = [key for key in keys if key not in self.dataframe.columns and key in self.lazy_table.columns]
+        if not missing_keys:
+            return
+
+        loaded_data = self.lazy_table.load(missing_keys)
+        for key in missing_keys:
+            self.dataframe[key] = loaded_data[key].to_numpy()
+
+    def materialize(self) -> pd.DataFrame:
+        """Loads all columns of a lazily created object and returns the complete dataframe."""
+        if self.lazy_table is not None:
+            self.load_keys(self.lazy_table.columns)
+            self.dataframe = self.dataframe[self.lazy_table.columns]
+            if self.source is not None:
+                # The reader of the table keeps the unprocessed rows of all loaded columns, so it can be used to refresh the materialized object
+                self.source.reader, self.source.row_positions = self.lazy_table.reader, self.lazy_table.row_positions
+            self.lazy_table = None
+        return self.dataframe
+
+    def refresh(self) -> int:
+        """Reads the rows that PyFrag appended to the results file since the object was created (or last refreshed) and updates the processed data.
+
+        Only the appended rows are parsed, since the unprocessed rows are kept in memory by the reader of the object. The rows that remain after processing
+        are determined again with the same arguments as before, using only the columns that control the processing. If the rows that were kept before are still kept
+        (e.g. the maximum used for trimming did not move and no row became an outlier), only the appended rows are selected and added to the dataframe.
+        Otherwise, all rows are selected again. The unprocessed rows are only kept in memory from the first refresh on, which parses the whole file once.
+
+        Raises:
+            PyFragResultsObjectError: If the object was not created from a results file (see `create_pyfrag_object_from_dir`).
+
+        Returns:
+            int: The number of new (unprocessed) rows.
+
+        """
+        if self.source is None:
+            raise PyFragResultsObjectError("The object cannot be refreshed since it was not created from a results file. Use create_pyfrag_object_from_dir instead.")
+
+        source = self.source
+        if self.lazy_table is not None:
+            if self.lazy_table.reader is None:
+                self.lazy_table.reader = IncrementalResultsReader(source.results_file, self.lazy_table.dtype, columns=list(self.dataframe.columns) + ["Disp"])
+            reader, row_positions = self.lazy_table.reader, self.lazy_table.row_positions
+        else:
+            if source.reader is None:
+                source.reader = IncrementalResultsReader(source.results_file, columns=None if source.columns is None else list(source.columns))
+            reader, row_positions = source.reader, source.row_positions
+
+        n_appended_rows = reader.read()
+        n_previous_rows = source.n_rows
+        n_new_rows = max(0, reader.n_rows - source.n_rows)
+        source.n_rows = reader.n_rows
+        if reader.n_rows - n_appended_rows != n_previous_rows:
+            # The reader has (re)read the file from the start, so all rows are processed again
+            n_previous_rows, row_positions = 0, None
+        elif n_appended_rows == 0:
+            return 0
+
+        results_data = reader.data
+        _update_monotonicity(source.monotonicity, results_data, n_previous_rows)
+        new_row_positions, index, columns = get_processed_rows(results_data, monotonicity=source.monotonicity, **source.processing_kwargs)
+
+        n_kept_rows = 0 if row_positions is None else len(row_positions)
+        keeps_processed_rows = (
+            row_positions is not None
+            and np.array_equal(new_row_positions[:n_kept_rows], row_positions)
+            and index[:n_kept_rows].equals(self.dataframe.index)
+            and set(columns) == set(self.dataframe.columns)
+        )
+        if keeps_processed_rows:
+            appended_data = take_processed_rows(results_data, new_row_positions[n_kept_rows:], index[n_kept_rows:], columns)
+            self.dataframe = pd.concat([self.dataframe, appended_data[self.dataframe.columns]])
+        else:
+            self.dataframe = take_processed_rows(results_data, new_row_positions, index, columns)
+
+        if self.lazy_table is None:
+            source.row_positions = new_row_positions
+        else:
+            self.lazy_table.row_positions, self.lazy_table.index, self.lazy_table.n_rows = new_row_positions, index, reader.n_rows
+            if not keeps_processed_rows and "Disp" in reader.header:
+                # The dispersion term is removed during processing if it is zero everywhere, which can change when rows are appended
+                lazy_columns = set(self.lazy_table.columns) | {"Disp"}
+                self.lazy_table.columns = [key for key in read_results_header(source.results_file)[1:] if key in lazy_columns and (key != "Disp" or key in columns)]
+        return n_new_rows
 
     def get_data_of_key(self, key: str) -> Array1D[np.float64]:
         """Returns the data found in the dataframe (from the .txt file) of the specified key."""
+        self.load_keys([key])
         return self.dataframe[key].to_numpy()
 
     def get_calculation_index_closest_to_irc_point(self, irc_coord: str, irc_point: float) -> int:
         """Returns the index of the calculation closest to the specified IRC point."""
+        self.load_keys([irc_coord])
         return int(np.argmin(np.abs(self.dataframe[irc_coord].to_numpy() - irc_point)))
 
     def get_plot_labels(self, keys: Union[Sequence[str], str]) -> Sequence[str]:
@@ -261,6 +396,7 @@ class PyFragResultsObject:
 
     def get_x_axis(self, irc_coord: str) -> Array1D[np.float64]:
         """Returns the x-axis data for the specified IRC coordinate."""
+        self.load_keys([irc_coord])
         return self.dataframe[irc_coord].to_numpy()
 
     def get_peak_index(self, peak: str = "max") -> int:
@@ -278,6 +414,19 @@ class PyFragResultsObject:
         return int(data_of_key.argmin())
 
 
+def _update_monotonicity(monotonicity: Dict[str, int], results_data: pd.DataFrame, n_checked_rows: int) -> None:
+    """Checks whether the rows after the first n_checked_rows keep the known monotonicity of the columns. Otherwise, the monotonicity is detected again when trimming."""
+    for key, direction in list(monotonicity.items()):
+        if key not in results_data.columns or n_checked_rows > len(results_data):
+            del monotonicity[key]
+            continue
+
+        # The last checked row is included to check the transition to the appended rows. Non-increasing values are non-decreasing after a sign flip.
+        appended_values = results_data[key].to_numpy()[max(0, n_checked_rows - 1):]
+        if direction != 0 and column_monotonicity(direction * appended_values) != 1:
+            del monotonicity[key]
+
+
 def _add_bondlength(obj: PyFragResultsObject, *bond_info) -> None:
     bondlength_obj = Bondlength(atom1=bond_info[0], atom2=bond_info[1], bondlength=bond_info[2])
     obj.bondlength.append(bondlength_obj)
@@ -394,16 +543,62 @@ def create_pyfrag_object_from_processed_files(results_data: pd.DataFrame, inputf
     return obj
 
 
-def create_pyfrag_object_from_dir(results_dir: str, **kwargs) -> PyFragResultsObject:
+# The config sections and options containing the terms that are plotted by the corresponding Plotter methods (e.g. "asm" -> Plotter.plot_asm)
+PLOT_COLUMN_OPTIONS: Dict[str, Tuple[str, str]] = {
+    "asm": ("ASM", "asm_keys"),
+    "eda": ("EDA", "eda_keys"),
+    "extra_strain": ("ASM", "asm_strain_keys"),
+}
+
+
+def get_plot_columns(plots: Sequence[str] = tuple(PLOT_COLUMN_OPTIONS), trim_key: Optional[str] = None, config: Optional[Config] = None) -> List[str]:
+    """Returns the columns of the results file that are needed for processing and for the specified plots, based on the config file.
+
+    Args:
+        plots (Sequence[str]): The plots that will be made, see PLOT_COLUMN_OPTIONS. Defaults to all plots ("asm", "eda" and "extra_strain").
+        trim_key (Optional[str]): The key used for trimming the data. Defaults to the trim_key in the config file.
+        config (Optional[Config]): The config that contains the plotted terms. Defaults to None (the config of the current context, see `get_config`).
+
+    Raises:
+        ValueError: If a plot is not a valid option.
+
+    Returns:
+        List[str]: The column names and glob patterns, which can be passed to the `columns` argument of `create_pyfrag_object_from_dir`.
+
+    """
+    invalid_plots = [plot for plot in plots if plot not in PLOT_COLUMN_OPTIONS]
+    if invalid_plots:
+        raise ValueError(f"Plots {invalid_plots} are not valid. Valid options are {list(PLOT_COLUMN_OPTIONS)}.")
+
+    config = get_config(config)
+    columns = get_processing_columns(trim_key, config)
+    for plot in plots:
+        columns.extend(config.get(*PLOT_COLUMN_OPTIONS[plot]))
+    return list(dict.fromkeys(columns))
+
+
+def create_pyfrag_object_from_dir(
+    results_dir: str,
+    cache: Union[bool, ParseCache] = False,
+    lazy: bool = False,
+    columns: Optional[Union[str, Sequence[str]]] = None,
+    **kwargs,
+) -> PyFragResultsObject:
     """Creates a PyFragResultsObject from the results in a directory.
     This function provides a shortcut for creating a PyFragResultsObject from the results in a directory by processing and creating the PyFragResultsObject in one function.
 
     Args:
         results_dir (str): The path to the directory containing the PyFrag results files.
+        cache (Union[bool, ParseCache]): The on-disk cache for the parsed input and results files. If True, the default cache (see `ParseCache`) is used. Defaults to False (no caching).
+        lazy (bool): If True, only the columns needed for processing are read and the other columns are read on first access (see `LazyResultsTable`).
+            This reduces the memory usage for wide results files. The results file is not cached in lazy mode. Defaults to False.
+        columns (Optional[Union[str, Sequence[str]]]): The columns (names or glob patterns) of the results file to read. The columns needed for processing are always read.
+            If "auto", the columns of all plots in the config file are read (see `get_plot_columns`). Defaults to None (all columns).
         **kwargs: Additional keyword arguments to pass to the `process_results_file` function. These are:
             trim_parameter (Optional[Union[str, float, int]]): The parameter to use for trimming. Defaults to none.
             trim_key (Optional[str]): The key to use for reading the trim_parameter from the configuration file. Defaults to the "EnergyTotal" column.
             outlier_threshold: (Optional[float]): The threshold to use for removing outliers. If none is specified, the threshold from the configuration file is used. Defaults to None.
+            config (Optional[Config]): The config used for reading the columns and processing. Defaults to None (the config of the current context, see `get_config`).
 
     Returns:
         PyFragResultsObject: A PyFragResultsObject containing the processed PyFrag results.
@@ -413,12 +608,134 @@ def create_pyfrag_object_from_dir(results_dir: str, **kwargs) -> PyFragResultsOb
     """
 
     input_file, output_file = get_pyfrag_files(results_dir)
-
-    inputfile_data = read_inputfile(input_file)
-
-    results_data = read_results_file(output_file)
-    results_data = process_results_file(results_data, **kwargs)
+    parse_cache: Optional[ParseCache] = None
+    if cache:
+        parse_cache = ParseCache() if cache is True else cache
+
+    if isinstance(columns, str):
+        if columns != "auto":
+            raise ValueError(f"columns should be a sequence of column names or 'auto', not '{columns}'.")
+        columns = get_plot_columns(trim_key=kwargs.get("trim_key"), config=kwargs.get("config"))
+    elif columns is not None:
+        columns = list(columns) + get_processing_columns(kwargs.get("trim_key"), kwargs.get("config"))
+
+    inputfile_data = read_inputfile(input_file) if parse_cache is None else parse_cache.read_inputfile(input_file)
+
+    source = ResultsSource(output_file, columns=columns, processing_kwargs=kwargs)
+
+    if lazy:
+        lazy_table, results_data = create_lazy_results_table(output_file, columns=columns, monotonicity=source.monotonicity, **kwargs)
+        source.n_rows = lazy_table.n_rows
+        obj = create_pyfrag_object_from_processed_files(results_data, inputfile_data)
+        obj.lazy_table = lazy_table
+        obj.source = source
+        return obj
+
+    if parse_cache is None:
+        results_data = read_results_file(output_file, columns=columns)
+    else:
+        # The cache contains all columns, so the projection is applied after loading
+        results_data = parse_cache.read_results_file(output_file)
+        if columns is not None:
+            results_data = results_data[select_columns(list(results_data.columns), columns)]
+    source.n_rows = len(results_data)
+    source.row_positions, index, processed_columns = get_processed_rows(results_data, monotonicity=source.monotonicity, **kwargs)
+    results_data = take_processed_rows(results_data, source.row_positions, index, processed_columns)
 
     obj = create_pyfrag_object_from_processed_files(results_data, inputfile_data)
+    obj.source = source
 
     return obj
+
+
+# ====================================================================================================
+# Loading many directories in parallel ===============================================================
+# ====================================================================================================
+
+
+@define
+class BatchLoadResult:
+    """Attrs class containing the result of loading many PyFrag directories with `create_pyfrag_objects_from_dirs`.
+
+    Attributes:
+        objects (List[Optional[PyFragResultsObject]]): One object per input directory in the same order as the input directories, such that objects[i] belongs to results_dirs[i].
+            The objects of the directories that could not be loaded are None.
+        failures (Dict[str, Exception]): The directories that could not be loaded, mapped to the raised exception.
+
+    """
+
+    objects: List[Optional[PyFragResultsObject]] = field(factory=list)
+    failures: Dict[str, Exception] = field(factory=dict)
+
+    @property
+    def loaded_objects(self) -> List[PyFragResultsObject]:
+        """The successfully loaded objects in the same order as the input directories, e.g. to pass to the Plotter."""
+        return [obj for obj in self.objects if obj is not None]
+
+
+def _initialize_worker(config_sections: Dict[str, Dict[str, str]]) -> None:
+    """Initializes the global config in a worker process with the config of the parent process."""
+    config_parser = cp.ConfigParser()
+    config_parser.read_dict(config_sections)
+    get_config().overwrite_config(config_parser)
+
+
+def _load_pyfrag_object(results_dir: str, kwargs: Dict[str, Any]) -> Tuple[Optional[PyFragResultsObject], Optional[Exception]]:
+    """Loads one directory and returns the exception instead of raising it, such that one failing directory does not abort the whole batch."""
+    try:
+        return create_pyfrag_object_from_dir(results_dir, **kwargs), None
+    except Exception as e:
+        return None, e
+
+
+def create_pyfrag_objects_from_dirs(results_dirs: Sequence[str], workers: Optional[int] = None, executor: str = "process", **kwargs) -> BatchLoadResult:
+    """Creates PyFragResultsObjects from many directories in parallel.
+
+    Reading, parsing and processing (`process_results_file`) of the directories is distributed over a pool of workers. The active config (see `get_config`) is forwarded to
+    the workers, such that the results are identical to calling `create_pyfrag_object_from_dir` for each directory.
+
+    Args:
+        results_dirs (Sequence[str]): The paths to the directories containing the PyFrag results files.
+        workers (Optional[int]): The number of workers. Defaults to the number of CPUs. With one worker, the directories are loaded serially.
+        executor (str): The type of pool, either "process" (recommended, parsing is CPU-bound) or "thread". Defaults to "process".
+        **kwargs: Additional keyword arguments to pass to the `create_pyfrag_object_from_dir` function (e.g. `cache` and the `process_results_file` arguments).
+
+    Raises:
+        ValueError: If the executor is not "process" or "thread".
+
+    Returns:
+        BatchLoadResult: The loaded objects (in the order of `results_dirs`, with None for the directories that failed to load) and the failed directories with their exception.
+
+    """
+    executors: Dict[str, Callable[..., Executor]] = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+    if executor not in executors:
+        raise ValueError(f"Executor '{executor}' is not valid. Valid options are {list(executors.keys())}.")
+
+    results_dirs = [str(results_dir) for results_dir in results_dirs]
+    workers = min(os.cpu_count() or 1, len(results_dirs)) if workers is None else workers
+    workers = max(1, workers)
+    active_config = get_config(kwargs.pop("config", None))
+
+    if workers == 1 or executor == "thread":
+        # Threads do not inherit the context of the caller, so the config is passed explicitly
+        kwargs["config"] = active_config
+
+    if workers == 1:
+        loaded = [_load_pyfrag_object(results_dir, kwargs) for results_dir in results_dirs]
+    else:
+        executor_kwargs: Dict[str, Any] = {"max_workers": workers}
+        if executor == "process":
+            executor_kwargs.update(initializer=_initialize_worker, initargs=(active_config.raw_sections(),))
+
+        # Large chunks keep the inter-process communication overhead low for campaigns with thousands of (small) directories
+        chunksize = max(1, len(results_dirs) // (workers * 4))
+        with executors[executor](**executor_kwargs) as pool:
+            loaded = list(pool.map(_load_pyfrag_object, results_dirs, [kwargs] * len(results_dirs), chunksize=chunksize))
+
+    batch = BatchLoadResult()
+    for results_dir, (obj, exception) in zip(results_dirs, loaded):
+        if exception is not None:
+            logging.log(logging.WARNING, f"Could not load {results_dir}: {exception}")
+            batch.failures[results_dir] = exception
+        batch.objects.append(obj)
+    return batch
@@ -0,0 +1,19 @@
+""" Fixtures that are shared by the tests """
+import pathlib as pl
+
+import pytest
+from pyfrag_plotter import initialize_pyfrag_plotter
+
+example_config_file = pl.Path(__file__).resolve().parent.parent / "example" / "example_config.ini"
+
+
+@pytest.fixture
+def initialized_config():
+    """Initializes the global config with the example config file."""
+    initialize_pyfrag_plotter(str(example_config_file))
+
+
+@pytest.fixture
+def headless_config():
+    """Initializes the global config with the example config file in headless mode (the Agg backend), for the tests that plot."""
+    initialize_pyfrag_plotter(str(example_config_file), headless=True)
@@ -0,0 +1,43 @@
+import pathlib as pl
+
+import pandas as pd
+import pytest
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir, create_pyfrag_objects_from_dirs
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dirs = [str(example_dir / name) for name in ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi", "ureas_di_O_Cs_sigma"]]
+
+
+pytestmark = pytest.mark.usefixtures("initialized_config")
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_create_pyfrag_objects_from_dirs_preserves_order(executor):
+    batch = create_pyfrag_objects_from_dirs(example_results_dirs, workers=2, executor=executor)
+    expected = [create_pyfrag_object_from_dir(results_dir) for results_dir in example_results_dirs]
+
+    assert not batch.failures
+    assert [obj.name for obj in batch.objects] == [obj.name for obj in expected]
+    for obj, expected_obj in zip(batch.objects, expected):
+        pd.testing.assert_frame_equal(obj.dataframe, expected_obj.dataframe)
+
+
+def test_create_pyfrag_objects_from_dirs_forwards_kwargs():
+    batch = create_pyfrag_objects_from_dirs(example_results_dirs, workers=2, trim_option=5)
+    assert all(len(obj.dataframe) <= 5 for obj in batch.objects)
+
+
+def test_create_pyfrag_objects_from_dirs_reports_failures(tmp_path):
+    results_dirs = [example_results_dirs[0], str(tmp_path), example_results_dirs[1]]
+    batch = create_pyfrag_objects_from_dirs(results_dirs, workers=2)
+
+    assert [None if obj is None else obj.name for obj in batch.objects] == ["ureas_di_O_Cs_all", None, "ureas_di_O_Cs_pi"]
+    assert [obj.name for obj in batch.loaded_objects] == ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi"]
+    assert list(batch.failures) == [str(tmp_path)]
+    assert isinstance(batch.failures[str(tmp_path)], FileNotFoundError)
+
+
+def test_create_pyfrag_objects_from_dirs_invalid_executor():
+    with pytest.raises(ValueError):
+        create_pyfrag_objects_from_dirs(example_results_dirs, executor="invalid")
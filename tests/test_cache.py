@@ -0,0 +1,131 @@
+import os
+import pathlib as pl
+import shutil
+
+import pandas as pd
+import pytest
+import pyfrag_plotter.input.cache as cache_module
+from pyfrag_plotter.input.cache import ParseCache
+from pyfrag_plotter.input.read_inputfile import read_inputfile
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example" / "ureas_di_O_Cs_all"
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    directory = tmp_path / "ureas_di_O_Cs_all"
+    shutil.copytree(example_dir, directory)
+    return directory
+
+
+@pytest.fixture
+def parse_cache(tmp_path):
+    return ParseCache(cache_dir=str(tmp_path / "cache"))
+
+
+def _disable_parsers(monkeypatch):
+    def fail(path):
+        raise AssertionError(f"{path} should have been loaded from the cache")
+
+    monkeypatch.setitem(cache_module._SERIALIZERS, "inputfile", (fail,) + cache_module._SERIALIZERS["inputfile"][1:])
+    monkeypatch.setitem(cache_module._SERIALIZERS, "results", (fail,) + cache_module._SERIALIZERS["results"][1:])
+
+
+def test_cache_results_file_roundtrip(results_dir, parse_cache):
+    results_file = str(results_dir / "pyfrag_ureas_di_O_Cs_all.txt")
+    cold = parse_cache.read_results_file(results_file)
+    warm = parse_cache.read_results_file(results_file)
+    pd.testing.assert_frame_equal(warm, read_results_file(results_file))
+    pd.testing.assert_frame_equal(warm, cold)
+    assert (parse_cache.hits, parse_cache.misses) == (1, 1)
+
+
+def test_cache_inputfile_roundtrip(results_dir, parse_cache):
+    inputfile = str(results_dir / "ureas_di_O_Cs_all.in")
+    parse_cache.read_inputfile(inputfile)
+    assert parse_cache.read_inputfile(inputfile) == read_inputfile(inputfile)
+
+
+def test_cache_warm_run_skips_parsing(results_dir, parse_cache, monkeypatch):
+    results_file = str(results_dir / "pyfrag_ureas_di_O_Cs_all.txt")
+    inputfile = str(results_dir / "ureas_di_O_Cs_all.in")
+    parse_cache.read_results_file(results_file)
+    parse_cache.read_inputfile(inputfile)
+
+    _disable_parsers(monkeypatch)
+    parse_cache.read_results_file(results_file)
+    parse_cache.read_inputfile(inputfile)
+
+
+def test_cache_is_content_addressed(results_dir, parse_cache, monkeypatch, tmp_path):
+    parse_cache.read_results_file(str(results_dir / "pyfrag_ureas_di_O_Cs_all.txt"))
+
+    copied_dir = tmp_path / "copy"
+    shutil.copytree(results_dir, copied_dir)
+    _disable_parsers(monkeypatch)
+    parse_cache.read_results_file(str(copied_dir / "pyfrag_ureas_di_O_Cs_all.txt"))
+
+
+def test_cache_detects_modified_file(results_dir, parse_cache):
+    results_file = results_dir / "pyfrag_ureas_di_O_Cs_all.txt"
+    parse_cache.read_results_file(str(results_file))
+
+    lines = results_file.read_text().splitlines()
+    results_file.write_text("\n".join(lines[:10]) + "\n")
+    os.utime(results_file, ns=(0, 0))
+
+    assert len(parse_cache.read_results_file(str(results_file))) == 9
+    assert parse_cache.misses == 2
+
+
+def test_cache_eviction(results_dir, tmp_path):
+    parse_cache = ParseCache(cache_dir=str(tmp_path / "cache"), max_size=0)
+    parse_cache.read_results_file(str(results_dir / "pyfrag_ureas_di_O_Cs_all.txt"))
+    parse_cache.read_inputfile(str(results_dir / "ureas_di_O_Cs_all.in"))
+    assert parse_cache.n_entries == 0
+
+
+def test_cache_eviction_removes_stat_keys(results_dir, parse_cache):
+    results_file = results_dir / "pyfrag_ureas_di_O_Cs_all.txt"
+    parse_cache.read_results_file(str(results_file))
+    parse_cache.read_inputfile(str(results_dir / "ureas_di_O_Cs_all.in"))
+
+    # Every modification of the file adds a stat key and an entry
+    lines = results_file.read_text().splitlines()
+    for n_lines in [10, 20]:
+        results_file.write_text("\n".join(lines[:n_lines]) + "\n")
+        os.utime(results_file, ns=(n_lines, n_lines))
+        parse_cache.read_results_file(str(results_file))
+    stats_dir = pl.Path(parse_cache.cache_dir) / "stats"
+    assert len(list(stats_dir.iterdir())) == 4
+
+    # A stat key of which the entry was removed (e.g. by an older version of the cache) is an orphan
+    (stats_dir / "orphan").write_text("0" * 40)
+
+    # Removing the orphan is not enough, so the least recently used entry (and its stat key) is removed as well
+    parse_cache.prune(max_size=parse_cache.size - 41)
+    assert parse_cache.n_entries == 3
+    assert len(list(stats_dir.iterdir())) == 3
+    assert parse_cache.size <= parse_cache.max_size
+
+    parse_cache.prune(max_size=0)
+    assert parse_cache.n_entries == 0
+    assert list(stats_dir.iterdir()) == []
+    assert parse_cache.size == 0
+
+
+def test_cache_clear(results_dir, parse_cache):
+    parse_cache.read_results_file(str(results_dir / "pyfrag_ureas_di_O_Cs_all.txt"))
+    assert parse_cache.n_entries == 1
+    parse_cache.clear()
+    assert parse_cache.n_entries == 0
+    assert parse_cache.size == 0
+
+
+def test_cache_cli_prune(results_dir, parse_cache, capsys):
+    parse_cache.read_results_file(str(results_dir / "pyfrag_ureas_di_O_Cs_all.txt"))
+    cache_module.main(["prune", "--cache-dir", parse_cache.cache_dir, "--max-size", "0"])
+    assert "Removed 1 entries" in capsys.readouterr().out
+    assert parse_cache.n_entries == 0
@@ -0,0 +1,70 @@
+import bz2
+import gzip
+import lzma
+import pathlib as pl
+import shutil
+
+import pandas as pd
+import pytest
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.input.discovery import discover_pyfrag_jobs
+from pyfrag_plotter.input.pyfrag_files import get_pyfrag_files
+from pyfrag_plotter.input.read_inputfile import read_inputfile
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+from pyfrag_plotter.input.schema import read_results_schema
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dir = example_dir / "ureas_di_O_Cs_all"
+example_results_file = example_results_dir / "pyfrag_ureas_di_O_Cs_all.txt"
+example_input_file = example_results_dir / "ureas_di_O_Cs_all.in"
+
+COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+
+
+def _compress(path: pl.Path, target_dir: pl.Path, extension: str) -> pl.Path:
+    target = target_dir / (path.name + extension)
+    target.write_bytes(COMPRESSORS[extension](path.read_bytes()))
+    return target
+
+
+@pytest.mark.parametrize("extension", COMPRESSORS)
+def test_read_compressed_files(tmp_path, extension):
+    results_file = _compress(example_results_file, tmp_path, extension)
+    input_file = _compress(example_input_file, tmp_path, extension)
+
+    pd.testing.assert_frame_equal(read_results_file(str(results_file)), read_results_file(str(example_results_file)))
+    pd.testing.assert_frame_equal(
+        read_results_file(str(results_file), columns=["EnergyTotal"]), read_results_file(str(example_results_file), columns=["EnergyTotal"])
+    )
+    assert read_inputfile(str(input_file)) == read_inputfile(str(example_input_file))
+    assert read_results_schema(str(results_file))["n_rows"] == read_results_schema(str(example_results_file))["n_rows"]
+
+
+def test_compressed_directory(tmp_path):
+    initialize_pyfrag_plotter(str(example_dir / "example_config.ini"))
+    job_dir = tmp_path / "campaign" / "ureas"
+    job_dir.mkdir(parents=True)
+    results_file = _compress(example_results_file, job_dir, ".xz")
+    input_file = _compress(example_input_file, job_dir, ".gz")
+
+    assert get_pyfrag_files(str(job_dir)) == (str(input_file), str(results_file))
+    assert discover_pyfrag_jobs(str(tmp_path / "campaign")).directories == [str(job_dir)]
+
+    obj = create_pyfrag_object_from_dir(str(job_dir))
+    pd.testing.assert_frame_equal(obj.dataframe, create_pyfrag_object_from_dir(str(example_results_dir)).dataframe)
+
+
+def test_compressed_files_are_matched_by_name(tmp_path):
+    shutil.copy(example_input_file, tmp_path / "other.in")
+    input_file = _compress(example_input_file, tmp_path, ".gz")
+    results_file = _compress(example_results_file, tmp_path, ".gz")
+    assert get_pyfrag_files(str(tmp_path)) == (str(input_file), str(results_file))
+
+
+def test_read_zstd_file(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    results_file = tmp_path / "pyfrag_test.txt.zst"
+    results_file.write_bytes(zstandard.ZstdCompressor().compress(example_results_file.read_bytes()))
+    pd.testing.assert_frame_equal(read_results_file(str(results_file)), read_results_file(str(example_results_file)))
@@ -121,3 +121,33 @@ def test_get_extra_config_missing_section():
     config = Config(config_parser)
     with pytest.raises(ValueError):
         config.get('MISSING_SECTION', 'missing_key')
+
+
+def test_snapshot_equals_parsed_values(config):
+    for section in config.sections:
+        for option in config.config_parser[section]:
+            assert config.get(section, option) == config.parse(section, option)
+
+
+def test_snapshot_returns_list_copies(config):
+    config.get('SHARED', 'colours').append('purple')
+    assert 'purple' not in config.get('SHARED', 'colours')
+    with pytest.raises(TypeError):
+        config.snapshot.sections['SHARED']['vline'] = 1.0
+
+
+def test_snapshot_invalidated_on_overwrite(config):
+    assert config.get('SHARED', 'y_lim') == [-40, 40]
+    config_parser = ConfigParser()
+    config_parser.read(path_to_config)
+    config_parser.read(path_to_extra_config)
+    config.overwrite_config(config_parser)
+    assert config.get('SHARED', 'y_lim') == [-30, 30]
+
+
+def test_snapshot_invalid_value(config):
+    config.config_parser['SHARED']['n_interpolation_points'] = 'many'
+    config.invalidate_snapshot()
+    with pytest.raises(ValueError):
+        config.get('SHARED', 'n_interpolation_points')
+    assert config.get('SHARED', 'vline') == 0.0
@@ -0,0 +1,98 @@
+import pathlib as pl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from pyfrag_plotter import config as global_config
+from pyfrag_plotter.config.context import config_context, create_config, get_config
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+from pyfrag_plotter.interpolate import interpolate_plot
+from pyfrag_plotter.processing_funcs import hampel_outliers, remove_outliers, remove_outliers_hampel, trim_data, trim_ranges
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir, create_pyfrag_objects_from_dirs
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dirs = [str(example_dir / name) for name in ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi"]]
+
+
+pytestmark = pytest.mark.usefixtures("initialized_config")
+
+
+def test_get_config_defaults_to_global_config():
+    assert get_config() is global_config
+
+
+def test_config_context_overrides_and_restores():
+    x_lim = global_config.get("SHARED", "x_lim")
+
+    with config_context(x_lim=(-1.0, 1.0), n_interpolation_points=10) as config:
+        assert get_config() is config
+        assert get_config().get("SHARED", "x_lim") == [-1.0, 1.0]
+        assert get_config().get("SHARED", "n_interpolation_points") == 10
+
+    assert get_config() is global_config
+    assert global_config.get("SHARED", "x_lim") == x_lim
+
+
+def test_config_context_invalid_option():
+    with pytest.raises(ValueError):
+        with config_context(not_an_option=1):
+            pass
+
+
+def test_explicit_config_takes_precedence_over_context():
+    explicit_config = create_config(global_config, x_lim=(-3.0, 3.0))
+    with config_context(x_lim=(-1.0, 1.0)):
+        assert get_config(explicit_config).get("SHARED", "x_lim") == [-3.0, 3.0]
+
+
+def test_config_context_is_local_to_thread():
+    barrier = threading.Barrier(2)
+
+    def read_x_lim(limit: float):
+        with config_context(x_lim=(-limit, limit)):
+            # Both threads are inside their own context at the same time
+            barrier.wait()
+            return get_config().get("SHARED", "x_lim")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        x_lims = list(pool.map(read_x_lim, [1.0, 2.0]))
+
+    assert x_lims == [[-1.0, 1.0], [-2.0, 2.0]]
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_batch_loading_uses_config_context(executor):
+    with config_context(trim_option=5):
+        batch = create_pyfrag_objects_from_dirs(example_results_dirs, workers=2, executor=executor)
+        expected = [create_pyfrag_object_from_dir(results_dir) for results_dir in example_results_dirs]
+
+    assert not batch.failures
+    assert [len(obj.dataframe) for obj in batch.objects] == [len(obj.dataframe) for obj in expected]
+    assert all(len(obj.dataframe) <= 5 for obj in batch.objects)
+
+
+def test_interpolate_plot_uses_explicit_config():
+    x = np.linspace(0.0, 1.0, 20)
+    y = x**2
+
+    x_new, _ = interpolate_plot(x, y, config=create_config(global_config, n_interpolation_points=37))
+    with config_context(n_interpolation_points=12):
+        x_context, _ = interpolate_plot(x, y)
+
+    assert len(x_new) == 37
+    assert len(x_context) == 12
+
+
+def test_processing_steps_use_explicit_config():
+    df = read_results_file(str(example_dir / "ureas_di_O_Cs_all" / "pyfrag_ureas_di_O_Cs_all.txt"))
+    config = create_config(global_config, trim_option=5, outlier_threshold=0.0, hampel_window=3, hampel_threshold=0.0)
+
+    # The config of the context is ignored if a config is passed
+    with config_context(trim_option=10, outlier_threshold=1000.0, hampel_window=45, hampel_threshold=1000.0):
+        assert len(trim_data(df, config=config)) == 5
+        assert trim_ranges(df, config=config) == [range(0, 5)]
+        assert len(remove_outliers(df, config=config)) < len(df)
+        assert hampel_outliers(df, config=config)[0].any()
+        assert len(remove_outliers_hampel(df, config=config)) < len(df)
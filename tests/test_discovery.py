@@ -0,0 +1,69 @@
+import os
+
+import pytest
+from pyfrag_plotter.input.discovery import discover_pyfrag_jobs
+from pyfrag_plotter.input.pyfrag_files import get_pyfrag_files
+
+
+def _make_job(directory, name: str, extra_files=()):
+    os.makedirs(directory, exist_ok=True)
+    for filename in (f"{name}.in", f"pyfrag_{name}.txt") + tuple(extra_files):
+        with open(os.path.join(directory, filename), "w") as f:
+            f.write("test")
+
+
+@pytest.fixture
+def campaign(tmp_path):
+    tmp_path = tmp_path / "campaign"
+    _make_job(tmp_path / "group_a" / "job_1", "job_1")
+    _make_job(tmp_path / "group_a" / "job_2", "job_2")
+    _make_job(tmp_path / "group_b" / "job_3", "job_3")
+    # Scratch and restart directories are not searched
+    _make_job(tmp_path / "group_b" / "job_3" / "plams_workdir" / "inner", "inner")
+    _make_job(tmp_path / "restart_job_1", "restart_job_1")
+    _make_job(tmp_path / "group_b" / "ams.results", "ams")
+    # Two input files that cannot be matched to the results file by name
+    _make_job(tmp_path / "ambiguous", "job_4", extra_files=("job_5.in",))
+    os.rename(tmp_path / "ambiguous" / "pyfrag_job_4.txt", tmp_path / "ambiguous" / "pyfrag_job_6.txt")
+    return tmp_path
+
+
+def test_discover_pyfrag_jobs(campaign):
+    result = discover_pyfrag_jobs(str(campaign))
+    assert result.directories == [str(campaign / "group_a" / "job_1"), str(campaign / "group_a" / "job_2"), str(campaign / "group_b" / "job_3")]
+    assert result.jobs[0].input_file == str(campaign / "group_a" / "job_1" / "job_1.in")
+    assert result.jobs[0].results_file == str(campaign / "group_a" / "job_1" / "pyfrag_job_1.txt")
+
+
+def test_discover_pyfrag_jobs_ambiguous(campaign):
+    result = discover_pyfrag_jobs(str(campaign))
+    assert list(result.ambiguous) == [str(campaign / "ambiguous")]
+
+
+def test_discover_pyfrag_jobs_matches_by_name(tmp_path):
+    _make_job(tmp_path / "job", "job", extra_files=("old.in",))
+    result = discover_pyfrag_jobs(str(tmp_path))
+    assert result.jobs[0].input_file == str(tmp_path / "job" / "job.in")
+
+
+def test_discover_pyfrag_jobs_incremental(campaign, tmp_path):
+    index_file = str(tmp_path / "index.json")
+    first = discover_pyfrag_jobs(str(campaign), index_file=index_file)
+    second = discover_pyfrag_jobs(str(campaign), index_file=index_file)
+    assert second.n_scanned == 0
+    assert second.directories == first.directories
+
+    _make_job(campaign / "group_b" / "job_5", "job_5")
+    third = discover_pyfrag_jobs(str(campaign), index_file=index_file)
+    assert third.n_scanned == 2  # group_b and the new job
+    assert str(campaign / "group_b" / "job_5") in third.directories
+
+
+def test_discover_pyfrag_jobs_not_a_directory(tmp_path):
+    with pytest.raises(NotADirectoryError):
+        discover_pyfrag_jobs(str(tmp_path / "missing"))
+
+
+def test_get_pyfrag_files_multiple_candidates(tmp_path):
+    _make_job(tmp_path, "job", extra_files=("old.in",))
+    assert get_pyfrag_files(str(tmp_path)) == (str(tmp_path / "job.in"), str(tmp_path / "pyfrag_job.txt"))
@@ -0,0 +1,80 @@
+import pathlib as pl
+
+import pytest
+from pyfrag_plotter.plot.plot_details import _import_pyplot, set_axes_details, set_figure_details
+from pyfrag_plotter.plot.plotter import Plotter
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dirs = [str(example_dir / name) for name in ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi", "ureas_di_O_Cs_sigma"]]
+
+
+@pytest.fixture(autouse=True)
+def closed_figures(headless_config):
+    yield
+    _import_pyplot().close("all")
+
+
+@pytest.fixture
+def objs():
+    return [create_pyfrag_object_from_dir(results_dir) for results_dir in example_results_dirs]
+
+
+def _make_plots(plotter: Plotter) -> None:
+    plotter.plot_asm()
+    plotter.plot_eda(["Int", "Pauli"], y_lim=[-30, 30])
+    plotter.plot_asm(["EnergyTotal"], plot_legend=False)
+
+
+def test_recycled_figures_match_new_figures(objs, tmp_path):
+    for name, recycle_figures in [("new", False), ("recycled", True)]:
+        with Plotter(name=name, plot_dir=str(tmp_path), pyfrag_objects=objs, irc_coord=("bondlength_1", "r - r$_{eq}$ / Å"), recycle_figures=recycle_figures) as plotter:
+            _make_plots(plotter)
+
+    for file_name in ["ASM_EnergyTotal_Int_StrainTotal.png", "EDA_Int_Pauli.png", "ASM_EnergyTotal.png"]:
+        assert (tmp_path / "recycled" / file_name).read_bytes() == (tmp_path / "new" / file_name).read_bytes()
+
+
+def test_recycled_figure_without_title_matches_new_figure(objs, tmp_path):
+    plt = _import_pyplot()
+    images = []
+    for recycle_figures in [False, True]:
+        with Plotter(name="plots", plot_dir=str(tmp_path), pyfrag_objects=objs, irc_coord=("bondlength_1", "r - r$_{eq}$ / Å"), recycle_figures=recycle_figures) as plotter:
+            plotter.plot_asm()
+            fig, ax = plotter.new_figure()
+            plotter.standard_plot_routine(["Int"], ax)
+            set_axes_details(ax=ax, interpolate=False, style=not recycle_figures)
+            set_figure_details(fig=fig, savefig=str(tmp_path / f"untitled_{recycle_figures}.png"))
+            images.append((tmp_path / f"untitled_{recycle_figures}.png").read_bytes())
+        plt.close("all")
+
+    assert images[0] == images[1]
+
+
+def test_figures_are_reused_and_closed(objs, tmp_path):
+    plt = _import_pyplot()
+    open_figures = len(plt.get_fignums())
+
+    with Plotter(name="plots", plot_dir=str(tmp_path), pyfrag_objects=objs, irc_coord=("bondlength_1", "r - r$_{eq}$ / Å")) as plotter:
+        _make_plots(plotter)
+        fig, ax = plotter.plot_eda(["Int"], clear_plot=True)
+        # The cleared figure is replaced by a new figure for the next plot
+        assert plotter.plot_eda(["Int"])[0] is not fig
+        assert len(plt.get_fignums()) == open_figures + 1
+
+    assert len(plt.get_fignums()) == open_figures
+
+
+
+def test_figures_closed_between_plots(objs, tmp_path):
+    plt = _import_pyplot()
+    plt.close("all")
+
+    with Plotter(name="plots", plot_dir=str(tmp_path), pyfrag_objects=objs, irc_coord=("bondlength_1", "r - r$_{eq}$ / Å")) as plotter:
+        for keys in [["Int"], ["Int", "Pauli"], ["OI"]]:
+            fig, _ = plotter.plot_eda(keys)
+            assert plt.gcf() is fig
+            plt.close("all")
+
+    assert plt.get_fignums() == []
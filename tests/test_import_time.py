@@ -0,0 +1,80 @@
+""" Tests of the headless startup (python -X importtime), which should not import matplotlib and scipy. The startup times are compared in benchmarks/bench_import_time.py """
+import pathlib as pl
+import subprocess
+import sys
+from typing import List, Tuple
+
+import pytest
+from pyfrag_plotter import is_headless
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+
+HEAVY_MODULES = ("matplotlib", "scipy")
+
+HEADLESS_SCRIPT = f"""
+from pyfrag_plotter import initialize_pyfrag_plotter
+from pyfrag_plotter.interpolate import interpolate_plot
+from pyfrag_plotter.plot.plotter import Plotter
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir
+
+initialize_pyfrag_plotter({str(example_dir / "example_config.ini")!r}, headless=True)
+create_pyfrag_object_from_dir({str(example_dir / "ureas_di_O_Cs_all")!r})
+"""
+
+def _import_times(script: str) -> List[Tuple[str, int]]:
+    """Runs the script with -X importtime and returns the names and the cumulative import times (in microseconds) of all imported modules.
+
+    The names of nested imports are indented, such that the top-level imports can be selected.
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", script], capture_output=True, text=True, check=True)
+    import_times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        import_times.append((name[1:].rstrip(), int(cumulative)))
+    return import_times
+
+
+def test_headless_startup_does_not_import_heavy_modules():
+    imported = [name.strip() for name, _ in _import_times(HEADLESS_SCRIPT)]
+
+    assert not [name for name in imported if name.split(".")[0] in HEAVY_MODULES]
+
+
+def test_deferred_plot_parameters_are_applied_when_plotting():
+    script = f"""
+import sys
+from pyfrag_plotter import initialize_pyfrag_plotter, config
+from pyfrag_plotter.plot.plot_details import set_axes_details
+
+initialize_pyfrag_plotter({str(example_dir / "example_config.ini")!r}, headless=True)
+assert "matplotlib" not in sys.modules
+
+set_axes_details()
+import matplotlib as mpl
+assert mpl.get_backend().lower() == "agg", mpl.get_backend()
+assert list(mpl.rcParams["figure.figsize"]) == config.get("MATPLOTLIB", "fig_size")
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+@pytest.mark.parametrize(
+    "platform, environment, expected",
+    [
+        ("linux", {}, True),
+        ("linux", {"DISPLAY": ":0"}, False),
+        ("linux", {"WAYLAND_DISPLAY": "wayland-0"}, False),
+        ("win32", {}, False),
+        ("darwin", {}, False),
+    ],
+)
+def test_is_headless(monkeypatch, platform, environment, expected):
+    monkeypatch.setattr(sys, "platform", platform)
+    monkeypatch.delenv("DISPLAY", raising=False)
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+    for key, value in environment.items():
+        monkeypatch.setenv(key, value)
+
+    assert is_headless() == expected
@@ -0,0 +1,282 @@
+import pathlib as pl
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyfrag_plotter.errors import PyFragInterpolationError
+from pyfrag_plotter.config.context import config_context
+from pyfrag_plotter.config.validate import ALLOWED_VALUES
+from pyfrag_plotter.interpolate import (
+    INTERPOLATION_METHODS,
+    adaptive_samples,
+    find_stationary_points,
+    interpolate_cube,
+    interpolate_data,
+    interpolate_plot,
+    make_interpolator,
+)
+from pyfrag_plotter.pyfrag_object import PyFragResultsObject, create_pyfrag_object_from_dir
+from scipy.interpolate import make_interp_spline
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dirs = [str(example_dir / name) for name in ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi", "ureas_di_O_Cs_sigma"]]
+
+
+pytestmark = pytest.mark.usefixtures("initialized_config")
+
+
+@pytest.fixture
+def wide_dataframe():
+    rng = np.random.default_rng(5)
+    data = {"bondlength_1": np.linspace(1.5, 3.5, 40)}
+    data.update({f"vdd_{i + 1}": rng.normal(size=40) for i in range(50)})
+    return pd.DataFrame(data)
+
+
+def test_interpolate_data_many_points(wide_dataframe):
+    points = np.linspace(1.5, 3.5, 1000)
+    interpolated = interpolate_data(wide_dataframe, "bondlength_1", points)
+
+    assert interpolated.shape == (1000, 51)
+    assert list(interpolated.columns) == list(wide_dataframe.columns)
+    np.testing.assert_allclose(interpolated["bondlength_1"], points)
+    for key in ["vdd_1", "vdd_25", "vdd_50"]:
+        np.testing.assert_allclose(interpolated[key], np.interp(points, wide_dataframe["bondlength_1"], wide_dataframe[key]))
+
+
+def test_interpolate_data_single_point(wide_dataframe):
+    interpolated = interpolate_data(wide_dataframe, "bondlength_1", 2.0)
+
+    assert interpolated.shape == (1, 51)
+    assert interpolated["bondlength_1"].iloc[0] == pytest.approx(2.0)
+
+
+def test_interpolate_data_does_not_modify_input(wide_dataframe):
+    original = wide_dataframe.copy()
+    interpolate_data(wide_dataframe, "bondlength_1", [2.0, 3.0])
+    pd.testing.assert_frame_equal(wide_dataframe, original)
+
+    obj = create_pyfrag_object_from_dir(str(example_dir / "ureas_di_O_Cs_all"))
+    original = obj.dataframe.copy()
+    interpolate_data(obj, "bondlength_1", obj.dataframe["bondlength_1"].mean())
+    pd.testing.assert_frame_equal(obj.dataframe, original)
+
+
+def test_interpolate_data_does_not_load_columns_of_lazy_object():
+    obj = create_pyfrag_object_from_dir(example_results_dirs[0], lazy=True)
+    loaded_columns = list(obj.dataframe.columns)
+    points = np.linspace(-0.4, -0.1, 5)
+
+    interpolated = interpolate_data(obj, "bondlength_1", points)
+
+    assert obj.lazy_table is not None
+    assert list(obj.dataframe.columns) == loaded_columns
+    expected = interpolate_data(create_pyfrag_object_from_dir(example_results_dirs[0]), "bondlength_1", points)
+    pd.testing.assert_frame_equal(interpolated, expected)
+
+
+def test_interpolate_data_outside_range(wide_dataframe):
+    with pytest.raises(PyFragInterpolationError):
+        interpolate_data(wide_dataframe, "bondlength_1", [2.0, 4.0])
+
+
+def test_interpolate_cube():
+    objs = [create_pyfrag_object_from_dir(results_dir) for results_dir in example_results_dirs]
+    terms = ["EnergyTotal", "Int", "StrainTotal"]
+    x_min = max(obj.get_x_axis("bondlength_1").min() for obj in objs)
+    x_max = min(obj.get_x_axis("bondlength_1").max() for obj in objs)
+    points = np.linspace(x_min, x_max, 15)
+
+    cube = interpolate_cube(objs, "bondlength_1", points, terms)
+
+    assert cube.shape == (3, 15, 3)
+    for obj, system in zip(objs, cube):
+        x = obj.get_x_axis("bondlength_1")
+        order = np.argsort(x)
+        for j, term in enumerate(terms):
+            expected = make_interp_spline(x[order], obj.get_data_of_key(term)[order], k=3)(points)
+            np.testing.assert_allclose(system[:, j], expected)
+
+
+def test_interpolate_cube_masks_outside_range_and_missing_terms():
+    obj = create_pyfrag_object_from_dir(example_results_dirs[0])
+    x = obj.get_x_axis("bondlength_1")
+    points = np.array([x.min() - 1.0, x.mean(), x.max() + 1.0])
+
+    cube = interpolate_cube([obj], "bondlength_1", points, ["EnergyTotal", "NotATerm"])
+
+    assert np.isnan(cube[0, [0, 2], :]).all()
+    assert np.isfinite(cube[0, 1, 0])
+    assert np.isnan(cube[0, :, 1]).all()
+
+
+@pytest.mark.parametrize("method", list(INTERPOLATION_METHODS))
+def test_interpolate_cube_methods(method):
+    objs = _parabola_objects(3)
+    points = np.linspace(0.5, 3.5, 31)
+
+    cube = interpolate_cube(objs, "bondlength_1", points, ["EnergyTotal", "Int"], method=method)
+
+    inside = (points >= 1.0) & (points <= 3.0)
+    assert np.isnan(cube[:, ~inside]).all()
+    for obj, system in zip(objs, cube):
+        y = obj.dataframe[["EnergyTotal", "Int"]].to_numpy()[::-1]
+        np.testing.assert_allclose(system[inside], make_interpolator(obj.get_x_axis("bondlength_1")[::-1], y, method)(points[inside]))
+
+
+def test_interpolate_cube_masks_systems_that_cannot_be_interpolated(caplog):
+    objs = _parabola_objects(2)
+    # Duplicate values of the IRC coordinate cannot be interpolated
+    objs[0].dataframe["bondlength_1"] = 2.0
+
+    cube = interpolate_cube(objs, "bondlength_1", np.linspace(1.5, 2.5, 5), ["EnergyTotal"])
+
+    assert np.isnan(cube[0]).all()
+    assert np.isfinite(cube[1]).all()
+    assert "system_0" in caplog.text
+
+
+def _parabola_objects(n_systems: int):
+    # Decreasing bond length (as along an IRC) with the maximum of the energy between two computed points
+    x = np.linspace(3.0, 1.0, 21)
+    return [
+        PyFragResultsObject(name=f"system_{i}", dataframe=pd.DataFrame({"bondlength_1": x, "EnergyTotal": 5.0 + i - 3.0 * (x - 2.03 - 0.1 * i) ** 2, "Int": 2.0 * x}))
+        for i in range(n_systems)
+    ]
+
+
+def test_find_stationary_points():
+    stationary_points = find_stationary_points(_parabola_objects(3), "bondlength_1", terms=["Int"])
+
+    assert list(stationary_points.index) == ["system_0", "system_1", "system_2"]
+    np.testing.assert_allclose(stationary_points["bondlength_1"], [2.03, 2.13, 2.23])
+    np.testing.assert_allclose(stationary_points["EnergyTotal"], [5.0, 6.0, 7.0])
+    np.testing.assert_allclose(stationary_points["Int"], [4.06, 4.26, 4.46])
+    np.testing.assert_allclose(stationary_points["curvature"], -6.0)
+    assert stationary_points["is_stationary"].all()
+
+
+def test_find_stationary_points_without_stationary_point():
+    # A parabola with a maximum has no minimum within the range, so the computed point with the lowest energy is returned
+    stationary_points = find_stationary_points(_parabola_objects(1), "bondlength_1", peak="min")
+
+    assert stationary_points["bondlength_1"].iloc[0] == pytest.approx(1.0)
+    assert not stationary_points["is_stationary"].iloc[0]
+
+
+def test_find_stationary_points_global_extreme():
+    # A local minimum at 1.3, while the energy keeps decreasing after 1.6 to below that minimum at the end of the IRC
+    x = np.linspace(1.0, 2.0, 30)
+    obj = PyFragResultsObject(name="system", dataframe=pd.DataFrame({"bondlength_1": x, "EnergyTotal": 5.0 * (x - 1.3) ** 2 - 60.0 * np.clip(x - 1.6, 0.0, None) ** 2}))
+
+    stationary_points = find_stationary_points([obj], "bondlength_1", peak="min")
+
+    assert stationary_points["bondlength_1"].iloc[0] == pytest.approx(2.0)
+    assert stationary_points["EnergyTotal"].iloc[0] == pytest.approx(-7.15)
+    assert not stationary_points["is_stationary"].iloc[0]
+
+
+def test_find_stationary_points_invalid_input():
+    objs = _parabola_objects(1)
+    with pytest.raises(ValueError):
+        find_stationary_points(objs, "bondlength_1", peak="saddle")
+    with pytest.raises(PyFragInterpolationError):
+        find_stationary_points(objs, "bondlength_1", terms=["NotATerm"])
+
+
+def _sharp_feature():
+    # A flat line with a sharp well, such as the Pauli repulsion close to the transition state
+    x = np.linspace(1.5, 3.5, 60)
+    return x, x - 10.0 / (1.0 + ((x - 2.2) / 0.05) ** 2)
+
+
+@pytest.mark.parametrize("tolerance", [0.5, 0.05])
+def test_adaptive_samples_reach_tolerance(tolerance):
+    spline = make_interp_spline(*_sharp_feature(), k=3)
+    x, y = adaptive_samples(spline, 1.5, 3.5, tolerance, max_points=1000)
+
+    dense_x = np.linspace(1.5, 3.5, 100_001)
+    assert np.all(np.diff(x) > 0)
+    assert (x[0], x[-1]) == (1.5, 3.5)
+    assert np.abs(np.interp(dense_x, x, y) - spline(dense_x)).max() <= tolerance
+    # Evenly spaced samples need many more points for the same accuracy
+    uniform_x = np.linspace(1.5, 3.5, 4 * len(x))
+    assert np.abs(np.interp(dense_x, uniform_x, spline(uniform_x)) - spline(dense_x)).max() > tolerance
+
+
+def test_adaptive_samples_max_points():
+    spline = make_interp_spline(*_sharp_feature(), k=3)
+    x, _ = adaptive_samples(spline, 1.5, 3.5, 1e-9, max_points=40)
+
+    assert len(x) == 40
+
+
+def test_interpolate_plot_interpolation_tolerance():
+    x, y = _sharp_feature()
+    with config_context(n_interpolation_points=200):
+        uniform_x, _ = interpolate_plot(x, y)
+        with config_context(interpolation_tolerance=0.1):
+            adaptive_x, _ = interpolate_plot(x, y)
+
+    assert len(uniform_x) == 200
+    assert len(adaptive_x) < 200
+
+
+@pytest.mark.parametrize("method", sorted(INTERPOLATION_METHODS))
+def test_interpolation_methods_evaluate_all_columns(method):
+    rng = np.random.default_rng(11)
+    x = np.linspace(1.5, 3.5, 30)
+    y = np.column_stack([np.sin(3 * x), x**2, rng.normal(scale=0.01, size=30)])
+    points = np.linspace(1.5, 3.5, 101)
+
+    interpolated = make_interpolator(x, y, method)(points)
+
+    assert interpolated.shape == (101, 3)
+    for j in range(3):
+        np.testing.assert_allclose(interpolated[:, j], make_interpolator(x, y[:, j], method)(points), atol=1e-10)
+    if method != "smoothing":
+        np.testing.assert_allclose(make_interpolator(x, y, method)(x), y, atol=1e-10)
+
+
+def test_linear_interpolator_matches_np_interp():
+    x = np.array([0.0, 0.5, 2.0, 3.0])
+    y = np.array([1.0, -1.0, 4.0, 2.0])
+    points = np.linspace(0.0, 3.0, 50)
+
+    np.testing.assert_allclose(make_interpolator(x, y, "linear")(points), np.interp(points, x, y))
+
+
+def test_make_interpolator_invalid_input():
+    x = np.linspace(0.0, 1.0, 10)
+    with pytest.raises(ValueError):
+        make_interpolator(x, x, "quintic")
+    with pytest.raises(ValueError):
+        make_interpolator(x[::-1], x, "linear")
+
+
+def test_interpolation_methods_are_allowed_config_values():
+    assert sorted(ALLOWED_VALUES["interpolation_method"]) == sorted(INTERPOLATION_METHODS)
+
+
+def test_interpolate_plot_interpolation_method():
+    # A step is overshot by the cubic spline but not by the shape preserving interpolation
+    x = np.linspace(0.0, 1.0, 11)
+    y = np.where(x < 0.5, 0.0, 1.0)
+
+    _, cubic_y = interpolate_plot(x, y)
+    _, pchip_y = interpolate_plot(x, y, method="pchip")
+    with config_context(interpolation_method="pchip"):
+        _, config_y = interpolate_plot(x, y)
+
+    assert cubic_y.min() < 0.0 and cubic_y.max() > 1.0
+    assert pchip_y.min() >= 0.0 and pchip_y.max() <= 1.0
+    np.testing.assert_allclose(config_y, pchip_y)
+
+
+def test_interpolate_data_interpolation_method(wide_dataframe):
+    points = np.linspace(1.6, 3.4, 7)
+    interpolated = interpolate_data(wide_dataframe, "bondlength_1", points, method="akima")
+
+    expected = make_interpolator(wide_dataframe["bondlength_1"].to_numpy(), wide_dataframe["vdd_7"].to_numpy(), "akima")(points)
+    np.testing.assert_allclose(interpolated["vdd_7"], expected)
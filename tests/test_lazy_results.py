@@ -0,0 +1,69 @@
+import pathlib as pl
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir, get_plot_columns
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dir = example_dir / "ureas_di_O_Cs_all"
+
+
+pytestmark = pytest.mark.usefixtures("initialized_config")
+
+
+@pytest.fixture
+def results_dir_without_dispersion(tmp_path):
+    results_dir = tmp_path / "ureas_di_O_Cs_all"
+    shutil.copytree(example_results_dir, results_dir)
+    results_file = results_dir / "pyfrag_ureas_di_O_Cs_all.txt"
+    df = pd.read_csv(results_file, sep=r"\s+", index_col=0)
+    df["Disp"] = 0.0
+    results_file.write_text(df.reset_index().to_string(index=False))
+    return results_dir
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"trim_option": "min", "trim_key": "EnergyTotal"}, {"trim_option": 20}, {"outlier_threshold": 1.0}])
+def test_lazy_object_equals_eager_object(kwargs):
+    eager = create_pyfrag_object_from_dir(str(example_results_dir), **kwargs)
+    lazy = create_pyfrag_object_from_dir(str(example_results_dir), lazy=True, **kwargs)
+    pd.testing.assert_frame_equal(lazy.materialize(), eager.dataframe)
+
+
+def test_lazy_object_loads_columns_on_demand():
+    obj = create_pyfrag_object_from_dir(str(example_results_dir), lazy=True)
+    eager = create_pyfrag_object_from_dir(str(example_results_dir))
+    assert "Pauli" not in obj.dataframe.columns
+
+    np.testing.assert_array_equal(obj.get_data_of_key("Pauli"), eager.get_data_of_key("Pauli"))
+    np.testing.assert_array_equal(obj.get_x_axis("bondlength_1"), eager.get_x_axis("bondlength_1"))
+    assert "Pauli" in obj.dataframe.columns
+    assert "OI" not in obj.dataframe.columns
+
+
+def test_lazy_object_removed_dispersion(results_dir_without_dispersion):
+    obj = create_pyfrag_object_from_dir(str(results_dir_without_dispersion), lazy=True)
+    with pytest.raises(KeyError):
+        obj.get_data_of_key("Disp")
+    assert "Disp" not in obj.materialize().columns
+
+
+def test_column_projection_equals_eager_object():
+    eager = create_pyfrag_object_from_dir(str(example_results_dir))
+    projected = create_pyfrag_object_from_dir(str(example_results_dir), columns=["Pauli"])
+    assert set(projected.dataframe.columns) == {"bondlength_1", "EnergyTotal", "Pauli"}
+    pd.testing.assert_frame_equal(projected.dataframe, eager.dataframe[projected.dataframe.columns])
+
+
+def test_automatic_column_projection():
+    obj = create_pyfrag_object_from_dir(str(example_results_dir), columns="auto")
+    assert set(get_plot_columns()) >= {"EnergyTotal", "Int", "Elstat", "frag1Strain"}
+    assert set(obj.dataframe.columns) <= set(get_plot_columns()) | {"bondlength_1"}
+    assert "Int" in obj.dataframe.columns
+
+    with pytest.raises(ValueError):
+        create_pyfrag_object_from_dir(str(example_results_dir), columns="all")
+    with pytest.raises(ValueError):
+        get_plot_columns(["population"])
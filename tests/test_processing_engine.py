@@ -0,0 +1,254 @@
+import pathlib as pl
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyfrag_plotter import processing_funcs
+from pyfrag_plotter.errors import PyFragResultsProcessingError
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+from pyfrag_plotter.processing_funcs import (
+    _trim_positions,
+    column_monotonicity,
+    hampel_outliers,
+    process_results_file_fused,
+    process_results_files,
+    remove_dispersion_term,
+    remove_duplicate_x_values_dataframe,
+    remove_outliers,
+    remove_outliers_hampel,
+    trim_data,
+    trim_ranges,
+)
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_file = example_dir / "ureas_di_O_Cs_all" / "pyfrag_ureas_di_O_Cs_all.txt"
+
+TRIM_OPTIONS = ["false", "none", "max", "min", "x_lim", "unknown", 0.5, -3.0, 10, 0, -5, 1000, (1.4, 1.9), [1.0, 1.2], (-10.0, 10.0)]
+
+
+pytestmark = pytest.mark.usefixtures("initialized_config")
+
+
+def _process_chained(df, trim_option, trim_key, outlier_threshold):
+    df = trim_data(df, trim_option, trim_key)
+    df = remove_duplicate_x_values_dataframe(df)
+    df = remove_dispersion_term(df)
+    return remove_outliers(df, outlier_threshold)
+
+
+def _assert_equivalent(df, trim_option, trim_key, outlier_threshold):
+    """Asserts that the fused engine returns the same data, or raises the same error, as the chained processing functions."""
+    try:
+        expected = _process_chained(df, trim_option, trim_key, outlier_threshold)
+    except Exception as e:
+        with pytest.raises(type(e)):
+            process_results_file_fused(df, trim_option, trim_key, outlier_threshold)
+        return
+    pd.testing.assert_frame_equal(process_results_file_fused(df, trim_option, trim_key, outlier_threshold), expected)
+
+
+def _random_results_df(seed: int, n_rows: int, dtype=np.float64) -> pd.DataFrame:
+    """Random results data with duplicate (and NaN) IRC coordinates, outliers and (sometimes) a zero dispersion term."""
+    rng = np.random.default_rng(seed)
+    bondlength = np.round(rng.uniform(1.0, 2.0, n_rows), 1)
+    bondlength[rng.random(n_rows) < 0.05] = np.nan
+    energy = np.cumsum(rng.normal(scale=5.0, size=n_rows))
+    energy[rng.random(n_rows) < 0.1] += rng.choice([-200.0, 200.0])
+    energy[rng.random(n_rows) < 0.02] = np.nan
+    disp = np.zeros(n_rows) if seed % 2 == 0 else rng.normal(size=n_rows)
+    data = {
+        "bondlength_1": bondlength,
+        "EnergyTotal": energy,
+        "Int": rng.normal(size=n_rows),
+        "Disp": disp,
+        "angle_1": np.round(rng.uniform(90.0, 95.0, n_rows), 0),
+    }
+    index = pd.Index(np.arange(1.0, n_rows + 1.0), name="#IRC")
+    return pd.DataFrame(data, index=index).astype(dtype)
+
+
+@pytest.mark.parametrize("trim_option", TRIM_OPTIONS)
+@pytest.mark.parametrize("seed", range(4))
+def test_fused_engine_equals_chained_functions(seed, trim_option):
+    df = _random_results_df(seed, 60)
+    trim_key = "bondlength_1" if isinstance(trim_option, (tuple, list)) or trim_option == "x_lim" else "EnergyTotal"
+    _assert_equivalent(df, trim_option, trim_key, 50.0)
+
+    # Trimming on x-limits requires IRC coordinates without missing values
+    df["bondlength_1"] = df["bondlength_1"].fillna(1.5)
+    _assert_equivalent(df, trim_option, trim_key, 50.0)
+
+
+@pytest.mark.parametrize("outlier_threshold", [None, 0.0, 1.0, 1e6])
+def test_fused_engine_equals_chained_functions_example(outlier_threshold):
+    df = read_results_file(str(example_results_file))
+    pd.testing.assert_frame_equal(process_results_file_fused(df, outlier_threshold=outlier_threshold), _process_chained(df, None, None, outlier_threshold))
+
+
+def test_fused_engine_float32():
+    df = _random_results_df(1, 100, dtype=np.float32)
+    _assert_equivalent(df, "min", "EnergyTotal", 20.0)
+
+
+@pytest.mark.parametrize("index", [np.arange(30.0, 0.0, -1.0), np.repeat(np.arange(1.0, 16.0), 2)])
+def test_fused_engine_irregular_index(index):
+    df = _random_results_df(2, 30)
+    df.index = pd.Index(index, name="#IRC")
+    for trim_option in ["max", 0.0, 5]:
+        _assert_equivalent(df, trim_option, "EnergyTotal", 50.0)
+
+
+def test_fused_engine_without_x_axis_columns():
+    df = _random_results_df(3, 40).drop(columns=["bondlength_1", "angle_1"])
+    _assert_equivalent(df, "false", "EnergyTotal", 50.0)
+
+
+def test_fused_engine_invalid_trim_key():
+    with pytest.raises(PyFragResultsProcessingError):
+        process_results_file_fused(_random_results_df(0, 10), "max", "not_a_column")
+
+
+@pytest.mark.parametrize("trim_option", TRIM_OPTIONS)
+def test_batched_processing_equals_single_processing(trim_option):
+    dfs = [_random_results_df(seed, n_rows) for seed, n_rows in enumerate([60, 3, 1, 25, 120, 60])]
+    for df in dfs:
+        df["bondlength_1"] = df["bondlength_1"].fillna(1.5)
+    # Systems with other IRC coordinates, without a dispersion term or with another data type are processed in separate groups
+    dfs[1] = dfs[1].drop(columns=["angle_1"])
+    dfs[3] = dfs[3].drop(columns=["Disp"])
+    dfs[4] = dfs[4].astype(np.float32)
+    trim_key = "bondlength_1" if isinstance(trim_option, (tuple, list)) or trim_option == "x_lim" else "EnergyTotal"
+
+    try:
+        expected = [process_results_file_fused(df, trim_option, trim_key, 50.0) for df in dfs]
+    except Exception as e:
+        with pytest.raises(type(e)):
+            process_results_files(dfs, trim_option, trim_key, 50.0)
+        return
+
+    for result, expected_df in zip(process_results_files(dfs, trim_option, trim_key, 50.0), expected):
+        pd.testing.assert_frame_equal(result, expected_df)
+
+
+def test_batched_processing_empty_and_irregular_systems():
+    dfs = [_random_results_df(0, 40), _random_results_df(1, 0), _random_results_df(2, 30)]
+    dfs[2].index = pd.Index(np.repeat(np.arange(1.0, 16.0), 2), name="#IRC")
+    for result, df in zip(process_results_files(dfs, "false", "EnergyTotal", 50.0), dfs):
+        pd.testing.assert_frame_equal(result, _process_chained(df, "false", "EnergyTotal", 50.0))
+
+    dfs.pop(1)
+    for result, df in zip(process_results_files(dfs, "max", "EnergyTotal", 50.0), dfs):
+        pd.testing.assert_frame_equal(result, _process_chained(df, "max", "EnergyTotal", 50.0))
+    assert process_results_files([]) == []
+
+
+@pytest.mark.parametrize("values, expected", [([1.0, 2.0, 2.0, 3.0], 1), ([3.0, 2.0, 2.0], -1), ([2.0, 2.0], 1), ([1.0], 1), ([], 0), ([1.0, np.nan, 3.0], 0), ([1.0, 3.0, 2.0], 0)])
+def test_column_monotonicity(values, expected):
+    assert column_monotonicity(np.array(values)) == expected
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("descending", [False, True])
+def test_binary_search_trimming_equals_scan(descending, dtype):
+    """The binary search on monotonic IRC coordinates (with repeated values) selects the same rows as a scan of the column."""
+    bondlength = np.repeat(np.round(np.linspace(1.0, 3.0, 41), 2), np.tile([1, 3, 1, 2], 11)[:41])
+    if descending:
+        bondlength = bondlength[::-1]
+    df = pd.DataFrame({"bondlength_1": bondlength, "EnergyTotal": np.arange(len(bondlength), dtype=float)}).astype(dtype)
+
+    trim_options = ["max", "min", 0.0, 1.0, 1.025, 1.05, 2.0, 2.71, 2.975, 3.0, 10.0, (1.5, 2.5), (1.525, 1.55), (0.0, 1.0), (3.0, 5.0), (0.0, 10.0), (1.51, 1.52)]
+    for trim_option in trim_options:
+        try:
+            expected = np.arange(len(df))[_trim_positions(df, trim_option, "bondlength_1", {"bondlength_1": 0})]
+        except PyFragResultsProcessingError:
+            with pytest.raises(PyFragResultsProcessingError):
+                _trim_positions(df, trim_option, "bondlength_1")
+            continue
+        np.testing.assert_array_equal(np.arange(len(df))[_trim_positions(df, trim_option, "bondlength_1")], expected, err_msg=str(trim_option))
+
+
+def test_binary_search_trimming_caches_monotonicity():
+    df = _random_results_df(0, 50)
+    df["bondlength_1"] = np.linspace(1.0, 3.0, 50)
+    monotonicity = {}
+    trim_data(df, (1.5, 2.5), "bondlength_1", monotonicity=monotonicity)
+    trim_data(df, "max", "EnergyTotal", monotonicity=monotonicity)
+    assert monotonicity == {"bondlength_1": 1}
+
+    # The cached monotonicity is used instead of detected again
+    monotonicity["bondlength_1"] = 0
+    pd.testing.assert_frame_equal(trim_data(df, (1.5, 2.5), "bondlength_1", monotonicity=monotonicity), trim_data(df, (1.5, 2.5), "bondlength_1"))
+
+
+def test_trim_ranges():
+    df = _random_results_df(1, 50).fillna(1.5)
+    df["bondlength_1"] = np.linspace(3.0, 1.0, 50)
+
+    [kept_rows] = trim_ranges(df, (1.5, 2.5), "bondlength_1")
+    pd.testing.assert_frame_equal(df.iloc[kept_rows.start:kept_rows.stop], trim_data(df, (1.5, 2.5), "bondlength_1"))
+    assert trim_ranges(df, 10, "EnergyTotal") == [range(10)]
+    assert trim_ranges(df, "false", "EnergyTotal") == [range(50)]
+
+    # Non-monotonic IRC coordinates are split into consecutive ranges, without repeating the first and last row
+    df["bondlength_1"] = np.tile([1.0, 2.0, 3.0, 2.2, 1.8], 10)
+    ranges = trim_ranges(df, (1.5, 2.5), "bondlength_1")
+    assert [list(kept_rows) for kept_rows in ranges[:3]] == [[1], [3, 4], [6]]
+    np.testing.assert_array_equal(np.concatenate([list(kept_rows) for kept_rows in ranges]), np.flatnonzero(df["bondlength_1"].between(1.5, 2.5)))
+
+
+def _hampel_scores_reference(values: np.ndarray, window: int) -> np.ndarray:
+    """Hampel scores computed window by window, where the edges use the first and last complete window."""
+    half_window = window // 2
+    scores = np.empty(len(values))
+    for i in range(len(values)):
+        center = min(max(i, half_window), len(values) - half_window - 1)
+        window_values = values[center - half_window:center + half_window + 1]
+        median = np.median(window_values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores[i] = np.abs(values[i] - median) / (1.4826 * np.median(np.abs(window_values - median)))
+    return scores
+
+
+@pytest.mark.parametrize("chunk_size", [64, 2048])
+@pytest.mark.parametrize("window", [3, 5, 7, 11])
+def test_hampel_outliers_equals_reference(window, chunk_size, monkeypatch):
+    monkeypatch.setattr(processing_funcs, "_HAMPEL_CHUNK_SIZE", chunk_size)
+    df = _random_results_df(0, 1500).drop(columns=["bondlength_1", "angle_1"]).fillna(0.0)
+    df["Pauli"] = np.sin(np.linspace(0.0, 3.0, len(df)))
+    df.loc[df.index[[10, 1200]], "Pauli"] += 1.0
+
+    outliers, diagnostics = hampel_outliers(df, window=window, threshold=3.0)
+    keys = ["EnergyTotal", "Int", "Pauli", "Disp"]
+    assert list(diagnostics.columns) == keys + ["n_outlier_keys"]
+    for key in keys:
+        np.testing.assert_allclose(diagnostics[key].to_numpy(), _hampel_scores_reference(df[key].to_numpy(), window))
+
+    expected = (diagnostics[keys] > 3.0).to_numpy()
+    np.testing.assert_array_equal(diagnostics["n_outlier_keys"].to_numpy(), expected.sum(axis=1))
+    np.testing.assert_array_equal(outliers, expected.any(axis=1))
+    assert outliers[[10, 1200]].all()
+
+
+def test_hampel_outliers_short_and_missing_data():
+    df = pd.DataFrame({"EnergyTotal": [0.0, 1.0, 50.0, 3.0], "Int": [1.0, np.nan, 1.0, 1.0]})
+    outliers, diagnostics = hampel_outliers(df, window=7, threshold=3.0)
+    np.testing.assert_array_equal(outliers, [False, False, True, False])
+    assert diagnostics["Int"].isna().all()
+
+    assert len(remove_outliers_hampel(df.iloc[:0])) == 0
+    pd.testing.assert_frame_equal(remove_outliers_hampel(df, window=3, threshold=3.0), df[~hampel_outliers(df, window=3, threshold=3.0)[0]])
+
+
+@pytest.mark.parametrize("window", [2, 1, 8])
+def test_hampel_outliers_invalid_window(window):
+    with pytest.raises(PyFragResultsProcessingError):
+        hampel_outliers(_random_results_df(0, 10), window=window)
+
+
+def test_hampel_outliers_config_defaults():
+    df = _random_results_df(1, 100).drop(columns=["bondlength_1", "angle_1"])
+    outliers, diagnostics = hampel_outliers(df)
+    expected_outliers, expected_diagnostics = hampel_outliers(df, window=7, threshold=3.0)
+    np.testing.assert_array_equal(outliers, expected_outliers)
+    pd.testing.assert_frame_equal(diagnostics, expected_diagnostics)
@@ -113,3 +113,33 @@ def test_read_irrep_line():
     line = "  irrepOI        AA #Hello"
     expected_output = ["AA"]
     assert input_reader._read_irrep_line(line) == expected_output
+
+
+def _write_inputfile(path, pyfrag_section: str) -> str:
+    path.write_text(f"JOBSUB\n#SBATCH -N 1\nJOBSUB END\n\nPyFrag\n{pyfrag_section}\nPyFrag END\n\nAMS\nTask SinglePoint\nAMS END\n")
+    return str(path)
+
+
+def test_read_inputfile(tmp_path):
+    section = "name ureas\nircpath /scratch/angle_scan/vdd/ureas.xyz\nbondlength 8 16 4.76\nbondlength 1 2\nirrepOI AA\nvdd 1 2 # comment\noverlap frag1 HOMO frag2 LUMO"
+    inputfile = _write_inputfile(tmp_path / "ureas.in", section)
+    assert input_reader.read_inputfile(inputfile) == {
+        "name": "ureas",
+        "bondlength_1": (8, 16, 4.76),
+        "bondlength_2": (1, 2, 0.0),
+        "irrep_1": ["AA"],
+        "vdd_1": [1, 2],
+        "overlap_1": ("frag1", "HOMO", "frag2", "LUMO"),
+    }
+
+
+def test_read_inputfile_name_from_directory(tmp_path):
+    inputfile = _write_inputfile(tmp_path / "ureas.in", "angle 1 2 120.0")
+    assert input_reader.read_inputfile(inputfile) == {"angle_1": (1, 2, 120.0), "name": tmp_path.name}
+
+
+def test_read_inputfile_missing_section(tmp_path):
+    inputfile = tmp_path / "ureas.in"
+    inputfile.write_text("PyFrag\nbondlength 1 2\n")
+    with pytest.raises(ValueError):
+        input_reader.read_inputfile(str(inputfile))
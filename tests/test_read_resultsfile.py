@@ -0,0 +1,87 @@
+import pathlib as pl
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyfrag_plotter.errors import PyFragResultsProcessingError
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+
+current_dir = pl.Path(__file__).resolve().parent
+example_results_file = current_dir.parent / "example" / "ureas_di_O_Cs_all" / "pyfrag_ureas_di_O_Cs_all.txt"
+
+
+def _write_results_file(path: pl.Path, content: str) -> str:
+    path.write_text(content)
+    return str(path)
+
+
+def test_read_results_file_matches_pandas():
+    expected = pd.read_csv(example_results_file, header=0, sep=r"\s+", dtype=float, index_col=0).rename(columns={"bondlength": "bondlength_1"})
+    result = read_results_file(str(example_results_file))
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_read_results_file_renames_single_coordinates(tmp_path):
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength angle EnergyTotal\n1 1.0 90.0 -1.0\n2 1.1 91.0 -2.0\n")
+    result = read_results_file(path)
+    assert list(result.columns) == ["bondlength_1", "angle_1", "EnergyTotal"]
+
+
+def test_read_results_file_keeps_indexed_coordinates(tmp_path):
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength_1 bondlength_2 EnergyTotal\n1 1.0 2.0 -1.0\n")
+    result = read_results_file(path)
+    assert list(result.columns) == ["bondlength_1", "bondlength_2", "EnergyTotal"]
+
+
+def test_read_results_file_float32(tmp_path):
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength EnergyTotal\n1 1.0 -1.0\n2 1.1 -2.0\n")
+    result = read_results_file(path, dtype=np.float32)
+    assert all(dtype == np.float32 for dtype in result.dtypes)
+    assert result["EnergyTotal"].tolist() == [-1.0, -2.0]
+
+
+def test_read_results_file_incomplete_last_row(tmp_path):
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength EnergyTotal\n1 1.0 -1.0\n2 1.1\n")
+    result = read_results_file(path)
+    assert len(result) == 2
+    assert np.isnan(result["EnergyTotal"].iloc[-1])
+
+
+def test_read_results_file_too_many_values(tmp_path):
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength EnergyTotal\n1 1.0 -1.0 5.0 6.0\n")
+    with pytest.raises(PyFragResultsProcessingError):
+        read_results_file(path)
+
+
+def test_read_results_file_ragged_rows(tmp_path):
+    # The total number of values fits the header, but the rows do not
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength EnergyTotal\n1 2\n3 4 5 6\n7 8 9\n")
+    with pytest.raises(PyFragResultsProcessingError):
+        read_results_file(path)
+
+
+def test_read_results_file_ragged_rows(tmp_path):
+    # The total number of values fits the header, but the rows do not
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength EnergyTotal\n1 2\n3 4 5 6\n7 8 9\n")
+    with pytest.raises(PyFragResultsProcessingError):
+        read_results_file(path)
+
+
+def test_read_results_file_header_only(tmp_path):
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength EnergyTotal\n")
+    result = read_results_file(path)
+    assert result.empty
+    assert list(result.columns) == ["bondlength_1", "EnergyTotal"]
+
+
+def test_read_results_file_column_projection():
+    full = read_results_file(str(example_results_file))
+    result = read_results_file(str(example_results_file), columns=["Int", "bondlength_*", "EnergyTotal", "not_a_column"])
+    pd.testing.assert_frame_equal(result, full[["bondlength_1", "EnergyTotal", "Int"]])
+
+
+def test_read_results_file_column_projection_incomplete_last_row(tmp_path):
+    path = _write_results_file(tmp_path / "pyfrag_test.txt", "#IRC bondlength EnergyTotal Int\n1 1.0 -1.0 -3.0\n2 1.1 -2.0\n")
+    result = read_results_file(path, columns=["EnergyTotal", "Int"])
+    assert result["EnergyTotal"].tolist() == [-1.0, -2.0]
+    assert np.isnan(result["Int"].iloc[-1])
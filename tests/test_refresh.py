@@ -0,0 +1,192 @@
+import gzip
+import pathlib as pl
+
+import pandas as pd
+import pytest
+from pyfrag_plotter import lazy_results
+from pyfrag_plotter.errors import PyFragResultsObjectError
+from pyfrag_plotter.input import read_resultsfile
+from pyfrag_plotter.input.read_resultsfile import IncrementalResultsReader, read_results_file
+from pyfrag_plotter.pyfrag_object import create_pyfrag_object_from_dir, create_pyfrag_object_from_processed_files
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dir = example_dir / "ureas_di_O_Cs_all"
+example_results_file = example_results_dir / "pyfrag_ureas_di_O_Cs_all.txt"
+example_input_file = example_results_dir / "ureas_di_O_Cs_all.in"
+
+
+pytestmark = pytest.mark.usefixtures("initialized_config")
+
+
+@pytest.fixture
+def running_job(tmp_path):
+    """A job directory of which the results file contains the header, the first 10 rows and half of the 11th row."""
+    lines = example_results_file.read_text().splitlines(keepends=True)
+    job_dir = tmp_path / "running_job"
+    job_dir.mkdir()
+    (job_dir / example_input_file.name).write_text(example_input_file.read_text())
+    results_file = job_dir / example_results_file.name
+    results_file.write_text("".join(lines[:11]) + lines[11][:20])
+    return job_dir, results_file, lines
+
+
+def _append(path: pl.Path, text: str) -> None:
+    with open(path, "a") as f:
+        f.write(text)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_refresh_reads_appended_rows(running_job, lazy):
+    job_dir, results_file, lines = running_job
+    obj = create_pyfrag_object_from_dir(str(job_dir), lazy=lazy, columns=["Int"])
+    obj.get_data_of_key("Int")
+    # The row that is still being written is skipped by the lazy table, while `read_results_file` pads it with NaN values
+    n_read_rows = obj.source.n_rows
+    assert n_read_rows == (10 if lazy else 11)
+
+    _append(results_file, lines[11][20:] + "".join(lines[12:]))
+    assert obj.refresh() == len(lines) - 1 - n_read_rows
+    assert obj.refresh() == 0
+
+    expected = create_pyfrag_object_from_dir(str(example_results_dir), columns=["Int"]).dataframe
+    pd.testing.assert_frame_equal(obj.dataframe[expected.columns], expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_refresh_only_parses_appended_rows(running_job, lazy, monkeypatch):
+    job_dir, results_file, lines = running_job
+    obj = create_pyfrag_object_from_dir(str(job_dir), lazy=lazy, columns=["Int"])
+    obj.get_data_of_key("Int")
+    # The first refresh parses the whole file, after which the unprocessed rows are kept
+    obj.refresh()
+    previous_data = obj.dataframe
+
+    parsed_rows = []
+    parse_numeric_chunk = read_resultsfile._parse_numeric_chunk
+
+    def counting_parse_numeric_chunk(body, n_columns, column_indices, dtype):
+        block = parse_numeric_chunk(body, n_columns, column_indices, dtype)
+        parsed_rows.append(len(block))
+        return block
+
+    def failing_read_results_columns(*args, **kwargs):
+        raise AssertionError("The loaded columns should not be read again")
+
+    monkeypatch.setattr(read_resultsfile, "_parse_numeric_chunk", counting_parse_numeric_chunk)
+    monkeypatch.setattr(lazy_results, "_read_results_columns", failing_read_results_columns)
+
+    _append(results_file, lines[11][20:] + "".join(lines[12:]))
+    obj.refresh()
+    assert sum(parsed_rows) == len(lines) - 1 - 10
+    pd.testing.assert_frame_equal(obj.dataframe.iloc[:len(previous_data)], previous_data)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("trim_option", ["max", "min"])
+def test_refresh_trimmed_at_extreme_value(running_job, lazy, trim_option):
+    # Trimming at the maximum or minimum of the energy keeps more rows when the extreme value moves to an appended row
+    job_dir, results_file, lines = running_job
+    kwargs = {"columns": ["Int"], "trim_option": trim_option, "trim_key": "EnergyTotal"}
+    obj = create_pyfrag_object_from_dir(str(job_dir), lazy=lazy, **kwargs)
+    obj.get_data_of_key("Int")
+
+    for start, stop in [(11, 20), (20, 35), (35, len(lines))]:
+        _append(results_file, lines[start][20:] + "".join(lines[start + 1:stop]) + (lines[stop][:20] if stop < len(lines) else ""))
+        obj.refresh()
+        expected = create_pyfrag_object_from_dir(str(job_dir), **kwargs).dataframe
+        pd.testing.assert_frame_equal(obj.dataframe[expected.columns], expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_refresh_processes_all_rows_when_kept_rows_change(running_job, lazy):
+    # An appended row with the same bond length as a kept row replaces that row, since the last occurrence of duplicate IRC coordinates is kept
+    job_dir, results_file, lines = running_job
+    obj = create_pyfrag_object_from_dir(str(job_dir), lazy=lazy, columns=["Int"])
+    obj.get_data_of_key("Int")
+
+    _append(results_file, lines[11][20:] + lines[8])
+    obj.refresh()
+    expected = create_pyfrag_object_from_dir(str(job_dir), columns=["Int"]).dataframe
+    pd.testing.assert_frame_equal(obj.dataframe[expected.columns], expected)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_reader_is_created_on_first_refresh(running_job, lazy):
+    job_dir, _, _ = running_job
+    obj = create_pyfrag_object_from_dir(str(job_dir), lazy=lazy)
+    assert obj.source.reader is None and (obj.lazy_table is None or obj.lazy_table.reader is None)
+
+    obj.refresh()
+    assert (obj.source.reader if obj.lazy_table is None else obj.lazy_table.reader) is not None
+
+
+def test_refresh_checks_monotonicity_of_appended_rows(running_job):
+    job_dir, results_file, lines = running_job
+    obj = create_pyfrag_object_from_dir(str(job_dir))
+    assert obj.source.monotonicity == {"bondlength_1": 1}
+
+    _append(results_file, lines[11][20:] + "".join(lines[12:]))
+    obj.refresh()
+    assert obj.source.monotonicity == {"bondlength_1": 1}
+
+    # A row with a shorter bond length makes the IRC coordinate non-monotonic
+    _append(results_file, lines[1])
+    obj.refresh()
+    assert obj.source.monotonicity == {"bondlength_1": 0}
+
+
+def test_incremental_reader_keeps_incomplete_rows(running_job):
+    _, results_file, lines = running_job
+    reader = IncrementalResultsReader(str(results_file))
+    assert reader.read() == 10
+
+    _append(results_file, lines[11][20:])
+    assert reader.read() == 1
+    _append(results_file, "".join(lines[12:]))
+    assert reader.read() == len(lines) - 1 - 11
+    pd.testing.assert_frame_equal(reader.data, read_results_file(str(example_results_file)))
+
+
+def test_incremental_reader_rewritten_file(running_job):
+    _, results_file, lines = running_job
+    reader = IncrementalResultsReader(str(results_file))
+    reader.read()
+
+    results_file.write_text("".join(lines[:4]))
+    assert reader.read() == 3
+    assert reader.n_rows == 3
+
+
+def test_incremental_reader_rewritten_file_of_larger_size(running_job, tmp_path):
+    # The restarted job has written more rows than were read, but the rows differ from the rows that were read
+    _, results_file, lines = running_job
+    reader = IncrementalResultsReader(str(results_file))
+    reader.read()
+
+    rewritten = [lines[0]] + lines[2:14]
+    results_file.write_text("".join(rewritten))
+    assert reader.read() == 12
+    expected_file = tmp_path / "expected.txt"
+    expected_file.write_text("".join(rewritten))
+    pd.testing.assert_frame_equal(reader.data, read_results_file(str(expected_file)))
+
+
+def test_incremental_reader_rewritten_compressed_file(running_job):
+    _, _, lines = running_job
+    results_file = running_job[1].with_suffix(".txt.gz")
+    with gzip.open(results_file, "wt") as f:
+        f.write("".join(lines[:11]))
+    reader = IncrementalResultsReader(str(results_file))
+    assert reader.read() == 10
+
+    with gzip.open(results_file, "wt") as f:
+        f.write("".join([lines[0]] + lines[2:14]))
+    assert reader.read() == 12
+    assert reader.n_rows == 12
+
+
+def test_refresh_without_results_file():
+    obj = create_pyfrag_object_from_processed_files(read_results_file(str(example_results_file)), {"name": "test"})
+    with pytest.raises(PyFragResultsObjectError):
+        obj.refresh()
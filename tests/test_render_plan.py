@@ -0,0 +1,96 @@
+import pathlib as pl
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyfrag_plotter.config.context import config_context
+from pyfrag_plotter.interpolate import interpolate_plot, make_interpolator
+from pyfrag_plotter.plot.plot_details import _import_pyplot
+from pyfrag_plotter.plot.plotter import Plotter
+from pyfrag_plotter.pyfrag_object import PyFragResultsObject, create_pyfrag_object_from_dir
+
+current_dir = pl.Path(__file__).resolve().parent
+example_dir = current_dir.parent / "example"
+example_results_dirs = [str(example_dir / name) for name in ["ureas_di_O_Cs_all", "ureas_di_O_Cs_pi", "ureas_di_O_Cs_sigma"]]
+
+
+pytestmark = pytest.mark.usefixtures("headless_config")
+
+
+@pytest.fixture
+def plotter(tmp_path):
+    objs = [create_pyfrag_object_from_dir(results_dir) for results_dir in example_results_dirs]
+    with Plotter(name="plots", plot_dir=str(tmp_path), pyfrag_objects=objs, irc_coord=("bondlength_1", "r - r$_{eq}$ / Å")) as plotter:
+        yield plotter
+    _import_pyplot().close("all")
+
+
+def test_render_plan_curves(plotter):
+    keys = ["EnergyTotal", "Int"]
+    plan = plotter.build_render_plan(keys)
+
+    assert len(plan.curves) == len(keys) * len(plotter.objects)
+    assert [curve.label for curve in plan.curves] == [obj.name for obj in plotter.objects] + [None] * len(plotter.objects)
+    assert len(plan.peaks) == len(plotter.objects)
+    for curve, (key, obj) in zip(plan.curves, [(key, obj) for key in keys for obj in plotter.objects]):
+        x, y = interpolate_plot(obj.get_x_axis("bondlength_1"), obj.get_data_of_key(key))
+        np.testing.assert_allclose(curve.x, x)
+        np.testing.assert_allclose(curve.y, y)
+
+
+def test_plot_draws_prepared_curves(plotter):
+    plan = plotter.build_render_plan(["EnergyTotal", "Int", "StrainTotal"])
+    _, ax = plotter.plot_asm()
+
+    assert len(ax.lines) == len(plan.curves)
+    for line, curve in zip(ax.lines, plan.curves):
+        np.testing.assert_allclose(line.get_xdata(), curve.x)
+        np.testing.assert_allclose(line.get_ydata(), curve.y)
+
+
+def test_prepared_curves_are_reused(plotter):
+    plotter.plot_asm()
+    int_curve = plotter.prepare_curve(0, "Int")
+    plotter.plot_eda(["Int"])
+
+    # The same curve is shown in the ASM and EDA plots
+    assert plotter.prepare_curve(0, "Int")[1] is int_curve[1]
+
+    # The curves are prepared again if the interpolation options change
+    with config_context(n_interpolation_points=17):
+        assert len(plotter.prepare_curve(0, "Int")[0]) == 17
+
+
+@pytest.mark.parametrize("method", ["pchip", "akima", "smoothing"])
+def test_peak_markers_lie_on_the_lines(plotter, method):
+    with config_context(interpolation_method=method):
+        plan = plotter.build_render_plan(["EnergyTotal", "Int"])
+
+    for (x, y, _), obj in zip(plan.peaks, plotter.objects):
+        interpolator = make_interpolator(obj.get_x_axis("bondlength_1"), obj.get_data_of_key("EnergyTotal"), method)
+        np.testing.assert_allclose(y, interpolator(x))
+
+
+@pytest.mark.parametrize("method", ["cubic", "pchip"])
+def test_peak_markers_at_global_extreme(tmp_path, method):
+    # A local minimum at 1.3, while the energy keeps decreasing after 1.6 to below that minimum at the end of the IRC
+    x = np.linspace(1.0, 2.0, 30)
+    energy = 5.0 * (x - 1.3) ** 2 - 60.0 * np.clip(x - 1.6, 0.0, None) ** 2
+    obj = PyFragResultsObject(name="system", dataframe=pd.DataFrame({"bondlength_1": x, "EnergyTotal": energy}))
+
+    with config_context(interpolation_method=method, stat_point_type="min", x_lim=[1.0, 2.0], y_lim=[-10.0, 10.0]):
+        with Plotter(name="plots", plot_dir=str(tmp_path), pyfrag_objects=[obj], irc_coord=("bondlength_1", "r")) as plotter:
+            plan = plotter.build_render_plan(["EnergyTotal"])
+
+    assert plan.peaks[0][:2] == (x[energy.argmin()], energy.min())
+    assert plan.peaks[0][0] == pytest.approx(2.0)
+
+
+def test_peak_markers_with_linear_interpolation(plotter):
+    with config_context(interpolation_method="linear"):
+        plan = plotter.build_render_plan(["EnergyTotal", "Int"])
+
+    # The peaks of the straight lines are at the computed points
+    for (x, y, _), obj in zip(plan.peaks, plotter.objects):
+        peak_index = obj.get_peak_index(peak=plotter.plot_info.peak_type)
+        assert (x, y) == (obj.get_x_axis("bondlength_1")[peak_index], obj.get_data_of_key("EnergyTotal")[peak_index])
@@ -0,0 +1,54 @@
+import pathlib as pl
+
+import pytest
+from pyfrag_plotter.input.read_resultsfile import read_results_file
+from pyfrag_plotter.input.schema import read_results_schema, scan_results_schema
+
+current_dir = pl.Path(__file__).resolve().parent
+example_results_file = current_dir.parent / "example" / "ureas_di_O_Cs_all" / "pyfrag_ureas_di_O_Cs_all.txt"
+
+
+def test_read_results_schema_matches_data():
+    schema = read_results_schema(str(example_results_file))
+    df = read_results_file(str(example_results_file))
+    assert schema["n_rows"] == len(df)
+    assert schema["columns"] == tuple(df.columns)
+    assert schema["has_Disp"] and schema["has_frag1Strain"]
+    assert schema["n_bondlength"] == 1
+    assert schema["n_vdd"] == 0
+
+
+@pytest.mark.parametrize(
+    "body, n_rows",
+    [
+        ("", 0),
+        ("1 1.0 -1.0\n2 1.1 -2.0\n", 2),
+        ("1 1.0 -1.0\n2 1.1 -2.0", 2),
+        ("1 1.0 -1.0\n2 1.1 -2.0\n\n\n", 2),
+        ("1 1.0 -1.0\r\n2 1.1 -2.0\r\n", 2),
+    ],
+)
+def test_read_results_schema_counts_rows(tmp_path, body, n_rows):
+    path = tmp_path / "pyfrag_test.txt"
+    path.write_bytes(b"#IRC bondlength EnergyTotal\n" + body.encode())
+    assert read_results_schema(str(path))["n_rows"] == n_rows
+
+
+def test_scan_results_schema_campaign(tmp_path):
+    header = "#IRC bondlength_1 EnergyTotal Disp vdd_1 vdd_2 overlap_1\n"
+    for i in range(3):
+        job_dir = tmp_path / "campaign" / f"job_{i}"
+        job_dir.mkdir(parents=True)
+        (job_dir / f"job_{i}.in").write_text("PyFrag\nPyFrag END\n")
+        (job_dir / f"pyfrag_job_{i}.txt").write_text(header + "1 1.0 -1.0 0.0 0.1 0.2 0.3\n" * (i + 1))
+
+    catalog = scan_results_schema(str(tmp_path / "campaign"))
+    assert catalog["n_rows"].tolist() == [1, 2, 3]
+    assert catalog["n_vdd"].tolist() == [2, 2, 2]
+    assert catalog["n_overlap"].tolist() == [1, 1, 1]
+    assert catalog["has_Disp"].all() and not catalog["has_frag1Strain"].any()
+
+
+def test_scan_results_schema_skips_missing_files(tmp_path):
+    catalog = scan_results_schema([str(example_results_file), str(tmp_path / "pyfrag_missing.txt")])
+    assert len(catalog) == 1
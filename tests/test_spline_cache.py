@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pyfrag_plotter.errors import PyFragInterpolationError
+from pyfrag_plotter.interpolate import SplineCache, find_stationary_points, interpolate_plot, spline_cache
+from pyfrag_plotter.pyfrag_object import PyFragResultsObject
+from scipy.interpolate import make_interp_spline
+
+
+@pytest.fixture(autouse=True)
+def cleared_spline_cache(initialized_config):
+    spline_cache.clear()
+
+
+def _lines(n_lines: int, n_points: int = 20):
+    rng = np.random.default_rng(3)
+    x = np.linspace(0.0, 2.0, n_points)
+    return [(x, rng.normal(size=n_points)) for _ in range(n_lines)]
+
+
+def test_spline_cache_hits_and_misses():
+    cache = SplineCache()
+    (x, y), (_, other_y) = _lines(2)
+
+    first = cache.get_spline(x, y)
+    assert cache.get_spline(x.copy(), y.copy()) is first
+    cache.get_spline(x, other_y)
+    cache.get_spline(x, y, k=1)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 3)
+
+
+def test_spline_cache_matches_fitted_spline():
+    x, y = _lines(1)[0]
+    x_new = np.linspace(0.0, 2.0, 200)
+
+    np.testing.assert_allclose(SplineCache().get_spline(x, y)(x_new), make_interp_spline(x, y, k=3)(x_new))
+
+
+def test_spline_cache_evicts_least_recently_used():
+    lines = _lines(3)
+    spline = make_interp_spline(*lines[0], k=3)
+    cache = SplineCache(max_size=2 * (spline.t.nbytes + spline.c.nbytes))
+
+    cache.get_spline(*lines[0])
+    cache.get_spline(*lines[1])
+    cache.get_spline(*lines[0])  # lines[1] becomes the least recently used spline
+    cache.get_spline(*lines[2])
+
+    assert len(cache) == 2
+    assert cache.size <= cache.max_size
+    cache.get_spline(*lines[0])
+    assert cache.hits == 2
+    cache.get_spline(*lines[1])
+    assert cache.misses == 4
+
+
+def test_cubic_interpolator_shares_the_spline():
+    cache = SplineCache()
+    x, y = _lines(1)[0]
+
+    assert cache.get_interpolator(x, y, "cubic") is cache.get_spline(x, y, k=3)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_stationary_points_reuse_the_spline_of_the_line():
+    x = np.linspace(1.0, 3.0, 21)
+    energy = -3.0 * (x - 2.03) ** 2
+    obj = PyFragResultsObject(name="system", dataframe=pd.DataFrame({"bondlength_1": x, "EnergyTotal": energy}))
+    interpolate_plot(x, energy, method="cubic")
+
+    find_stationary_points([obj], "bondlength_1")
+    assert (spline_cache.hits, spline_cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("method", ["linear", "pchip"])
+def test_cached_interpolator_does_not_change_with_the_data(method):
+    cache = SplineCache()
+    x, y = _lines(1)[0]
+    x_new = np.linspace(0.0, 2.0, 50)
+    expected = cache.get_interpolator(x, y, method)(x_new)
+
+    y[:] = 0.0
+    np.testing.assert_allclose(cache.get_interpolator(x, _lines(1)[0][1], method)(x_new), expected)
+
+
+def test_spline_cache_disabled():
+    cache = SplineCache(max_size=0)
+    x, y = _lines(1)[0]
+    cache.get_spline(x, y)
+    cache.get_spline(x, y)
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 0)
+
+
+def test_interpolate_plot_fits_each_line_once():
+    # A report of 8 plots that show the same lines
+    lines = _lines(50)
+    for _ in range(8):
+        for x, y in lines:
+            interpolate_plot(x, y)
+
+    assert spline_cache.misses == len(lines)
+    assert spline_cache.hits == 7 * len(lines)
+
+
+def test_interpolate_plot_not_increasing():
+    x = np.array([0.0, 1.0, 1.0, 2.0])
+    with pytest.raises(PyFragInterpolationError):
+        interpolate_plot(x, x**2)